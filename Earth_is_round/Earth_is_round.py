@@ -2,18 +2,210 @@ from tkinter import *
 import time
 import random
 import math
-import pygame
-pygame.mixer.init() # [System] Audio Mixer Initialization
+import threading
+import queue
+import base64
+import struct
+import os
+import json
+import hashlib
+import itertools
+import gc
+import sys
+from array import array
+from bisect import bisect_left
+try: import pygame # [Optional] 사운드 (헤드리스 실행 시 없어도 동작)
+except ImportError: pygame = None
+try: import numpy as np # [Optional] 총알 일괄 연산 가속 (없으면 순수 Python 경로 사용)
+except ImportError: np = None
+if pygame:
+    try: pygame.mixer.init() # [System] Audio Mixer Initialization
+    except pygame.error: pygame = None # 오디오 장치 없음: 무음으로 실행
+
+
+# =============================================================================
+# [Config] Game Loop Timing
+# - 시뮬레이션은 고정 틱(TICK_RATE)으로 실행, 렌더링은 Tk가 허용하는 만큼 실행
+# - 틱 사이의 렌더 프레임은 직전/현재 틱 상태를 보간하여 표시
+# =============================================================================
+TICK_RATE = 30                  # Simulation ticks per second (기존 33ms 프레임과 동일한 게임 속도)
+TICK_DT = 1.0 / TICK_RATE
+MAX_FRAME_SKIP = 5              # 렌더 프레임 1회당 최대 시뮬레이션 틱 수 (초과분은 버림)
+STATIC_FRAME_MS = 33            # 시뮬레이션이 없는 씬(대화, 메뉴)의 프레임 간격
+
+def lerp(a, b, t): return a + (b - a) * t
+
+# [Config] Bullet Collision Mode
+# - "swept": 틱당 이동 경로 전체를 한 번에 계산 (기본값)
+# - "step" : 기존 20단계 분할 이동 방식 (A/B 비교용)
+BULLET_COLLISION = "swept"
+BULLET_SUBSTEPS = 20
+
+# [Config] Enemy Batch Update
+# - NumPy 사용 가능 + 적이 이 수 이상이면 일반 몹/데이터를 배열 단위로 일괄 처리 (적으면 객체별 처리가 더 빠름)
+ENEMY_BATCH_MIN = 24
+
+# [Config] Scene Residency
+# - 씬은 첫 진입 시 생성, 다음 씬은 전환 직후 여유 시간에 미리 생성
+MAX_RESIDENT_SCENES = 5         # 동시에 유지할 최대 씬 수 (메뉴/게임오버 포함)
+PREFETCH_DELAY_MS = 200         # 전환(페이드) 이후 다음 씬 미리 생성까지의 지연
+
+# [Config] Replay
+# - 스테이지 입력 기록은 항상 수행 (F9: 현재 기록 저장), AUTOSAVE 시 스테이지 종료마다 자동 저장
+REPLAY_DIR = "replays"
+REPLAY_AUTOSAVE = False
+
+
+# =============================================================================
+# [System] Game Clock
+# - 게임 시각을 한 곳에서 관리 (엔티티/타이머마다 time.time()을 따로 호출하지 않음)
+# - step(): 시뮬레이션 1틱 진행 (고정 간격), frame(): 메인 루프가 실제 경과 시간을 조회하는 유일한 지점
+# - pause: 일시정지 동안 흐른 실제 시간은 버림 -> 재개 직후 쿨다운이 한꺼번에 풀리지 않음
+# - scale: 실제 시간 대비 진행 배율 (0.5 = 슬로모션, 2.0 = 빨리감기), 틱 간격은 그대로이고 틱 빈도만 변화
+# - frozen: 실제 시간을 읽지 않고 step()으로만 진행 (스테이지 월드, 헤드리스/리플레이)
+# =============================================================================
+CLOCK_SCALES = (1.0, 0.5, 0.25, 2.0)   # F6 순환 (디버그)
+
+class GameClock:
+    def __init__(self, dt=TICK_DT, frozen=False, source=time.perf_counter):
+        self.dt = dt; self.frozen = frozen; self.source = source
+        self.ticks = 0; self.time = 0.0    # 게임 시각(초) = ticks * dt
+        self.scale = 1.0; self.paused = False
+        self.last_real = None
+
+    def step(self):
+        """1틱 진행 후 게임 시각 반환 (누적 덧셈 대신 곱으로 계산 -> 같은 틱이면 항상 같은 값)"""
+        self.ticks += 1; self.time = self.ticks * self.dt
+        return self.time
+
+    def frame(self):
+        """직전 호출 이후 진행할 게임 시간(초) = 실제 경과 x scale (일시정지/frozen이면 0)"""
+        if self.frozen: return 0.0
+        real = self.source()
+        elapsed = 0.0 if self.last_real is None or self.paused else (real - self.last_real) * self.scale
+        self.last_real = real
+        return elapsed
+
+    def at(self, alpha):
+        """렌더 보간 시각: 직전 틱(alpha=0) ~ 현재 틱(alpha=1)"""
+        return self.time - (1.0 - alpha) * self.dt
+
+    def pause(self): self.paused = True
+    def resume(self): self.paused = False
+    def toggle_pause(self): self.paused = not self.paused; return self.paused
+    def set_scale(self, scale): self.scale = max(0.0, scale)
+
+    def __repr__(self):
+        return f"GameClock(t={self.time:.2f}, ticks={self.ticks}, scale={self.scale}, paused={self.paused})"
+
+
+# =============================================================================
+# [Debug] Frame Profiler
+# - 서브시스템별 소요 시간 계측: t = profiler.begin() ... t = profiler.lap("이름", t)
+# - 꺼져 있으면 begin/lap은 시각을 읽지 않고 0 반환 (계측 지점의 비용 최소화)
+# - overlay(F3): 0.5초 구간 평균 FPS와 프레임당 서브시스템별 ms를 캔버스에 표시
+# - recording(F4): Chrome Trace 형식(chrome://tracing, Perfetto)으로 구간 기록 후 JSON 저장
+# - 이름의 '.'은 계층 표시 (tick > tick.enemies), 오버레이는 이름순으로 정렬하여 부모 아래 자식 표시
+# =============================================================================
+PROFILE_WINDOW = 0.5            # 오버레이 통계 갱신 주기(초)
+PROFILE_TRACE_LIMIT = 500000    # 기록할 최대 이벤트 수 (초과 시 자동 중지)
+PROFILE_DIR = "profiles"
+
+class FrameProfiler:
+    def __init__(self):
+        self.enabled = False; self.overlay = False; self.recording = False
+        self.totals = {}                # 이름 -> 현재 구간 누적 ns
+        self.frames = 0; self.window_start = time.perf_counter()
+        self.fps = 0.0; self.text = ""  # 마지막 구간 요약 (오버레이 표시용)
+        self.trace = []; self.origin = 0
+
+    def update_enabled(self): self.enabled = self.overlay or self.recording
+
+    def begin(self):
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def lap(self, name, start):
+        """start부터 지금까지를 name 구간으로 기록하고, 다음 구간의 시작 시각 반환"""
+        if not self.enabled: return 0
+        end = time.perf_counter_ns()
+        self.totals[name] = self.totals.get(name, 0) + end - start
+        if self.recording:
+            self.trace.append((name, start, end))
+            if len(self.trace) >= PROFILE_TRACE_LIMIT: print(f"[Profiler] Trace limit reached: {self.stop_trace()}")
+        return end
+
+    def frame(self):
+        """렌더 프레임 1회 종료 - PROFILE_WINDOW마다 통계를 요약 문자열로 갱신"""
+        if not self.enabled: return
+        self.frames += 1
+        now = time.perf_counter(); elapsed = now - self.window_start
+        if elapsed < PROFILE_WINDOW: return
+        self.fps = self.frames / elapsed
+        lines = [f"FPS {self.fps:5.1f}"]
+        for name in sorted(self.totals):
+            indent = "  " * name.count(".")
+            lines.append(f"{indent}{name.rsplit('.', 1)[-1]:<{12 - len(indent)}}{self.totals[name] / self.frames / 1e6:6.2f} ms")
+        self.text = "\n".join(lines)
+        self.totals = {}; self.frames = 0; self.window_start = now
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay; self.update_enabled()
+        self.totals = {}; self.frames = 0; self.window_start = time.perf_counter(); self.text = "FPS   ..."
+        return self.overlay
+
+    def start_trace(self):
+        self.trace = []; self.origin = time.perf_counter_ns()
+        self.recording = True; self.update_enabled()
+
+    def stop_trace(self, path=None):
+        """기록 종료 후 Chrome Trace JSON 저장, 경로 반환"""
+        self.recording = False; self.update_enabled()
+        if path is None: path = os.path.join(PROFILE_DIR, f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        if os.path.dirname(path): os.makedirs(os.path.dirname(path), exist_ok=True)
+        events = [{"name": name, "cat": name.split(".", 1)[0], "ph": "X", "pid": 1, "tid": 1,
+                   "ts": (start - self.origin) / 1000, "dur": (end - start) / 1000} for name, start, end in self.trace]
+        with open(path, "w", encoding="utf-8") as f: json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        self.trace = []
+        return path
+
+    def toggle_trace(self):
+        if self.recording: return self.stop_trace()
+        self.start_trace()
+
+profiler = FrameProfiler()
 
 
 # =============================================================================
 # [Manager] Sound Manager
 # - BGM 및 SFX 리소스 로드 및 재생 관리
 # - 싱글톤 패턴과 유사하게 전역 인스턴스(sound_mgr)로 운용
+# - SFX: 디코딩된 Sound 캐시 + 고정 채널 풀 (효과음별 동시 재생 수 제한 / 우선순위)
 # =============================================================================
+SFX_CHANNELS = 16               # 효과음 전용 믹서 채널 수 (BGM은 music 스트림 사용)
+
+# 효과음별 (최대 동시 재생 수, 우선순위) - 채널이 가득 차면 우선순위가 같거나 낮은 가장 오래된 음을 중단
+SFX_PROFILE = {
+    "sfx_shoot.wav":            (3, 1),
+    "sfx_shoot_enemy.wav":      (4, 1),
+    "sfx_enemy_die.wav":        (4, 2),
+    "sfx_dialogue.wav":         (1, 2),
+    "sfx_siren.wav":            (1, 2),
+    "sfx_warp.wav":             (1, 2),
+    "sfx_player_hit.wav":       (2, 3),
+    "sfx_player_hit_maybe.wav": (2, 3),
+    "sfx_clear.wav":            (1, 3),
+}
+SFX_DEFAULT_PROFILE = (2, 1)
+SFX_FILES = list(SFX_PROFILE)
+
 class SoundManager:
     def __init__(self):
         self.current_bgm = None
+        self.samples = {}       # filename -> pygame Sound (디코딩 캐시)
+        self.channels = None    # pygame Channel 목록 (첫 재생 시 생성)
+        self.voices = {}        # channel index -> (filename, priority, seq)
+        self.voice_seq = 0      # 재생 순서 (가장 오래된 음 판별용)
+        self.dropped = 0; self.stolen = 0
         
     def play_bgm(self, filename):
         """
@@ -30,26 +222,288 @@ class SoundManager:
         except: 
             print(f"[Err] BGM Load Failed: {filename}")
 
+    def sample(self, filename):
+        """캐시된 Sound 반환 (AssetLoader가 미리 채우지 못한 경우에만 디스크에서 로드)"""
+        sound = self.samples.get(filename)
+        if sound is None:
+            sound = pygame.mixer.Sound(f"sound/{filename}")
+            self.samples[filename] = sound
+        return sound
+
     def play_sfx(self, filename):
         """
         SFX 재생 (One-shot)
-        - 효과음은 중첩 재생 허용
+        - 효과음은 중첩 재생 허용 (SFX_PROFILE의 동시 재생 수 이내)
+        - 같은 효과음이 한도에 도달하면 그중 가장 오래된 음을 교체
+        - 빈 채널이 없으면 우선순위가 같거나 낮은 가장 오래된 음을 교체, 없으면 재생 생략
         """
         if not pygame: return
         try:
-            sound = pygame.mixer.Sound(f"sound/{filename}")
-            sound.play()
+            sound = self.sample(filename)
+            if self.channels is None:
+                pygame.mixer.set_num_channels(SFX_CHANNELS)
+                self.channels = [pygame.mixer.Channel(i) for i in range(SFX_CHANNELS)]
+            max_voices, priority = SFX_PROFILE.get(filename, SFX_DEFAULT_PROFILE)
+
+            # 재생이 끝난 채널 정리
+            for idx in [i for i in self.voices if not self.channels[i].get_busy()]: del self.voices[idx]
+
+            same = [i for i, v in self.voices.items() if v[0] == filename]
+            if len(same) >= max_voices:
+                idx = min(same, key=lambda i: self.voices[i][2]); self.stolen += 1
+            else:
+                idx = next((i for i in range(SFX_CHANNELS) if i not in self.voices), None)
+                if idx is None:
+                    victims = [i for i, v in self.voices.items() if v[1] <= priority]
+                    if not victims: self.dropped += 1; return
+                    idx = min(victims, key=lambda i: (self.voices[i][1], self.voices[i][2])); self.stolen += 1
+
+            self.voice_seq += 1
+            self.voices[idx] = (filename, priority, self.voice_seq)
+            self.channels[idx].play(sound)
         except: pass
 
 sound_mgr = SoundManager()
 
 
+# =============================================================================
+# [System] Sprite Atlas (Pre-scaled Frame Cache)
+# - 축소해서 쓰는 캐릭터 스프라이트(subsample 배율 > 1)는 캐릭터 폴더 단위로 한 장에 모아 image/cache/<폴더>@<배율>.png 로 저장
+#   색인(.json): 원본 파일별 [mtime_ns, 크기], 프레임 이름(파일명, GIF는 파일명#인덱스) -> 아틀라스 안 [x, y, w, h]
+# - 이후 실행은 축소된 PNG 한 장만 디코딩하고 프레임은 잘라서 사용 -> 원본 해상도 GIF 프레임 디코딩 + subsample 생략
+# - 원본 mtime/크기, 배율 또는 ATLAS_VERSION이 바뀌면 처음 요청 시 다시 생성 (python build_assets.py로 미리 생성 가능)
+# - 생성/자르기는 Tk 호출이므로 메인 스레드 전용, 색인 확인과 PNG 읽기는 Tk 불필요 (AssetLoader Worker)
+# =============================================================================
+ATLAS_DIR = os.path.join("image", "cache")
+ATLAS_VERSION = 1
+ATLAS_MAX_WIDTH = 2048          # 프레임을 왼쪽부터 채우고 넘치면 다음 줄
+ATLAS_PAD = 1                   # 프레임 사이 여백 (px)
+SPRITE_EXTS = (".png", ".gif")
+
+def atlas_source(key):
+    """이미지 키 -> 아틀라스 (캐릭터 폴더, 배율), 배율 1(배경, 컷신)은 None (원본 그대로 사용)"""
+    path, _, scale = key
+    return (os.path.dirname(path), scale) if scale > 1 else None
+
+def atlas_frame_id(key):
+    path, fmt, _ = key
+    return os.path.basename(path) + (f"#{fmt.split()[-1]}" if fmt else "")
+
+def atlas_paths(source):
+    directory, scale = source
+    name = os.path.join(ATLAS_DIR, f"{os.path.basename(directory)}@{scale}")
+    return name + ".png", name + ".json"
+
+def atlas_stamps(directory):
+    """폴더 안 스프라이트 원본 -> [mtime_ns, 크기] (캐시 유효성 기준)"""
+    stamps = {}
+    for name in sorted(os.listdir(directory)):
+        if name.lower().endswith(SPRITE_EXTS):
+            stat = os.stat(os.path.join(directory, name)); stamps[name] = [stat.st_mtime_ns, stat.st_size]
+    return stamps
+
+def read_atlas(source):
+    """캐시된 (색인, base64 PNG) - 원본/배율/버전이 색인과 다르거나 파일이 없으면 None (Tk 불필요)"""
+    image_path, index_path = atlas_paths(source)
+    try:
+        with open(index_path, encoding="utf-8") as f: index = json.load(f)
+        if (index.get("version"), index.get("scale"), index.get("sources")) != (ATLAS_VERSION, source[1], atlas_stamps(source[0])): return None
+        with open(image_path, "rb") as f: return index, base64.b64encode(f.read())
+    except (OSError, ValueError): return None
+
+def build_atlas(source):
+    """[Main Thread] 원본 디코딩 -> subsample -> 한 장에 배치 후 캐시 저장, (아틀라스 PhotoImage, 색인) 반환"""
+    directory, scale = source
+    stamps = atlas_stamps(directory)
+    frames = []
+    for name in stamps:
+        path = os.path.join(directory, name)
+        if name.lower().endswith(".gif"):
+            for i in itertools.count():
+                try: frames.append((f"{name}#{i}", PhotoImage(file=path, format=f"gif -index {i}").subsample(scale)))
+                except TclError: break # 마지막 프레임 이후
+        else:
+            try: frames.append((name, PhotoImage(file=path).subsample(scale)))
+            except TclError: print(f"[Warning] Sprite skipped: {path}")
+
+    rects = {}; x = y = row_h = width = 0
+    for name, photo in frames:
+        w, h = photo.width(), photo.height()
+        if x and x + w > ATLAS_MAX_WIDTH: x = 0; y += row_h + ATLAS_PAD; row_h = 0
+        rects[name] = [x, y, w, h]
+        width = max(width, x + w); x += w + ATLAS_PAD; row_h = max(row_h, h)
+    atlas = PhotoImage(width=max(1, width), height=max(1, y + row_h))
+    for name, photo in frames: atlas.tk.call(atlas, "copy", photo, "-to", rects[name][0], rects[name][1])
+
+    index = {"version": ATLAS_VERSION, "scale": scale, "sources": stamps, "frames": rects}
+    image_path, index_path = atlas_paths(source)
+    try:
+        os.makedirs(ATLAS_DIR, exist_ok=True)
+        atlas.write(image_path + ".tmp", format="png")
+        with open(index_path + ".tmp", "w", encoding="utf-8") as f: json.dump(index, f)
+        os.replace(image_path + ".tmp", image_path); os.replace(index_path + ".tmp", index_path) # 색인을 마지막에 교체
+    except (OSError, TclError) as e: print(f"[Warning] Sprite atlas not written: {image_path} ({e})")
+    return atlas, index
+
+def open_atlas(source, cached=None):
+    """
+    [Main Thread] (아틀라스 PhotoImage, 색인)
+    - cached: Worker가 읽은 read_atlas() 결과 (None: 아직 확인 안 함, (): 캐시 없음/만료)
+    - 유효한 캐시면 축소된 PNG 한 장만 디코딩, 아니면 build_atlas()
+    """
+    if cached is None: cached = read_atlas(source)
+    if cached:
+        index, data = cached
+        try: return PhotoImage(data=data, format="png"), index
+        except TclError: pass # 손상된 캐시 -> 다시 생성
+    return build_atlas(source)
+
+def atlas_frame(atlas, rect):
+    """아틀라스에서 프레임 한 장을 새 PhotoImage로 복사 (캔버스 이미지 아이템은 이미지 전체를 그리므로)"""
+    x, y, w, h = rect
+    frame = PhotoImage(width=w, height=h)
+    frame.tk.call(frame, "copy", atlas, "-from", x, y, x + w, y + h)
+    return frame
+
+
+# =============================================================================
+# [Manager] Asset Loader (Background Preload)
+# - Worker Thread: 이미지 파일 읽기(+base64 인코딩), 아틀라스 캐시 확인/읽기, 효과음 디코딩 -> sound_mgr.samples (Tk 호출 없음)
+# - Main Thread: Tk 제약상 PhotoImage 생성만 after()로 시간을 나눠 수행
+# - 이미지 키: (경로, Tk 포맷 문자열 또는 None, subsample 배율)
+#   배율 > 1은 Sprite Atlas에서 잘라서 생성 (원본 소스 = 경로 대신 (캐릭터 폴더, 배율))
+# =============================================================================
+ASSET_PUMP_MS = 15              # 메인 스레드 PhotoImage 생성 주기
+ASSET_SLICE_MS = 6              # 주기당 PhotoImage 생성에 사용할 최대 시간
+
+def image_asset(path, format=None, scale=1): return (path, format, scale)
+
+def gif_assets(path, frame_count, scale=1):
+    return [image_asset(path, f"gif -index {i}", scale) for i in range(frame_count)]
+
+class AssetLoader:
+    def __init__(self):
+        self.window = None; self.worker = None
+        self.jobs = queue.Queue()       # Worker 입력: ("image", path) / ("atlas", (폴더, 배율)) / ("sound", filename)
+        self.results = queue.Queue()    # Worker 출력: (kind, name, data)
+        self.raw = {}                   # 소스 -> base64 bytes (None: 읽기 실패), 아틀라스는 read_atlas() 결과 (빈 튜플: 생성 필요)
+        self.atlases = {}               # (폴더, 배율) -> (아틀라스 PhotoImage, 색인) - 같은 아틀라스의 프레임끼리 공유
+        self.photos = {}                # key -> PhotoImage (씬이 photo()로 가져가면 제거)
+        self.pending = []               # PhotoImage 생성 대기 key
+        self.requested = set(); self.reading = set()
+        self.total = 0; self.completed = 0
+
+    def start(self, window):
+        self.window = window
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.work, daemon=True)
+            self.worker.start()
+        window.after(ASSET_PUMP_MS, self.pump)
+
+    def preload(self, images=(), sounds=()):
+        """Worker에 읽기 요청 (이미 요청/완료된 항목은 무시)"""
+        if self.completed >= self.total: self.total = 0; self.completed = 0 # 진행률은 요청 묶음 단위
+        for key in images:
+            if key in self.requested or key in self.photos: continue
+            if key[1] and gif_cached(key[0], key[2]): continue # load_gif_frames 캐시에 이미 있음
+            self.requested.add(key); self.pending.append(key); self.total += 1
+            source = self.source(key)
+            if not self.loaded(source) and source not in self.reading:
+                self.reading.add(source); self.jobs.put(("atlas" if isinstance(source, tuple) else "image", source))
+        for name in sounds:
+            if name in sound_mgr.samples or ("sound", name) in self.requested: continue
+            self.requested.add(("sound", name)); self.total += 1
+            self.jobs.put(("sound", name))
+
+    def retain(self, images):
+        """images에 없는 미사용 PhotoImage / 원본 바이트 / 대기 항목 해제"""
+        keep = set(images); keep_sources = {self.source(key) for key in keep}
+        for key in [k for k in self.photos if k not in keep]: del self.photos[key]
+        for key in [k for k in self.pending if k not in keep]:
+            self.pending.remove(key); self.requested.discard(key); self.completed += 1
+        for source in [s for s in self.raw if s not in keep_sources]: del self.raw[source]
+        for source in [s for s in self.atlases if s not in keep_sources]: del self.atlases[source]
+
+    def ready(self, images):
+        waiting = set(self.pending)
+        return not any(key in waiting for key in images)
+
+    @staticmethod
+    def source(key): return atlas_source(key) or key[0]
+
+    def loaded(self, source): return source in self.raw or source in self.atlases
+
+    def progress(self):
+        return 1.0 if self.total == 0 else min(1.0, self.completed / self.total)
+
+    def work(self):
+        """[Worker Thread] Tk 객체를 만들지 않음 (PhotoImage는 메인 스레드 전용)"""
+        while True:
+            kind, name = self.jobs.get()
+            try:
+                if kind == "image":
+                    with open(name, "rb") as f: data = base64.b64encode(f.read())
+                elif kind == "atlas": data = read_atlas(name) or ()
+                else: data = pygame.mixer.Sound(f"sound/{name}") if pygame else None
+            except Exception: data = None
+            self.results.put((kind, name, data))
+
+    def pump(self):
+        """[Main Thread] Worker 결과 반영 후 ASSET_SLICE_MS 동안만 PhotoImage 생성"""
+        while True:
+            try: kind, name, data = self.results.get_nowait()
+            except queue.Empty: break
+            if kind in ("image", "atlas"): self.raw[name] = data; self.reading.discard(name)
+            else:
+                if data is not None: sound_mgr.samples.setdefault(name, data)
+                self.completed += 1
+
+        deadline = time.perf_counter() + ASSET_SLICE_MS / 1000.0
+        i = 0
+        while i < len(self.pending) and time.perf_counter() < deadline:
+            key = self.pending[i]; source = self.source(key)
+            if not self.loaded(source): i += 1; continue # 아직 읽는 중
+            del self.pending[i]; self.requested.discard(key); self.completed += 1
+            if self.raw.get(source, ()) is None: continue
+            try: self.photos[key] = self.create(key)
+            except TclError: pass
+        try: self.window.after(ASSET_PUMP_MS, self.pump)
+        except TclError: pass
+
+    def create(self, key):
+        source = atlas_source(key)
+        if source:
+            atlas = self.atlases.get(source)
+            if atlas is None: atlas = self.atlases[source] = open_atlas(source, self.raw.pop(source, None))
+            rect = atlas[1]["frames"].get(atlas_frame_id(key))
+            if rect is None: raise TclError(f"sprite not in atlas: {key}")
+            return atlas_frame(atlas[0], rect)
+        path, fmt, _ = key
+        opts = {"format": fmt} if fmt else {}
+        data = self.raw.get(path)
+        return PhotoImage(data=data, **opts) if data else PhotoImage(file=path, **opts)
+
+    def photo(self, path, format=None, scale=1):
+        """미리 생성된 PhotoImage를 넘겨줌 (소유권 이전). 없으면 즉시 생성"""
+        key = image_asset(path, format, scale)
+        photo = self.photos.pop(key, None)
+        if photo is not None: return photo
+        if key in self.pending:
+            self.pending.remove(key); self.requested.discard(key); self.completed += 1
+        return self.create(key)
+
+asset_loader = AssetLoader()
+
+
 # =============================================================================
 # [Utils] Resource Loader & Rendering Helpers
 # - 퍼포먼스 최적화를 위한 GIF 프레임 캐싱 및 텍스트 렌더링 유틸리티
 # =============================================================================
 _gif_cache = {} 
 
+def gif_cached(path, scale):
+    return any(k[0] == path and k[2] == scale for k in _gif_cache)
+
 def load_gif_frames(path, frame_count, scale=1):
     """
     GIF Frame Loader with Caching
@@ -62,28 +516,216 @@ def load_gif_frames(path, frame_count, scale=1):
     frames = []
     try:
         for i in range(frame_count):
-            photo = PhotoImage(file=path, format=f"gif -index {i}")
-            if scale > 1: photo = photo.subsample(scale) 
-            frames.append(photo)
+            frames.append(asset_loader.photo(path, f"gif -index {i}", scale))
         _gif_cache[cache_key] = frames
     except Exception as e:
         print(f"[Err] Asset Load Failed: {path}")
         return [None] 
     return frames
 
-def draw_outlined_text(canvas, x, y, text, font, fill_color, outline_color="black", **kwargs):
+def image_size(path, format=None, scale=1):
+    """
+    Image Size from Header (Tk 불필요)
+    - PNG(IHDR) / GIF(Logical Screen) 헤더만 읽어 (폭, 높이) 반환, 읽기 실패 시 None
+    - subsample 배율은 Tk PhotoImage와 같이 올림 처리 -> 헤드리스 시뮬레이션과 화면의 충돌 박스가 동일
+    """
+    try:
+        with open(path, "rb") as f: head = f.read(24)
+    except OSError: return None
+    if head[:8] == b"\x89PNG\r\n\x1a\n": w, h = struct.unpack(">II", head[16:24])
+    elif head[:3] == b"GIF": w, h = struct.unpack("<HH", head[6:10])
+    else: return None
+    return -(-w // scale), -(-h // scale)
+
+def first_step_past(x, s, bound, k_min=1):
+    """
+    Swept Helper (1D)
+    - x + k*s 가 이동 방향 기준으로 bound를 넘어서는 최소 정수 k (k >= k_min)
+    - s > 0: x + k*s > bound / s < 0: x + k*s < bound
+    """
+    if s == 0: return math.inf
+    k = max(k_min, int(math.floor((bound - x) / s)) + 1)
+    if s > 0:
+        while k > k_min and x + (k - 1) * s > bound: k -= 1
+        while not (x + k * s > bound): k += 1
+    else:
+        while k > k_min and x + (k - 1) * s < bound: k -= 1
+        while not (x + k * s < bound): k += 1
+    return k
+
+def first_step_past_np(x, s, bound, k_min):
+    """first_step_past의 NumPy 배열 버전 (s == 0인 원소는 도달 불가 값을 반환)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        q = np.floor((bound - x) / s)
+    k = np.maximum(k_min, np.where(np.isfinite(q), q + 1, 1e9))
+    forward = s > 0
+    def past(kk):
+        px = x + kk * s
+        return np.where(forward, px > bound, px < bound) & (s != 0)
+    k = np.where((k > k_min) & past(k - 1), k - 1, k)
+    k = np.where(past(k), k, k + 1)
+    return k
+
+OUTLINE_OFFSET = 2
+OUTLINE_DIRECTIONS = [(-OUTLINE_OFFSET, -OUTLINE_OFFSET), (-OUTLINE_OFFSET, 0), (-OUTLINE_OFFSET, OUTLINE_OFFSET),
+                      (0, -OUTLINE_OFFSET),                                    (0, OUTLINE_OFFSET),
+                      (OUTLINE_OFFSET, -OUTLINE_OFFSET),  (OUTLINE_OFFSET, 0),  (OUTLINE_OFFSET, OUTLINE_OFFSET)]
+_text_groups = itertools.count(1)
+
+def draw_outlined_text(canvas, x, y, text, font, fill_color, outline_color="black", tags=(), **kwargs):
     """
     Text Rendering with Outline
     - 가독성 확보를 위해 8방향 오프셋으로 외곽선을 먼저 렌더링 후 본문 렌더링
+    - 9개 아이템을 그룹 태그 하나로 묶어 반환 -> 태그 단위로 한 번에 이동(move)/숨김/문구 변경(itemconfigure text=)
     """
-    offset = 2
-    directions = [(-offset, -offset), (-offset, 0), (-offset, offset), 
-                  (0, -offset),                     (0, offset), 
-                  (offset, -offset),  (offset, 0),  (offset, offset)]
-    
-    for dx, dy in directions:
-        canvas.create_text(x + dx, y + dy, text=text, font=font, fill=outline_color, **kwargs)
-    return canvas.create_text(x, y, text=text, font=font, fill=fill_color, **kwargs)
+    group = f"otext{next(_text_groups)}"
+    tags = (group,) + ((tags,) if isinstance(tags, str) else tuple(tags))
+    for dx, dy in OUTLINE_DIRECTIONS:
+        canvas.create_text(x + dx, y + dy, text=text, font=font, fill=outline_color, tags=tags, **kwargs)
+    canvas.create_text(x, y, text=text, font=font, fill=fill_color, tags=tags, **kwargs)
+    return group
+
+
+# =============================================================================
+# [Utils] Outlined Text Cache
+# - 외곽선 텍스트(아이템 9개 그룹)를 (문구, 폰트, 색상, 옵션)별로 1회만 생성하고 숨김/표시로 재사용
+# - 다시 표시할 때는 그룹 태그 단위 Tcl 호출 2~3회 (아이템별 coords/itemconfigure/raise 27회 대신)
+# - 같은 키의 텍스트는 한 번에 하나만 표시 (오버레이, 일시정지 문구처럼 화면에 하나뿐인 라벨용)
+# - Tk는 PIL 없이 텍스트를 이미지로 래스터화할 수 없으므로 이미지 대신 아이템 그룹을 캐시
+# =============================================================================
+class TextCache:
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.groups = {}        # key -> [그룹 태그, x, y]
+        self.created = 0; self.reused = 0
+
+    def show(self, x, y, text, font, fill_color, outline_color="black", tags=(), **kwargs):
+        key = (text, font, fill_color, outline_color, tags, tuple(sorted(kwargs.items())))
+        entry = self.groups.get(key)
+        if entry is None:
+            self.groups[key] = [draw_outlined_text(self.canvas, x, y, text, font, fill_color, outline_color, tags, **kwargs), x, y]
+            self.created += 1
+            return self.groups[key][0]
+        group, last_x, last_y = entry
+        if (x, y) != (last_x, last_y): self.canvas.move(group, x - last_x, y - last_y); entry[1] = x; entry[2] = y
+        self.canvas.itemconfigure(group, state='normal'); self.canvas.tag_raise(group) # 새로 만든 것과 같은 쌓임 순서 (최상단)
+        self.reused += 1
+        return group
+
+    def hide(self, tag):
+        """그룹 태그 또는 show()에 넘긴 공통 태그(예: "overlay")로 숨김"""
+        self.canvas.itemconfigure(tag, state='hidden')
+
+    def __repr__(self):
+        return f"TextCache(groups={len(self.groups)}, created={self.created}, reused={self.reused})"
+
+
+# =============================================================================
+# [Utils] Canvas Item Pool
+# - 캔버스 아이템을 delete 후 재생성하지 않고, 숨김 -> 재설정 -> 표시로 재사용
+# - 종류(oval, rectangle, text)별 free 리스트 관리
+# - live/free/created 카운터: 정상 상태(steady state)에서 created가 늘지 않으면 신규 할당 0
+# =============================================================================
+class CanvasItemPool:
+    # 재사용 시 이전 설정이 남지 않도록 기본값으로 덮어쓸 옵션
+    DEFAULTS = {
+        "oval":      {"fill": "", "outline": "black", "width": 1, "tags": ()},
+        "rectangle": {"fill": "", "outline": "black", "width": 1, "stipple": "", "tags": ()},
+        "text":      {"anchor": "center", "fill": "black", "tags": ()},
+    }
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.free = {}          # kind -> [item_id, ...]
+        self.live = {}          # item_id -> kind
+        self.created = 0        # 누적 신규 생성 수
+        self.reused = 0         # 누적 재사용 수
+
+    def acquire(self, kind, coords=(0, 0, 0, 0), **config):
+        free = self.free.get(kind)
+        if free:
+            item = free.pop()
+            options = dict(self.DEFAULTS.get(kind, {})); options.update(config)
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, state='normal', **options)
+            self.canvas.tag_raise(item) # 신규 생성과 같은 쌓임 순서 (최상단)
+            self.reused += 1
+        else:
+            item = getattr(self.canvas, f"create_{kind}")(*coords, **config)
+            self.created += 1
+        self.live[item] = kind
+        return item
+
+    def release(self, item):
+        kind = self.live.pop(item, None)
+        if kind is None: return
+        self.canvas.itemconfigure(item, state='hidden')
+        self.free.setdefault(kind, []).append(item)
+
+    def release_tag(self, tag):
+        for item in self.canvas.find_withtag(tag): self.release(item)
+
+    def stats(self):
+        free = {kind: len(items) for kind, items in self.free.items()}
+        return {"live": len(self.live), "free": sum(free.values()), "created": self.created, "reused": self.reused, "free_by_kind": free}
+
+    def __repr__(self):
+        st = self.stats()
+        return f"CanvasItemPool(live={st['live']}, free={st['free']}, created={st['created']}, reused={st['reused']})"
+
+
+# =============================================================================
+# [Utils] Render Cache (Change Tracking)
+# - 아이템별로 마지막에 Tk로 보낸 좌표/옵션을 기억하고 값이 바뀐 경우에만 Tcl 명령 전송
+# - World 레이어: 월드 좌표로 배치된 아이템(world 태그)은 스크롤 변화량만큼 canvas.move 1회로 이동
+#   -> 스크롤만 바뀐 프레임에서는 배경/맵/정지한 적에 대한 coords 호출이 없음
+# =============================================================================
+class RenderCache:
+    def __init__(self, canvas, world_tag="world"):
+        self.canvas = canvas; self.world_tag = world_tag
+        self.world_scroll = 0       # world 태그 아이템들이 현재 배치된 기준 스크롤 값
+        self.world = {}             # item_id -> 마지막 월드 좌표
+        self.screen = {}            # item_id -> 마지막 화면 좌표
+        self.options = {}           # item_id -> {option: value}
+        self.issued = 0; self.skipped = 0
+
+    def scroll_world(self, scroll_x):
+        dx = self.world_scroll - scroll_x
+        if dx == 0: return
+        self.canvas.move(self.world_tag, dx, 0); self.issued += 1
+        self.world_scroll = scroll_x
+
+    def world_coords(self, item, *coords):
+        """월드 좌표로 배치 (x 좌표에서 현재 world_scroll을 빼서 전송)"""
+        if self.world.get(item) == coords: self.skipped += 1; return False
+        if item not in self.world: self.canvas.addtag_withtag(self.world_tag, item)
+        self.world[item] = coords
+        off = self.world_scroll
+        self.canvas.coords(item, *[v - off if i % 2 == 0 else v for i, v in enumerate(coords)]); self.issued += 1
+        return True
+
+    def coords(self, item, *coords):
+        """화면 좌표로 배치 (스크롤과 무관한 아이템: Player, HUD)"""
+        if self.screen.get(item) == coords: self.skipped += 1; return False
+        self.screen[item] = coords
+        self.canvas.coords(item, *coords); self.issued += 1
+        return True
+
+    def config(self, item, **options):
+        last = self.options.setdefault(item, {})
+        changed = {k: v for k, v in options.items() if last.get(k, self) != v}
+        if not changed: self.skipped += 1; return False
+        last.update(changed)
+        self.canvas.itemconfigure(item, **changed); self.issued += 1
+        return True
+
+    def forget(self, item):
+        """삭제되거나 item_pool로 반납된 아이템의 기록 제거 (재사용 시 전체 값을 다시 전송)"""
+        if self.world.pop(item, None) is not None: self.canvas.dtag(item, self.world_tag)
+        self.screen.pop(item, None); self.options.pop(item, None)
+
+    def __repr__(self):
+        return f"RenderCache(world={len(self.world)}, issued={self.issued}, skipped={self.skipped})"
 
 
 # =============================================================================
@@ -104,7 +746,7 @@ class MenuScene:
         self.bg_id = None 
         try:
             self.rand_bga_int = random.randint(1, 38)
-            self.bg_img = PhotoImage(file=f"image/bga{self.rand_bga_int}.png")
+            self.bg_img = asset_loader.photo(f"image/bga{self.rand_bga_int}.png")
             self.bg_id = self.canvas.create_image(640, 360, image=self.bg_img)
         except: pass
         
@@ -113,11 +755,28 @@ class MenuScene:
                            text="이동: ← →   점프: Space   발사: A    대화 넘기기 : Enter", 
                            font=("KOTRA_BOLD", 15), fill_color="#DDDDDD", outline_color="black", anchor="se")
 
+        # UI: Loading Bar (AssetLoader 진행률, 완료 시 숨김)
+        self.load_frame = self.canvas.create_rectangle(20, 688, 320, 700, outline="white", width=2, state="hidden")
+        self.load_bar = self.canvas.create_rectangle(20, 688, 20, 700, fill="#00FF00", width=0, state="hidden")
+        self.load_shown = False
+
+    def display(self):
+        progress = asset_loader.progress()
+        if progress >= 1.0:
+            if self.load_shown:
+                self.canvas.itemconfigure(self.load_frame, state="hidden"); self.canvas.itemconfigure(self.load_bar, state="hidden")
+                self.load_shown = False
+            return
+        if not self.load_shown:
+            self.canvas.itemconfigure(self.load_frame, state="normal"); self.canvas.itemconfigure(self.load_bar, state="normal")
+            self.load_shown = True
+        self.canvas.coords(self.load_bar, 20, 688, 20 + 300 * progress, 700)
+
     def update_background(self):
         """Randomize Menu Background"""
         try:
             self.rand_bga_int = random.randint(1, 38)
-            self.bg_img = PhotoImage(file=f"image/bga{self.rand_bga_int}.png")
+            self.bg_img = asset_loader.photo(f"image/bga{self.rand_bga_int}.png")
             if self.bg_id:
                 self.canvas.itemconfig(self.bg_id, image=self.bg_img)
         except Exception as e:
@@ -128,6 +787,8 @@ class MenuScene:
         
     def unpack(self): 
         self.canvas.pack_forget()
+
+    def destroy(self): self.canvas.destroy(); self.bg_img = None
     
     def keyReleaseHandler(self, event):
         # [Input] Command Buffer Update
@@ -174,6 +835,10 @@ class MenuScene:
 # - 순차적 이미지 렌더링을 통한 스토리텔링 씬
 # =============================================================================
 class DialogueScene:
+    @staticmethod
+    def assets_for(image_files, bg_file=None):
+        return ([image_asset(f"image/{bg_file}")] if bg_file else []) + [image_asset(f"image/{f}") for f in image_files]
+
     def __init__(self, window, image_files, bg_file=None):
         self.window = window
         self.canvas = Canvas(self.window, bg="black", width=1280, height=720)
@@ -182,14 +847,15 @@ class DialogueScene:
         self.current_idx = 0             
         self.bg_img = None
         try:
-            if bg_file: self.bg_img = PhotoImage(file=f"image/{bg_file}")
+            if bg_file: self.bg_img = asset_loader.photo(f"image/{bg_file}")
             for file in self.image_files:
-                self.images.append(PhotoImage(file=f"image/{file}"))
+                self.images.append(asset_loader.photo(f"image/{file}"))
         except: pass
         self.draw_scene()
 
     def pack(self): self.canvas.pack(expand=True, fill=BOTH)
     def unpack(self): self.canvas.pack_forget()
+    def destroy(self): self.canvas.destroy(); self.images = []; self.bg_img = None
     def display(self): pass 
     def keyPressHandler(self, event): pass
 
@@ -214,6 +880,8 @@ class DialogueScene:
 # - 플레이어의 선택에 따라 엔딩 또는 히든 루트 분기 처리
 # =============================================================================
 class BossScene:
+    ASSETS = [image_asset(f"image/boss_text{i}.png") for i in range(1, 36)] + [image_asset("image/story2.png"), image_asset("image/story3.png")]
+
     def __init__(self, window):
         self.window = window
         self.canvas = Canvas(self.window, bg="black", width=1280, height=720)
@@ -221,9 +889,9 @@ class BossScene:
         self.images = []
         try:
             for file in self.image_files:
-                self.images.append(PhotoImage(file=f"image/{file}"))
-            self.bg_img1 = PhotoImage(file="image/story2.png")
-            self.bg_img2 = PhotoImage(file="image/story3.png")
+                self.images.append(asset_loader.photo(f"image/{file}"))
+            self.bg_img1 = asset_loader.photo("image/story2.png")
+            self.bg_img2 = asset_loader.photo("image/story3.png")
         except: pass
         self.current_idx = 0
         self.state = "dialogue" 
@@ -231,6 +899,7 @@ class BossScene:
 
     def pack(self): self.canvas.pack(expand=True, fill=BOTH)
     def unpack(self): self.canvas.pack_forget()
+    def destroy(self): self.canvas.destroy(); self.images = []; self.bg_img1 = self.bg_img2 = None
     def display(self): pass 
     def keyPressHandler(self, event): pass
 
@@ -267,19 +936,23 @@ class BossScene:
 # [Scene] Ending & Game Over
 # =============================================================================
 class EndingScene:
+    @staticmethod
+    def assets_for(ending_type): return [image_asset(f"image/ending{ending_type}.png")]
+
     def __init__(self, window, ending_type):
         self.window = window
         self.canvas = Canvas(self.window, bg="black", width=1280, height=720)
         self.ending_type = ending_type 
         try:
             filename = f"image/ending{ending_type}.png"
-            self.bg_img = PhotoImage(file=filename)
+            self.bg_img = asset_loader.photo(filename)
             self.canvas.create_image(640, 360, image=self.bg_img)
         except: pass
         self.canvas.create_text(60, 700, text="ESC: 종료", font=("KOTRA_BOLD", 15), fill="white", anchor="w")
 
     def pack(self): self.canvas.pack(expand=True, fill=BOTH)
     def unpack(self): self.canvas.pack_forget()
+    def destroy(self): self.canvas.destroy(); self.bg_img = None
     def display(self): pass 
     def keyPressHandler(self, event): pass
     def keyReleaseHandler(self, event):
@@ -295,6 +968,7 @@ class GameOverScene:
 
     def pack(self): self.canvas.pack(expand=True, fill=BOTH)
     def unpack(self): self.canvas.pack_forget()
+    def destroy(self): self.canvas.destroy()
     def display(self): pass 
     def keyPressHandler(self, event): pass
     def keyReleaseHandler(self, event):
@@ -308,55 +982,213 @@ class GameOverScene:
 # - Wall: 모든 방향 충돌 (Solid)
 # - Glass: 플레이어는 막힘, 총알은 관통
 # - Platform: 상향 점프 통과 가능 (One-way collision)
+# - 캔버스 아이템은 LevelScene이 생성/관리 (시뮬레이션은 좌표만 사용)
 # =============================================================================
 class MapObject:
-    def __init__(self, canvas, x, y, w, h, color):
-        self.canvas = canvas
+    __slots__ = ("world_x", "y", "w", "h", "color", "rect")
+    type = None
+    def __init__(self, x, y, w, h, color):
         self.world_x = x; self.y = y; self.w = w; self.h = h; self.color = color
-        self.id = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color, outline="black")
-    def draw(self, scroll_x):
-        screen_x = self.world_x - scroll_x
-        self.canvas.coords(self.id, screen_x, self.y, screen_x + self.w, self.y + self.h)
-    def get_rect(self): return (self.world_x, self.y, self.world_x + self.w, self.y + self.h)
+        self.rect = (x, y, x + w, y + h) # [Collision] 정적 오브젝트이므로 생성 시 한 번만 계산
+    def get_rect(self): return self.rect
+
+class Wall(MapObject):
+    __slots__ = (); type = "wall"
+    def __init__(self, x, y, w, h, color="gray"): super().__init__(x, y, w, h, color)
+class Glass(MapObject):
+    __slots__ = (); type = "glass"
+    def __init__(self, x, y, w, h, color="#87CEFA"): super().__init__(x, y, w, h, color)
+class Platform(MapObject):
+    __slots__ = (); type = "platform"
+    def __init__(self, x, y, w, h, color="#8B4513"): super().__init__(x, y, w, h, color)
+
+
+# =============================================================================
+# [Entities] Bullet Pool (Struct of Arrays)
+# - 총알을 dict 목록 대신 미리 할당된 병렬 배열(위치, 속도, 소유자, laps, alive)로 관리
+# - NumPy가 있으면 ndarray, 없으면 list 사용 (슬롯 인덱스 접근 방식은 동일)
+# - 슬롯은 재사용되며 부족하면 2배로 확장, 캔버스 oval은 LevelScene이 슬롯별로 CanvasItemPool에서 할당
+# =============================================================================
+class BulletPool:
+    OWNER_PLAYER = 0; OWNER_ENEMY = 1
+    FLOAT_FIELDS = ("x", "y", "prev_x", "prev_y", "vx", "vy")
+
+    def __init__(self, capacity=128):
+        self.capacity = 0; self.count = 0
+        self.free = []          # 빈 슬롯 스택 (낮은 번호부터 재사용)
+        for name in self.FLOAT_FIELDS: setattr(self, name, self.alloc(0, 0.0, "float64"))
+        self.laps = self.alloc(0, 0, "int32"); self.owner = self.alloc(0, 0, "int8")
+        self.aimed = self.alloc(0, False, "bool"); self.alive = self.alloc(0, False, "bool")
+        self.grow(capacity)
+
+    @staticmethod
+    def alloc(n, value, dtype):
+        if np is not None: return np.full(n, value, dtype=dtype)
+        return [value] * n
+
+    @staticmethod
+    def extend(arr, n, value, dtype):
+        if np is not None: return np.concatenate((arr, np.full(n, value, dtype=dtype)))
+        return arr + [value] * n
+
+    def grow(self, new_capacity):
+        extra = new_capacity - self.capacity
+        for name in self.FLOAT_FIELDS: setattr(self, name, self.extend(getattr(self, name), extra, 0.0, "float64"))
+        self.laps = self.extend(self.laps, extra, 0, "int32"); self.owner = self.extend(self.owner, extra, 0, "int8")
+        self.aimed = self.extend(self.aimed, extra, False, "bool"); self.alive = self.extend(self.alive, extra, False, "bool")
+        self.free = list(range(new_capacity - 1, self.capacity - 1, -1)) + self.free
+        self.capacity = new_capacity
+
+    def spawn(self, x, y, vx, vy, owner, aimed=False):
+        """빈 슬롯에 총알 배치 (vx, vy: 틱당 이동량)"""
+        if not self.free: self.grow(self.capacity * 2)
+        i = self.free.pop()
+        self.x[i] = self.prev_x[i] = x; self.y[i] = self.prev_y[i] = y
+        self.vx[i] = vx; self.vy[i] = vy
+        self.laps[i] = 0; self.owner[i] = owner; self.aimed[i] = aimed; self.alive[i] = True
+        self.count += 1
+        return i
+
+    def clear(self):
+        """모든 총알 제거 (슬롯 배열은 유지, 빈 슬롯 순서는 새 풀과 동일)"""
+        if np is not None: self.alive[:] = False
+        else: self.alive = [False] * self.capacity
+        self.free = list(range(self.capacity - 1, -1, -1)); self.count = 0
+
+    def kill(self, i):
+        if not self.alive[i]: return
+        self.alive[i] = False; self.count -= 1
+        self.free.append(i)
+
+    def active(self):
+        """살아있는 슬롯 인덱스 목록"""
+        if np is not None: return np.flatnonzero(self.alive).tolist()
+        return [i for i, a in enumerate(self.alive) if a]
+
+    def save_prev(self, idx):
+        """보간용 직전 틱 위치 저장"""
+        if np is not None:
+            self.prev_x[idx] = self.x[idx]; self.prev_y[idx] = self.y[idx]
+        else:
+            for i in idx: self.prev_x[i] = self.x[i]; self.prev_y[i] = self.y[i]
+
+    def __len__(self): return self.count
+
+
+# =============================================================================
+# [Utils] Spatial Index (Uniform Grid)
+# - 맵 오브젝트를 고정 크기 셀에 등록하여 충돌 검사 시 주변 오브젝트만 조회
+# - 스테이지 생성 시 1회 구축(레벨 파일에 미리 계산된 셀 목록 사용), 보스 소환 벽 같은 동적 오브젝트는 insert/remove로 갱신
+# =============================================================================
+class SpatialGrid:
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}         # (cx, cy) -> [obj, ...] (등록 순서 유지)
+        self.order = {}         # obj -> 등록 순번
+        self.next_order = 0
+
+    def cell_range(self, x1, y1, x2, y2):
+        cs = self.cell_size
+        return int(x1 // cs), int(y1 // cs), int(x2 // cs), int(y2 // cs)
+
+    def insert(self, obj):
+        self.order[obj] = self.next_order; self.next_order += 1
+        cx1, cy1, cx2, cy2 = self.cell_range(*obj.get_rect())
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                self.cells.setdefault((cx, cy), []).append(obj)
+
+    def load(self, objects, cells):
+        """[Level] 컴파일된 셀 목록((cx, cy) -> 오브젝트 인덱스)으로 구축 - insert()의 셀 범위 계산 생략"""
+        self.order = {obj: i for i, obj in enumerate(objects)}; self.next_order = len(objects)
+        self.cells = {key: [objects[i] for i in members] for key, members in cells.items()}
+        return self
+
+    def remove(self, obj):
+        if obj not in self.order: return
+        del self.order[obj]
+        cx1, cy1, cx2, cy2 = self.cell_range(*obj.get_rect())
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell and obj in cell: cell.remove(obj)
+
+    def query_point(self, x, y):
+        """점이 속한 셀의 오브젝트 목록 (반환 리스트는 수정 금지)"""
+        cs = self.cell_size
+        return self.cells.get((int(x // cs), int(y // cs)), ())
+
+    def query(self, x1, y1, x2, y2):
+        """
+        Range Query
+        - 영역과 겹칠 수 있는 오브젝트를 등록 순서대로 반환
+        - 기존 map_objects 선형 탐색과 같은 순서이므로 'break' 기반 우선순위가 동일하게 유지됨
+        """
+        cx1, cy1, cx2, cy2 = self.cell_range(x1, y1, x2, y2)
+        if cx1 == cx2 and cy1 == cy2: return self.cells.get((cx1, cy1), ())
+        found = set()
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell: found.update(cell)
+        return sorted(found, key=self.order.__getitem__)
+
+
+def sprite_damage_box(x, y, w, h, margin=15):
+    """
+    Damage Box (World Space)
+    - 중앙 앵커 이미지의 영역(Tk bbox와 동일한 정수 반폭 기준)에서 margin만큼 축소
+    - 캔버스 bbox 조회(Tcl 왕복) 없이 위치 + 스프라이트 크기로 계산
+    """
+    left = x - w // 2; top = y - h // 2
+    return (left + margin, top + margin, left + w - margin, top + h - margin)
 
-class Wall(MapObject): 
-    def __init__(self, canvas, x, y, w, h, color="gray"): super().__init__(canvas, x, y, w, h, color); self.type = "wall"
-class Glass(MapObject): 
-    def __init__(self, canvas, x, y, w, h):
-        super().__init__(canvas, x, y, w, h, color="#87CEFA"); self.canvas.itemconfigure(self.id, stipple="gray50"); self.type = "glass" 
-class Platform(MapObject): 
-    def __init__(self, canvas, x, y, w, h, color="#8B4513"): super().__init__(canvas, x, y, w, h, color); self.type = "platform" 
+def boxes_overlap(a, b):
+    """(x1, y1, x2, y2) 두 박스가 겹치는지 (경계 접촉은 제외)"""
+    return a[0] < b[2] and a[2] > b[0] and a[1] < b[3] and a[3] > b[1]
+
+
+def slot_state(obj):
+    """[Reset] __slots__ 엔티티의 속성 값 dict (vars() 대신 snapshot에서 사용, 설정되지 않은 슬롯은 제외)"""
+    names = _slot_names.get(type(obj))
+    if names is None: names = _slot_names[type(obj)] = [name for cls in type(obj).__mro__ for name in cls.__dict__.get("__slots__", ())]
+    return {name: getattr(obj, name) for name in names if hasattr(obj, name)}
+
+def load_slot_state(obj, state):
+    for name, value in state.items(): setattr(obj, name, value)
+
+_slot_names = {}
 
 
 # =============================================================================
 # [Entities] Player
-# - 물리 연산(중력, 점프), 애니메이션 상태 머신, 충돌 박스 관리
+# - 물리 연산(중력, 점프), 상태(idle/walk, 방향), 충돌 박스 관리
+# - sprite_size: 스프라이트 (폭, 높이) - None이면 기본 사각형 크기 (이미지 로드 실패 시와 동일)
 # =============================================================================
+PLAYER_SPRITE = image_asset("image/char/player/idle_0.png", scale=6)
+
 class Player:
-    def __init__(self, canvas, x, y):
-        self.canvas = canvas; self.x = x; self.y = y 
-        self.speed = 15; self.dy = 0; self.gravity = 2.5; self.jump_power = -38; self.on_ground = False 
-        self.facing = 1; self.state = "idle" 
-        scale_factor = 6 
-        
-        self.anim = { "idle_R": [], "idle_L": [], "walk_R": [], "walk_L": [] }
-        try:
-            self.anim["walk_R"] = load_gif_frames("image/char/player/walk_R.gif", 8, scale_factor)
-            self.anim["walk_L"] = load_gif_frames("image/char/player/walk_L.gif", 8, scale_factor)
-            idle_r = PhotoImage(file="image/char/player/idle_0.png").subsample(scale_factor)
-            idle_l = PhotoImage(file="image/char/player/idle_0_L.png").subsample(scale_factor)
-            self.anim["idle_R"] = [idle_r]; self.anim["idle_L"] = [idle_l]
-        except: print("[Warning] Player sprite load failed, using fallback.")
+    __slots__ = ("x", "y", "speed", "dy", "gravity", "jump_power", "on_ground", "facing", "state",
+                 "sprite_w", "sprite_h", "half_h", "world_x", "prev_y", "hitbox", "hitbox_pos")
 
-        self.frame_index = 0; self.last_anim_time = time.time()
-        
-        current_frame = self.anim["idle_R"][0] if self.anim["idle_R"] else None
-        if current_frame:
-            self.obj = self.canvas.create_image(self.x, self.y, image=current_frame)
-            self.half_h = current_frame.height() // 2 
+    def __init__(self, x, y, sprite_size=None):
+        self.x = x; self.y = y
+        self.speed = 15; self.dy = 0; self.gravity = 2.5; self.jump_power = -38; self.on_ground = False
+        self.facing = 1; self.state = "idle"
+
+        if sprite_size:
+            self.sprite_w, self.sprite_h = sprite_size
+            self.half_h = self.sprite_h // 2
         else:
-            self.obj = self.canvas.create_rectangle(x-20, y-40, x+20, y+40, fill="blue")
             self.half_h = 40
+            self.sprite_w = 40; self.sprite_h = 80
+
+        # [Interpolation] 직전 틱 위치
+        self.world_x = x; self.prev_y = y
+
+        # [Collision] Cached Damage Box (World Space) - 이동 시에만 갱신
+        self.hitbox = None; self.hitbox_pos = None
+        self.update_hitbox(x)
 
     def get_move_dir(self, pressed_keys):
         """Input Processing for Movement"""
@@ -367,283 +1199,823 @@ class Player:
         else: self.state = "idle"
         return direction
 
-    def update_physics(self, world_x, map_objects):
+    def update_physics(self, world_x, map_index):
         """Physics Engine: Gravity & Collision Resolution"""
+        self.world_x = world_x
+        self.prev_y = self.y
         prev_foot_y = self.y + self.half_h
-        self.dy += self.gravity 
-        self.y += self.dy        
+        self.dy += self.gravity
+        self.y += self.dy
         curr_foot_y = self.y + self.half_h
-        ground_y = 715 
-        self.on_ground = False 
-        
+        ground_y = 715
+        self.on_ground = False
+
         # Ground Collision
         if curr_foot_y >= ground_y:
             self.y = ground_y - self.half_h
             self.dy = 0
             self.on_ground = True
-            return 
+            return
 
         # Platform/Wall Collision (Landing Logic)
-        if self.dy >= 0: 
+        if self.dy >= 0:
             player_left = world_x - 20
             player_right = world_x + 20
-            for obj in map_objects:
+            for obj in map_index.query(player_left, prev_foot_y - 15, player_right, curr_foot_y):
                 ox1, oy1, ox2, oy2 = obj.get_rect()
                 # X-Axis Overlap Check
                 if (player_right > ox1) and (player_left < ox2):
                     # Y-Axis Landing Check (Pass-through if moving up, Collide if falling)
                     if prev_foot_y <= oy1 + 15 and curr_foot_y >= oy1:
-                        self.dy = 0 
+                        self.dy = 0
                         self.y = oy1 - self.half_h
                         self.on_ground = True
                         break
 
-    def update_animation(self):
-        """Update sprite frame based on state (idle/walk) and time delta"""
-        key = f"{self.state}_{'R' if self.facing == 1 else 'L'}"
-        frames = self.anim.get(key)
-        if not frames or frames[0] is None: return 
-        if len(frames) > 1: 
-            if time.time() - self.last_anim_time > 0.05:
-                self.frame_index = (self.frame_index + 1) % len(frames)
-                self.last_anim_time = time.time()
-                self.canvas.itemconfig(self.obj, image=frames[self.frame_index])
-        else: self.canvas.itemconfig(self.obj, image=frames[0])
-
     def jump(self, pressed_keys):
         if self.on_ground: self.dy = self.jump_power; self.on_ground = False
 
     def set_screen_position(self, screen_x):
         self.x = screen_x
-        try: self.canvas.coords(self.obj, self.x, self.y)
-        except: pass
-        self.update_animation()
-    
+
+    def update_hitbox(self, world_x):
+        self.world_x = world_x
+        pos = (world_x, self.y)
+        if pos == self.hitbox_pos: return
+        self.hitbox_pos = pos
+        self.hitbox = sprite_damage_box(world_x, self.y, self.sprite_w, self.sprite_h)
+
     def get_y(self): return self.y
     def get_facing(self): return self.facing
+    def get_anim_key(self): return f"{self.state}_{'R' if self.facing == 1 else 'L'}"
     def get_shoot_pos(self):
         top_y = self.y - self.half_h; full_height = self.half_h * 2; shoot_y = top_y + (full_height * 0.69)
         return self.x, shoot_y
-    def get_bbox(self): return self.canvas.bbox(self.obj)
-    def get_damage_box(self):
-        bbox = self.canvas.bbox(self.obj)
-        if not bbox: return None
-        margin = 15 
-        return (bbox[0] + margin, bbox[1] + margin, bbox[2] - margin, bbox[3] - margin)
+    def get_damage_box(self): return self.hitbox
 
 
 
 
 # =============================================================================
 # [Entities] Enemy
-# - Type: Mob, Data(Static Object), Boss, System Boss
+# - Type: Mob, Data(Static Object), Boss, System Boss -> 행동 클래스 Mob / DataEnemy / MidBoss / SystemBoss
+#   (종류별 update/think를 생성 시 클래스로 한 번 결정, 틱마다 enemy_type/is_boss/is_system 분기 없음)
+# - [ECS] 위치/속도/충돌 박스/체력/무기 상태는 EnemyStore 배열에 저장, Enemy 객체는 행을 가리키는 핸들
+#   일반 몹/데이터는 LevelWorld가 배열 단위로 일괄 처리(추적 -> 중력 -> 충돌 박스 -> 사격 -> 몸통 충돌), 보스는 객체별 처리
+# - __slots__: 인스턴스 __dict__ 없음, 보스 전용 필드(벽 소환, 순간이동 타이머)는 보스 클래스에만
 # - AI: Simple tracking within visual range
+# - sprite_size: 스프라이트 (폭, 높이) - None이면 기본 사각형 크기 (이미지 로드 실패 시와 동일)
+# - 타이머(사격, 벽 소환, 순간이동)는 LevelWorld.add_enemy()가 월드 시각으로 초기화
 # =============================================================================
+DATA_SPRITE = image_asset("image/data.png")
+
+class EnemyStore:
+    """
+    [ECS] Enemy Components (Struct of Arrays)
+    - 위치/속도(world_x, y, dy, speed), 충돌 박스(hx1~hy2), 체력, 무기(can_shoot, last_shot_time), 종류(kind)를 행 단위 병렬 배열로 보관
+    - 배열은 array.array: 원소 접근은 Python 숫자 반환(객체별 처리, 렌더링), NumPy 일괄 처리는 view()로 복사 없이 접근
+    - x축(위치, 속도, 충돌 박스 좌우)은 정수 열 ('q': 레벨 파일 좌표/속도가 정수) -> 벽 소환, 플레이어 충돌 위치로 float가 번지지 않음
+    - y축(중력 적용)은 실수 열 ('d')
+    - 행은 추가 순서대로만 쓰고 재사용하지 않음 -> 살아있는 행의 순서 = LevelWorld.enemies 순서 (갱신/판정 순서 유지)
+    - Enemy 객체는 (store, row) 핸들, handles[row]로 행 -> 핸들 조회
+    """
+    KIND_SOLO = 0; KIND_MOB = 1; KIND_DATA = 2 # SOLO: 보스처럼 객체별 update/think로 처리하는 행
+    FIELDS = (("world_x", 0, "q"), ("y", 0.0, "d"), ("dy", 0.0, "d"), ("prev_world_x", 0, "q"), ("prev_y", 0.0, "d"),
+              ("speed", 0, "q"), ("base_speed", 0, "q"), ("last_shot_time", 0.0, "d"),
+              ("hx1", 0, "q"), ("hy1", 0.0, "d"), ("hx2", 0, "q"), ("hy2", 0.0, "d"),
+              ("hp", 0, "q"), ("max_hp", 0, "q"), ("facing", 1, "q"), ("sprite_w", 0, "q"), ("sprite_h", 0, "q"), ("half_h", 0, "q"),
+              ("kind", 0, "b"), ("can_shoot", 0, "b"), ("is_active", 0, "b"), ("alive", 0, "b"))
+    VIEW_DTYPES = {"d": "float64", "q": "int64", "b": "int8"}
+    FLAGS = ("can_shoot", "is_active", "alive") # view()에서 bool 배열
+
+    def __init__(self, capacity=16):
+        self.capacity = 0; self.count = 0
+        for name, _, typecode in self.FIELDS: setattr(self, name, array(typecode))
+        self.handles = []
+        self.views = {}         # [NumPy] 필드 이름 -> 뷰 캐시 (grow() 시 해제)
+        self.grow(capacity)
+
+    def grow(self, new_capacity):
+        extra = new_capacity - self.capacity
+        self.views.clear() # 뷰가 버퍼를 참조하는 동안에는 array 크기 변경 불가
+        for name, value, typecode in self.FIELDS: getattr(self, name).extend(array(typecode, [value]) * extra)
+        self.handles += [None] * extra
+        self.capacity = new_capacity
+
+    def view(self, name):
+        """[NumPy] 배열 뷰 (복사 없음, 쓰기 가능) - grow() 이후에는 새 뷰를 받아야 하므로 함수 밖에 보관하지 말 것"""
+        v = self.views.get(name)
+        if v is None:
+            arr = getattr(self, name)
+            v = self.views[name] = np.frombuffer(arr, dtype="bool" if name in self.FLAGS else self.VIEW_DTYPES[arr.typecode])
+        return v
+
+    def add(self, handle):
+        if self.count == self.capacity: self.grow(self.capacity * 2)
+        row = self.count; self.count += 1
+        self.alive[row] = 1; self.handles[row] = handle
+        return row
+
+    def adopt(self, enemy):
+        """다른 저장소(생성 시 임시 저장소)의 적을 이 저장소의 새 행으로 이동"""
+        src, src_row = enemy.store, enemy.row
+        row = self.add(enemy)
+        for name, _, _ in self.FIELDS: getattr(self, name)[row] = getattr(src, name)[src_row]
+        enemy.store = self; enemy.row = row
+
+    def snapshot(self):
+        return self.count, {name: getattr(self, name)[:self.count] for name, _, _ in self.FIELDS}
+
+    def restore(self, snap):
+        """snapshot() 이후 추가된 행은 버림 (해당 핸들은 더 이상 월드에 속하지 않음)"""
+        count, arrays = snap
+        for name, values in arrays.items(): getattr(self, name)[:count] = values
+        self.alive[count:] = array("b", [0]) * (self.capacity - count)
+        self.count = count
+
+    def __len__(self): return self.count
+
+class EnemySweep:
+    """
+    [Collision] Sort-and-Sweep Broad Phase (플레이어 총알 -> 적)
+    - build(rows): 주어진 행 중 살아있는 행을 충돌 박스 왼쪽 x(hx1) 순으로 정렬 (invalidate() 이후 첫 질의 전 1회)
+    - query(): bisect로 x 구간이 겹칠 수 있는 행(hx1이 [x1 - 최대 폭, x2))만 좁은 판정 -> 총알 x 적 전체 대신 총알 x (log 적 수 + 겹치는 적)
+    - 겹치는 행 중 가장 작은 행 번호 = LevelWorld.enemies 순서상 첫 번째 적 (전체 순회와 같은 결과)
+    - 질의 사이에 죽은 행은 alive로 건너뜀, 위치가 바뀌면(텔레포트) invalidate()
+    """
+    __slots__ = ("store", "keys", "rows", "max_w", "valid")
+
+    def __init__(self, store):
+        self.store = store; self.keys = []; self.rows = []; self.max_w = 0.0; self.valid = False
+
+    def invalidate(self): self.valid = False
+
+    def build(self, rows):
+        s = self.store; alive = s.alive; hx1 = s.hx1; hx2 = s.hx2
+        self.rows = rows = sorted((r for r in rows if alive[r]), key=hx1.__getitem__)
+        self.keys = [hx1[r] for r in rows]
+        self.max_w = max((hx2[r] - hx1[r] for r in rows), default=0.0) + 1.0 # +1: 폭 반올림 오차 여유
+        self.valid = True
+
+    def query(self, rect):
+        """rect와 겹치는 첫 번째 적 (행 순서), 없으면 None"""
+        s = self.store; alive = s.alive; hx2 = s.hx2; hy1 = s.hy1; hy2 = s.hy2; rows = self.rows
+        x1, y1, x2, y2 = rect
+        best = s.count
+        for k in range(bisect_left(self.keys, x1 - self.max_w), bisect_left(self.keys, x2)): # hx1 < x2
+            r = rows[k]
+            if r < best and alive[r] and x1 < hx2[r] and y1 < hy2[r] and y2 > hy1[r]: best = r
+        return s.handles[best] if best < s.count else None
+
+def enemy_row(enemy): return enemy.row # 정렬 키: 행 순서 = LevelWorld.enemies 순서
+
+class EnemySleepIndex:
+    """
+    [Culling] Sleeping Enemies (x축 버킷)
+    - 활성 범위 밖의 적은 이동/AI 없이 멈춰 있으므로(Enemy.update) 잠들 때 1회 등록, 깨어날 때/제거 시 해제
+    - 등록 구간은 중심 x와 충돌 박스를 모두 덮음 -> 깨우기(중심 x가 활성 범위 안)와 몸통 충돌(충돌 박스) 조회 공용
+    - query()는 후보 집합 (순서 없음) -> 호출 측에서 정확히 판정하고 행 순서로 정렬
+    """
+    def __init__(self, cell_size=512):
+        self.cell_size = cell_size
+        self.cells = {}         # cx -> {enemy, ...}
+        self.spans = {}         # enemy -> (cx1, cx2)
+
+    def add(self, enemy):
+        cs = self.cell_size; x = enemy.world_x; x1, _, x2, _ = enemy.get_damage_box()
+        cx1, cx2 = self.spans[enemy] = (int(min(x, x1) // cs), int(max(x, x2) // cs))
+        for cx in range(cx1, cx2 + 1): self.cells.setdefault(cx, set()).add(enemy)
+
+    def discard(self, enemy):
+        """등록되어 있었으면 해제 후 True"""
+        span = self.spans.pop(enemy, None)
+        if span is None: return False
+        for cx in range(span[0], span[1] + 1):
+            cell = self.cells[cx]; cell.discard(enemy)
+            if not cell: del self.cells[cx]
+        return True
+
+    def query(self, x1, x2):
+        cs = self.cell_size; found = set()
+        for cx in range(int(x1 // cs), int(x2 // cs) + 1):
+            cell = self.cells.get(cx)
+            if cell: found |= cell
+        return found
+
+    def clear(self): self.cells.clear(); self.spans.clear()
+    def __contains__(self, enemy): return enemy in self.spans
+    def __iter__(self): return iter(self.spans)
+    def __len__(self): return len(self.spans)
+
+def component(name):
+    """Enemy 속성 -> 소속 EnemyStore 배열의 해당 행 (읽기/쓰기)"""
+    return property(lambda self: getattr(self.store, name)[self.row],
+                    lambda self, value: getattr(self.store, name).__setitem__(self.row, value))
+
 class Enemy:
-    def __init__(self, canvas, x, y, anim_frames, speed=3, hp=1, enemy_type="mob", can_shoot=False, is_boss=False, is_system=False):
-        self.canvas = canvas; self.world_x = x; self.y = y
-        self.speed = speed; 
-        self.base_speed = speed 
-        self.dy = 0; self.gravity = 0.9
-        self.anim = anim_frames; self.facing = 1 
-        self.hp = hp 
-        self.max_hp = hp 
-        self.enemy_type = enemy_type 
-        self.can_shoot = can_shoot
-        self.last_shot_time = time.time()
-        
-        # Boss Specific Attributes
-        self.is_boss = is_boss
-        self.is_system = is_system 
-        self.wall_obj = None        
-        self.wall_start_time = 0    
-        self.last_wall_skill = time.time()
-        self.last_teleport_auto = time.time()
-
-        self.frame_index = 0; self.last_anim_time = time.time()
-        
-        # Init: Data Type Handling
-        if self.enemy_type == "data":
-            try:
-                self.data_img = PhotoImage(file="image/data.png")
-                self.obj = self.canvas.create_image(self.world_x, self.y, image=self.data_img)
-                self.text_id = None; self.half_h = 60 
-            except:
-                self.obj = self.canvas.create_rectangle(0, 0, 60, 60, fill="blue", outline="white", width=2)
-                self.text_id = self.canvas.create_text(0, 0, text="DATA", fill="white", font=("KOTRA_BOLD", 10))
-                self.half_h = 30
-        else:
-            self.text_id = None
-            current_frame = self.anim["walk_R"][0] if (self.anim["walk_R"] and self.anim["walk_R"][0]) else None
-            if current_frame:
-                self.obj = self.canvas.create_image(self.world_x, self.y, image=current_frame)
-                self.half_h = current_frame.height() // 2
-            else:
-                color = "red" if is_boss else "green"
-                if is_system: color = "cyan"
-                self.obj = self.canvas.create_rectangle(0,0,40,40, fill=color)
-                self.half_h = 20
-
-    def update(self, player_world_x, map_objects, scroll_x, is_active):
-        # 1. Culling (Skip update if off-screen)
-        if not is_active: 
-            screen_x = self.world_x - scroll_x
-            if self.enemy_type == "data":
-                 if self.text_id: 
-                     self.canvas.coords(self.obj, screen_x - 30, self.y - 30, screen_x + 30, self.y + 30)
-                     self.canvas.coords(self.text_id, screen_x, self.y)
-                 else: 
-                     if not self.text_id: self.canvas.coords(self.obj, screen_x, self.y)
-                     else: self.canvas.coords(self.obj, screen_x - 30, self.y - 30, screen_x + 30, self.y + 30)
-            else:
-                 try: self.canvas.coords(self.obj, screen_x, self.y)
-                 except: pass 
-            return
-            
-        # ---------------------------------------------------------------------
-        # [Boss Logic: System] (Floating, Static X-Axis with Teleport)
-        # ---------------------------------------------------------------------
-        if self.is_system:
-            if self.world_x < player_world_x: self.facing = 1
-            else: self.facing = -1 
-            screen_x = self.world_x - scroll_x
-            try:
-                self.canvas.coords(self.obj, screen_x, self.y)
-                self.update_animation()
-            except: pass
-            return
-        # ---------------------------------------------------------------------
-
-        # [Logic: Movement & AI]
-        # Data type is static
-        if self.enemy_type != "data":
-            # Boss Enrage Mode (Speed Boost)
-            if self.is_boss and self.hp <= 25: self.speed = self.base_speed * 1.5
-            else: self.speed = self.base_speed
-                
-            # Tracking AI (X-Axis)
-            dx = 0
-            if abs(self.world_x - player_world_x) > 5:
-                if self.world_x < player_world_x: dx = self.speed; self.facing = 1
-                else: dx = -self.speed; self.facing = -1
-            next_x = self.world_x + dx
-            
-            # Wall Collision Detection
-            e_top = self.y - self.half_h; e_bottom = self.y + self.half_h
-            e_left = next_x - 20; e_right = next_x + 20
-            can_move = True
-            for obj in map_objects:
-                ox1, oy1, ox2, oy2 = obj.get_rect()
-                if not (e_bottom <= oy1 or e_top >= oy2):
-                    if (e_right > ox1) and (e_left < ox2): can_move = False; break
-            if can_move: self.world_x = next_x
-        
-        # [Physics: Gravity] Applied to all entities including Data
-        prev_foot_y = self.y + self.half_h
-        self.dy += self.gravity; self.y += self.dy
-        curr_foot_y = self.y + self.half_h
+    """
+    적 핸들 (상태는 EnemyStore 행) - 중력/발판 충돌, 충돌 박스 공통 처리, 행동(update, think)은 하위 클래스
+    - 생성 시 임시 저장소에 1행으로 만들고 LevelWorld.add_enemy()가 월드 저장소로 옮김
+    """
+    __slots__ = ("store", "row")
+    enemy_type = "mob"; is_boss = False; is_system = False # 분류 (렌더, HUD, 쉴드 판정용 클래스 상수)
+    touch_damage = True                                    # 플레이어와 닿으면 피격
+    gravity = 0.9
+    KIND = EnemyStore.KIND_SOLO
+
+    world_x = component("world_x"); y = component("y"); dy = component("dy")
+    prev_world_x = component("prev_world_x"); prev_y = component("prev_y")
+    speed = component("speed"); base_speed = component("base_speed")
+    hp = component("hp"); max_hp = component("max_hp"); facing = component("facing")
+    can_shoot = component("can_shoot"); last_shot_time = component("last_shot_time"); is_active = component("is_active")
+    sprite_w = component("sprite_w"); sprite_h = component("sprite_h"); half_h = component("half_h")
+
+    def __init__(self, x, y, sprite_size=None, speed=3, hp=1, can_shoot=False):
+        self.store = EnemyStore(1); self.row = self.store.add(self)
+        self.store.kind[self.row] = self.KIND
+        self.world_x = x; self.y = y
+        self.speed = speed; self.base_speed = speed
+        self.dy = 0; self.facing = 1
+        self.hp = hp; self.max_hp = hp
+        self.can_shoot = can_shoot; self.last_shot_time = 0
+        self.set_size(sprite_size)
+
+        # [Interpolation] 직전 틱 위치
+        self.prev_world_x = self.world_x; self.prev_y = self.y
+        self.is_active = False
+
+        # [Collision] Damage Box (World Space) - 이동 시에만 갱신
+        self.update_hitbox()
+
+    def set_size(self, sprite_size):
+        if sprite_size: self.sprite_w, self.sprite_h = sprite_size; self.half_h = self.sprite_h // 2
+        else: self.sprite_w = 40; self.sprite_h = 40; self.half_h = 20
+
+    def reset_timers(self, now):
+        self.last_shot_time = now
+
+    def update(self, player_world_x, map_index, is_active):
+        """
+        Simulation (1 tick): 기본은 제자리 고정 (직전 위치/활성 여부만 기록) - 이동/중력은 하위 클래스
+        - 캔버스 갱신은 LevelScene.render()에서 수행
+        """
+        s = self.store; r = self.row
+        s.prev_world_x[r] = s.world_x[r]; s.prev_y[r] = s.y[r]; s.is_active[r] = is_active
+
+    def think(self, world, now):
+        """[AI] 활성 범위 안에서만 호출 - 사격, 스킬 (world의 fire_enemy_bullet/add_map_object 사용)"""
+
+    def track(self, player_world_x, map_index):
+        """Tracking AI (X-Axis) + Wall Collision Detection"""
+        s = self.store; r = self.row
+        x = s.world_x[r]; dx = 0
+        if abs(x - player_world_x) > 5:
+            if x < player_world_x: dx = s.speed[r]; s.facing[r] = 1
+            else: dx = -s.speed[r]; s.facing[r] = -1
+        next_x = x + dx
+
+        y = s.y[r]; half_h = s.half_h[r]
+        e_top = y - half_h; e_bottom = y + half_h
+        e_left = next_x - 20; e_right = next_x + 20
+        for obj in map_index.query(e_left, e_top, e_right, e_bottom):
+            ox1, oy1, ox2, oy2 = obj.get_rect()
+            if not (e_bottom <= oy1 or e_top >= oy2):
+                if (e_right > ox1) and (e_left < ox2): return
+        s.world_x[r] = next_x
+
+    def fall(self, map_index):
+        """[Physics: Gravity] 바닥/발판 착지"""
+        s = self.store; r = self.row
+        y = s.y[r]; half_h = s.half_h[r]
+        prev_foot_y = y + half_h
+        dy = s.dy[r] + self.gravity; y += dy
+        curr_foot_y = y + half_h
         ground_y = 715
-        
+
         # 1. Floor Collision
-        if curr_foot_y >= ground_y: self.y = ground_y - self.half_h; self.dy = 0
-        
+        if curr_foot_y >= ground_y: y = ground_y - half_h; dy = 0
+
         # 2. Platform Collision
-        elif self.dy >= 0:
-            enemy_left = self.world_x - 20; enemy_right = self.world_x + 20
-            for obj in map_objects:
+        elif dy >= 0:
+            x = s.world_x[r]; enemy_left = x - 20; enemy_right = x + 20
+            for obj in map_index.query(enemy_left, prev_foot_y - 15, enemy_right, curr_foot_y):
                 ox1, oy1, ox2, oy2 = obj.get_rect()
                 if (enemy_right > ox1) and (enemy_left < ox2):
-                    if prev_foot_y <= oy1 + 15 and curr_foot_y >= oy1: 
-                        self.dy = 0; self.y = oy1 - self.half_h; break
-        
-        # [Render]
-        screen_x = self.world_x - scroll_x
-        
-        # Render: Data Type
-        if self.enemy_type == "data":
-            if self.text_id: 
-                self.canvas.coords(self.obj, screen_x - 30, self.y - 30, screen_x + 30, self.y + 30)
-                self.canvas.coords(self.text_id, screen_x, self.y)
-            else: 
-                try: self.canvas.coords(self.obj, screen_x, self.y)
-                except: pass
-        # Render: Mobs/Bosses
-        else:
-            try:
-                self.canvas.coords(self.obj, screen_x, self.y)
-                self.update_animation()
-            except: pass
-
-    # (Animation & Box Helpers)
-    def update_animation(self):
-        if self.enemy_type == "data": return
-        key = "walk_R" if self.facing == 1 else "walk_L"
+                    if prev_foot_y <= oy1 + 15 and curr_foot_y >= oy1:
+                        dy = 0; y = oy1 - half_h; break
+        s.y[r] = y; s.dy[r] = dy
+
+    def snap(self):
+        """Teleport 등 순간 이동 시 보간 없이 즉시 현재 위치로 표시"""
+        self.prev_world_x = self.world_x; self.prev_y = self.y
+        self.update_hitbox()
+
+    def update_hitbox(self):
+        s = self.store; r = self.row
+        s.hx1[r], s.hy1[r], s.hx2[r], s.hy2[r] = sprite_damage_box(s.world_x[r], s.y[r], s.sprite_w[r], s.sprite_h[r])
+
+    def get_anim_key(self): return "walk_R" if self.facing == 1 else "walk_L"
+    def get_damage_box(self):
+        s = self.store; r = self.row
+        return (s.hx1[r], s.hy1[r], s.hx2[r], s.hy2[r])
+
+class Mob(Enemy):
+    """추적 + 중력, can_shoot이면 4초마다 직선 사격 (적이 많으면 LevelWorld.update_enemy_batch로 일괄 처리)"""
+    __slots__ = ()
+    KIND = EnemyStore.KIND_MOB
+
+    def update(self, player_world_x, map_index, is_active):
+        s = self.store; r = self.row
+        s.prev_world_x[r] = s.world_x[r]; s.prev_y[r] = s.y[r]; s.is_active[r] = is_active
+        if not is_active: return # Culling (Skip update if off-screen)
+        self.track(player_world_x, map_index)
+        self.fall(map_index)
+        self.update_hitbox()
+
+    def think(self, world, now):
+        if self.can_shoot and now - self.last_shot_time > 4.0:
+            world.fire_enemy_bullet(self); self.last_shot_time = now
+
+class DataEnemy(Enemy):
+    """정적 오브젝트 (중력만 적용, 사격/접촉 피해 없음) - 몹이 남아 있으면 쉴드"""
+    __slots__ = ()
+    enemy_type = "data"; touch_damage = False
+    KIND = EnemyStore.KIND_DATA
+
+    def set_size(self, sprite_size):
+        if sprite_size: self.sprite_w, self.sprite_h = sprite_size; self.half_h = 60
+        else: self.sprite_w = 60; self.sprite_h = 60; self.half_h = 30
+
+    def update(self, player_world_x, map_index, is_active):
+        s = self.store; r = self.row
+        s.prev_world_x[r] = s.world_x[r]; s.prev_y[r] = s.y[r]; s.is_active[r] = is_active
+        if not is_active: return
+        self.fall(map_index)
+        self.update_hitbox()
+
+class MidBoss(Mob):
+    """경비대장: 체력 25 이하 광폭화(이동 1.5배, 사격 1.5초), 8초마다 3초간 벽 소환"""
+    __slots__ = ("wall_obj", "wall_start_time", "last_wall_skill")
+    is_boss = True; KIND = EnemyStore.KIND_SOLO
+
+    def __init__(self, *args, **kwargs):
+        self.wall_obj = None; self.wall_start_time = 0; self.last_wall_skill = 0
+        super().__init__(*args, **kwargs)
+
+    def reset_timers(self, now):
+        self.last_shot_time = now; self.last_wall_skill = now
+
+    def track(self, player_world_x, map_index):
+        self.speed = self.base_speed * 3 // 2 if self.hp <= 25 else self.base_speed # Boss Enrage Mode (Speed Boost x1.5, 정수 이동량)
+        super().track(player_world_x, map_index)
+
+    def think(self, world, now):
+        if self.can_shoot and now - self.last_shot_time > (1.5 if self.hp <= 25 else 4.0):
+            world.fire_enemy_bullet(self); self.last_shot_time = now
+
+        # Boss Skill: Wall Summon
+        if self.wall_obj is None:
+            if now - self.last_wall_skill > 8.0:
+                self.wall_obj = Wall(x=self.world_x + (80 * self.facing), y=500, w=20, h=315, color="#4B0082")
+                world.add_map_object(self.wall_obj); self.wall_start_time = now
+        elif now - self.wall_start_time > 3.0:
+            world.remove_map_object(self.wall_obj)
+            self.wall_obj = None; self.last_wall_skill = now
+
+class SystemBoss(Enemy):
+    """시스템: 공중 고정(플레이어 방향만 전환), 조준 사격, 체력 절반 이하에서 3연발 + 10초마다 자동 순간이동"""
+    __slots__ = ("last_teleport_auto",)
+    is_boss = True; is_system = True
+
+    def __init__(self, *args, **kwargs):
+        self.last_teleport_auto = 0
+        super().__init__(*args, **kwargs)
+
+    def reset_timers(self, now):
+        self.last_shot_time = now; self.last_teleport_auto = now
+
+    def update(self, player_world_x, map_index, is_active):
+        super().update(player_world_x, map_index, is_active)
+        if is_active: self.facing = 1 if self.world_x < player_world_x else -1
+
+    def think(self, world, now):
+        if not self.can_shoot: return
+        enraged = self.hp <= self.max_hp * 0.5
+        if enraged and now - self.last_teleport_auto > 10.0 and hasattr(world, 'teleport_system_boss'): # Auto Teleport Phase
+            world.teleport_system_boss(self); self.last_teleport_auto = now
+        if now - self.last_shot_time > (3.0 if enraged else 4.0):
+            world.fire_enemy_bullet(self, aimed=True, count=3 if enraged else 1); self.last_shot_time = now
+
+ENEMY_CLASSES = {"mob": Mob, "data": DataEnemy}
+
+def enemy_class(enemy_type, is_boss=False, is_system=False):
+    """레벨 파일 스폰 정보 -> 행동 클래스 (생성 시 1회 결정, 틱마다 플래그 분기 없음)"""
+    if is_system: return SystemBoss
+    if is_boss: return MidBoss
+    return ENEMY_CLASSES[enemy_type]
+
+
+# =============================================================================
+# [Render] Sprite
+# - 엔티티 1개에 대응하는 캔버스 아이템 + 애니메이션 프레임 상태 (시뮬레이션 상태 없음)
+# - anim: {"walk_R": [PhotoImage, ...], ...} / interval: 프레임 전환 간격(게임 시각 기준 초)
+# =============================================================================
+class Sprite:
+    def __init__(self, canvas, obj, anim=None, interval=0.1, text_id=None):
+        self.canvas = canvas; self.obj = obj; self.text_id = text_id
+        self.anim = anim or {}; self.interval = interval
+        self.frame_index = 0; self.last_anim_time = 0.0; self.shown_frame = None
+        self.image = None   # 단일 이미지 참조 유지 (PhotoImage GC 방지)
+
+    def animate(self, key, now):
+        """Update sprite frame based on state key and game time (프레임이 바뀔 때만 itemconfig)"""
         frames = self.anim.get(key)
         if not frames or frames[0] is None: return
-        if time.time() - self.last_anim_time > 0.1:
-            self.frame_index = (self.frame_index + 1) % len(frames)
-            self.last_anim_time = time.time()
-            self.canvas.itemconfig(self.obj, image=frames[self.frame_index])
+        if len(frames) > 1:
+            if now - self.last_anim_time > self.interval:
+                self.frame_index = (self.frame_index + 1) % len(frames)
+                self.last_anim_time = now
+                self.canvas.itemconfig(self.obj, image=frames[self.frame_index]); self.shown_frame = frames[self.frame_index]
+        elif self.shown_frame is not frames[0]: self.canvas.itemconfig(self.obj, image=frames[0]); self.shown_frame = frames[0]
 
-    def get_bbox(self): return self.canvas.bbox(self.obj)
-    def get_damage_box(self):
-        bbox = self.canvas.bbox(self.obj)
-        if not bbox: return None
-        margin = 15
-        return (bbox[0] + margin, bbox[1] + margin, bbox[2] - margin, bbox[3] - margin)
-    def delete(self): 
+    def show(self, view, visible):
+        state = 'normal' if visible else 'hidden'
+        view.config(self.obj, state=state)
+        if self.text_id: view.config(self.text_id, state=state)
+
+    def reset(self): self.frame_index = 0; self.last_anim_time = 0.0
+
+    def delete(self, view=None):
+        if view: view.forget(self.obj); view.forget(self.text_id)
         self.canvas.delete(self.obj)
         if self.text_id: self.canvas.delete(self.text_id)
 
 
+# =============================================================================
+# [System] Level Data (Declarative Stage Files)
+# - 스테이지 구성은 levels/<이름>.json 에 선언: 맵 오브젝트, 적 배치, 보스 순간이동 좌표, 사이렌, 배경, 클리어 연출
+# - 처음 읽을 때 바이너리(levels/cache/<이름>.lvl)로 컴파일하여 저장
+#   맵 사각형/적 배치/공간 격자 셀 목록(셀 -> 오브젝트 인덱스)을 struct로 기록 -> 이후 실행은 JSON 검증/격자 계산 생략
+#   원본 파일의 mtime/크기 또는 LEVEL_VERSION이 바뀌면 다시 컴파일
+# - 읽은 LevelData는 프로세스 내에서 재사용: 맵 오브젝트는 정적이므로 월드끼리 같은 인스턴스를 공유
+#   (월드는 목록/격자만 복사 - 보스 소환 벽 같은 동적 오브젝트는 각 월드에만 추가됨)
+# =============================================================================
+LEVEL_DIR = "levels"
+LEVEL_CACHE_DIR = os.path.join(LEVEL_DIR, "cache")
+LEVEL_MAGIC = b"EIRL"; LEVEL_VERSION = 1
+LEVEL_HEADER = struct.Struct("<4sHqq")       # magic, version, 원본 mtime_ns, 원본 크기
+LEVEL_META = struct.Struct("<i?ddH9H")       # map_width, siren(enabled, interval, duration), cell_size, 배경 3 + 적 애니메이션 3 + 클리어 3
+LEVEL_MAP_ROW = struct.Struct("<Biiiih")     # type, x, y, w, h, color (문자열 인덱스, -1: 기본색)
+LEVEL_ENEMY_ROW = struct.Struct("<iiiiHB")   # x, y, speed, hp, enemy_type, flags (1: shoot, 2: boss, 4: system)
+LEVEL_SPOT_ROW = struct.Struct("<ii")
+LEVEL_CELL_ROW = struct.Struct("<hhH")       # cx, cy, n + 오브젝트 인덱스 n개 (uint16)
+LEVEL_COUNT = struct.Struct("<H")
+NO_STRING = 0xFFFF
+
+MAP_TYPES = ("wall", "glass", "platform")
+MAP_CLASSES = {"wall": Wall, "glass": Glass, "platform": Platform}
+ENEMY_FLAGS = (("shoot", 1), ("boss", 2), ("system", 4))
+
+class LevelData:
+    """컴파일된 스테이지 데이터 (읽기 전용, LevelWorld/LevelScene이 공유)"""
+    def __init__(self, name=None, map_width=5351, background=(None, "#87CEEB", "white"), enemy_anim=None,
+                 siren=(False, 15.0, 5.0), clear=("STAGE CLEAR", "blue", "bgm_clear.mp3"),
+                 map_objects=(), cells=None, cell_size=128, enemies=(), boss_spots=()):
+        self.name = name; self.map_width = map_width
+        self.bg_image, self.bg_color, self.floor_color = background
+        self.enemy_anim = enemy_anim                # (walk_R GIF, walk_L GIF, 프레임 수) 또는 None
+        self.siren_enabled, self.siren_interval, self.siren_duration = siren
+        self.clear_text, self.clear_color, self.clear_bgm = clear
+        self.map_objects = tuple(map_objects)
+        self.cells = cells or {}; self.cell_size = cell_size   # (cx, cy) -> (오브젝트 인덱스, ...)
+        self.enemies = tuple(enemies)               # (x, y, speed, hp, enemy_type, can_shoot, is_boss, is_system)
+        self.boss_spots = tuple(boss_spots)
+
+    def build_index(self):
+        return SpatialGrid(self.cell_size).load(self.map_objects, self.cells)
+
+    def assets(self):
+        """[Preload] 배경, 적 애니메이션, 데이터 스프라이트"""
+        keys = [image_asset(self.bg_image)] if self.bg_image else []
+        if any(spawn[4] == "data" for spawn in self.enemies): keys.append(DATA_SPRITE)
+        if self.enemy_anim:
+            path_r, path_l, frame_count = self.enemy_anim
+            keys += gif_assets(path_r, frame_count, 6) + gif_assets(path_l, frame_count, 6)
+        return keys
+
+    def __repr__(self):
+        return f"LevelData({self.name!r}, objects={len(self.map_objects)}, enemies={len(self.enemies)}, cells={len(self.cells)})"
+
+_level_cache = {}
+
+def level_paths(name):
+    return os.path.join(LEVEL_DIR, f"{name}.json"), os.path.join(LEVEL_CACHE_DIR, f"{name}.lvl")
+
+def compile_level(path):
+    """레벨 JSON -> 바이너리 (검증 포함, 잘못된 항목은 ValueError)"""
+    with open(path, encoding="utf-8") as f: src = json.load(f)
+    stat = os.stat(path)
+    strings = []; index = {}
+    def string(value):
+        if value is None: return NO_STRING
+        if value not in index: index[value] = len(strings); strings.append(value)
+        return index[value]
+    def integer(value, what):
+        if not isinstance(value, int) or isinstance(value, bool): raise ValueError(f"{path}: {what} must be an integer, got {value!r}")
+        return value
+
+    bg = src.get("background", {}); anim = src.get("enemy_anim"); siren = src.get("siren", {}); clear = src.get("clear", {})
+    grid = SpatialGrid()
+    meta = LEVEL_META.pack(integer(src.get("map_width", 5351), "map_width"),
+                           bool(siren.get("enabled", False)), float(siren.get("interval", 15.0)), float(siren.get("duration", 5.0)),
+                           grid.cell_size, string(bg.get("image")), string(bg.get("color", "#87CEEB")), string(bg.get("floor", "white")),
+                           string(anim and anim["right"]), string(anim and anim["left"]), anim["frames"] if anim else 0,
+                           string(clear.get("text", "STAGE CLEAR")), string(clear.get("color", "blue")), string(clear.get("bgm", "bgm_clear.mp3")))
+
+    rows = [LEVEL_COUNT.pack(len(src.get("map", [])))]
+    cells = {}
+    for i, row in enumerate(src.get("map", [])):
+        if row[0] not in MAP_TYPES or len(row) not in (5, 6): raise ValueError(f"{path}: map[{i}] must be [type, x, y, w, h(, color)], got {row!r}")
+        x, y, w, h = (integer(v, f"map[{i}]") for v in row[1:5])
+        rows.append(LEVEL_MAP_ROW.pack(MAP_TYPES.index(row[0]), x, y, w, h, string(row[5]) if len(row) == 6 else -1))
+        cx1, cy1, cx2, cy2 = grid.cell_range(x, y, x + w, y + h)
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1): cells.setdefault((cx, cy), []).append(i)
+
+    rows.append(LEVEL_COUNT.pack(len(src.get("enemies", []))))
+    for i, spawn in enumerate(src.get("enemies", [])):
+        flags = sum(bit for key, bit in ENEMY_FLAGS if spawn.get(key))
+        rows.append(LEVEL_ENEMY_ROW.pack(integer(spawn["x"], f"enemies[{i}].x"), integer(spawn["y"], f"enemies[{i}].y"),
+                                         integer(spawn.get("speed", 3), f"enemies[{i}].speed"), integer(spawn.get("hp", 1), f"enemies[{i}].hp"),
+                                         string(spawn.get("type", "mob")), flags))
+
+    spots = src.get("boss_spots", [])
+    rows.append(LEVEL_COUNT.pack(len(spots)))
+    rows += [LEVEL_SPOT_ROW.pack(integer(x, "boss_spots"), integer(y, "boss_spots")) for x, y in spots]
+
+    rows.append(LEVEL_COUNT.pack(len(cells)))
+    for (cx, cy), members in cells.items():
+        rows.append(LEVEL_CELL_ROW.pack(cx, cy, len(members)) + struct.pack(f"<{len(members)}H", *members))
+
+    table = [LEVEL_COUNT.pack(len(strings))]
+    for s in strings:
+        data = s.encode("utf-8"); table.append(LEVEL_COUNT.pack(len(data)) + data)
+    header = LEVEL_HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, stat.st_mtime_ns, stat.st_size)
+    return b"".join([header] + table + [meta] + rows)
+
+def read_level(data, name=None):
+    """바이너리 -> LevelData (맵 오브젝트 생성 + 격자 셀 목록 복원, JSON 파싱/검증 없음)"""
+    view = memoryview(data); pos = LEVEL_HEADER.size
+    def count():
+        nonlocal pos
+        n, = LEVEL_COUNT.unpack_from(view, pos); pos += LEVEL_COUNT.size
+        return n
+    def rows(fmt, n):
+        nonlocal pos
+        out = list(fmt.iter_unpack(view[pos:pos + fmt.size * n])); pos += fmt.size * n
+        return out
+
+    strings = []
+    for _ in range(count()):
+        n = count(); strings.append(str(view[pos:pos + n], "utf-8")); pos += n
+    def string(i): return None if i == NO_STRING else strings[i]
+
+    (map_width, siren_on, interval, duration, cell_size, bg_image, bg_color, floor_color,
+     anim_r, anim_l, frames, clear_text, clear_color, clear_bgm) = LEVEL_META.unpack_from(view, pos)
+    pos += LEVEL_META.size
+
+    objects = []
+    for kind, x, y, w, h, color in rows(LEVEL_MAP_ROW, count()):
+        cls = MAP_CLASSES[MAP_TYPES[kind]]
+        objects.append(cls(x, y, w, h) if color < 0 else cls(x, y, w, h, strings[color]))
+    enemies = [(x, y, speed, hp, strings[kind], bool(flags & 1), bool(flags & 2), bool(flags & 4))
+               for x, y, speed, hp, kind, flags in rows(LEVEL_ENEMY_ROW, count())]
+    spots = rows(LEVEL_SPOT_ROW, count())
+    cells = {}
+    for _ in range(count()):
+        cx, cy, n = LEVEL_CELL_ROW.unpack_from(view, pos); pos += LEVEL_CELL_ROW.size
+        cells[(cx, cy)] = struct.unpack_from(f"<{n}H", view, pos); pos += 2 * n
+
+    return LevelData(name, map_width, (string(bg_image), string(bg_color), string(floor_color)),
+                     (string(anim_r), string(anim_l), frames) if anim_r != NO_STRING else None,
+                     (siren_on, interval, duration), (string(clear_text), string(clear_color), string(clear_bgm)),
+                     objects, cells, cell_size, enemies, spots)
+
+def load_level(name):
+    """
+    Level Loader
+    - 프로세스 내 캐시 -> 바이너리 캐시(원본과 mtime/크기 일치 시) -> JSON 컴파일 순으로 사용
+    - 캐시 디렉터리에 쓸 수 없으면 메모리에서만 컴파일 결과 사용
+    """
+    level = _level_cache.get(name)
+    if level: return level
+    source, compiled = level_paths(name)
+    stat = os.stat(source)
+    data = None
+    try:
+        with open(compiled, "rb") as f: data = f.read()
+        magic, version, mtime_ns, size = LEVEL_HEADER.unpack_from(data)
+        if (magic, version, mtime_ns, size) != (LEVEL_MAGIC, LEVEL_VERSION, stat.st_mtime_ns, stat.st_size): data = None
+    except (OSError, struct.error): data = None
+    if data is None:
+        data = compile_level(source)
+        try:
+            os.makedirs(LEVEL_CACHE_DIR, exist_ok=True)
+            with open(compiled + ".tmp", "wb") as f: f.write(data)
+            os.replace(compiled + ".tmp", compiled)
+        except OSError as e: print(f"[Warning] Level cache not written: {compiled} ({e})")
+    level = _level_cache[name] = read_level(data, name)
+    return level
+
 
 # =============================================================================
-# [Scene: Core] Level Scene Base
-# - 게임플레이의 핵심 로직 (렌더링, 물리, 충돌, UI)
+# [Simulation] Level World (Headless Core)
+# - 스테이지의 게임 상태(플레이어, 적, 총알, 맵, 승패)와 고정 틱 로직 - Tk 없이 실행 가능
+# - LevelScene은 이 상태를 읽어 그리기만 하고, headless.py는 화면 없이 틱만 반복
+# - 소리/오버레이처럼 화면 쪽에서 처리할 일은 events 목록으로 전달 (소비 측에서 비움)
+#   ("sfx", 파일명) / ("bgm", 파일명) / ("map_added", obj) / ("map_removed", obj)
+#   ("enemy_removed", enemy) / ("enemy_hit", enemy) / ("boss", enemy 또는 None) / ("lives", 남은 목숨)
+#   ("enemy_sleep", enemy) / ("enemy_wake", enemy)
+#   ("game_over",) / ("stage_clear",)
+# - [HUD] 남은 몹 수(mobs_alive), 현재 보스(boss)는 적 추가/제거 시 증분 갱신 (매 틱/프레임 재집계 없음)
+# - [Culling] 활성 범위 밖에서 멈춘 적은 잠듦(sleeping) -> 갱신/그리기 목록(awake_enemies)에서 빠지고,
+#   카메라가 다가오면 sleeping 버킷 조회로 깨어남 (잠든 동안 상태가 변하지 않으므로 깨어날 때 따라잡을 물리 없음)
+# - [Determinism] 시각은 월드 전용 GameClock(frozen, 틱마다 step), 난수는 월드 전용 RNG(seed)
+#   -> 같은 seed + 같은 틱에 같은 키 입력이면 항상 같은 결과 (Replay 참고)
+# - [Reset] snapshot()/restore(): 재시도 시 새 월드를 만들지 않고 같은 객체들을 초기 상태로 되돌림
 # =============================================================================
-class LevelScene:
-    # [Inject] Game Manager dependency for global state (lives, transitions)
-    def __init__(self, window, manager):
-        self.window = window
-        self.manager = manager 
-        self.canvas = Canvas(self.window, bg="white", width=1280, height=720)
-        self.map_width = 5351; self.screen_width = 1280; self.world_x = 200; self.scroll_x = 0        
-        self.player = Player(self.canvas, 640, 715); self.pressed_keys = set() 
-        self.bullets = []; self.bullet_speed = 50; self.last_shot_time = 0
-        self.map_objects = []; self.bg_obj = None; self.floor_obj = None; self.is_bg_image = False
-        self.enemies = []; self.enemy_anim = None; self.game_over = False; self.stage_clear = False; self.score = 0
-        
+class LevelWorld:
+    LEVEL = None                                # levels/<LEVEL>.json (None: 빈 맵)
+    CLEAR_SIGNAL = "CLEARED"                    # Stage Clear 후 Enter 입력 시 Game_manager로 반환
+    SNAPSHOT_TYPES = (int, float, str, tuple, type(None)) # snapshot()이 값 그대로 저장하는 속성 (불변 값)
+
+    # [Inject] Game Manager (or any object with 'lives') for global state
+    def __init__(self, manager, seed=None):
+        self.manager = manager
+        self.seed = seed if seed is not None else random.randrange(1 << 32)
+        self.rng = random.Random(self.seed)
+        self.start_lives = manager.lives
+        self.clock = GameClock(frozen=True) # 시뮬레이션 시각 - tick()에서만 진행, 일시정지 시 함께 멈춤
+        self.input_log = []             # [Replay] (틱, 키 코드, 1=누름/0=뗌) - 해당 틱 실행 직전에 입력됨
+        self.level = level = load_level(self.LEVEL) if self.LEVEL else LevelData()
+        self.map_width = level.map_width; self.screen_width = 1280; self.world_x = 200; self.scroll_x = 0
+        self.prev_world_x = self.world_x; self.prev_scroll_x = self.scroll_x # [Interpolation] 직전 틱 상태
+        self.player = Player(640, 715, image_size(*PLAYER_SPRITE)); self.pressed_keys = set()
+        self.player.update_hitbox(self.world_x)
+        self.bullets = BulletPool(); self.bullet_speed = 50; self.last_shot_time = -1.0
+        self.bullet_collision = BULLET_COLLISION # "swept" | "step"
+        self.map_objects = list(level.map_objects)
+        self.map_index = level.build_index() # [Collision] 레벨 파일에 미리 계산된 격자 셀 사용
+        self.obstacle_cache = None     # [Collision] NumPy 총알 판정용 벽(유리 제외) 좌표 배열
+        self.map_rect_cache = None     # [Collision] NumPy 적 일괄 처리용 전체 맵 오브젝트 좌표 배열 (map_objects 순서)
+        self.enemy_store = EnemyStore() # [ECS] 적 상태 배열 (self.enemies는 같은 순서의 핸들 목록)
+        self.enemy_sweep = EnemySweep(self.enemy_store) # [Collision] 총알 -> 깨어있는 적 판정 broad phase (update_bullets마다 재정렬)
+        self.dormant_sweep = EnemySweep(self.enemy_store) # [Collision] 총알 -> 잠든 적 (잠들기/깨우기 때만 재정렬)
+        self.awake_enemies = []         # [Culling] 매 틱 갱신하는 적 (self.enemies 순서)
+        self.sleeping = EnemySleepIndex() # [Culling] 잠든 적
+        self.enemies = []; self.game_over = False; self.stage_clear = False; self.score = 0
+        self.enemy_size = image_size(level.enemy_anim[0], scale=6) if level.enemy_anim else None
+        self.data_size = image_size(*DATA_SPRITE)
+        self.events = []
+        self.mobs_alive = 0; self.boss = None # [HUD] add_enemy/remove_enemy가 갱신
+
         # [State] Retry Flag
         self.needs_retry = False
 
-        # Boss HUD
-        self.ui_boss_bg = None; self.ui_boss_bar = None; self.ui_boss_text = None
-        
-        # Main HUD (Enemies)
-        self.ui_enemy_shadow = self.canvas.create_text(32, 32, text="", font=("KOTRA_BOLD", 20), fill="black", anchor="nw")
-        self.ui_enemy_text = self.canvas.create_text(30, 30, text="", font=("KOTRA_BOLD", 20), fill="#00FF00", anchor="nw")
-        
-        # [New Feature] Life HUD (Hearts)
-        self.ui_life_shadow = self.canvas.create_text(32, 72, text="", font=("KOTRA_BOLD", 20), fill="black", anchor="nw")
-        self.ui_life_text = self.canvas.create_text(30, 70, text="", font=("KOTRA_BOLD", 20), fill="#FF4444", anchor="nw")
-
         # Siren Event System
-        self.siren_enabled = False; self.siren_active = False; self.siren_start_time = 0; self.last_siren_check = time.time() 
-        self.siren_interval = 15.0; self.siren_duration = 5.0        
-        self.siren_overlay = self.canvas.create_rectangle(0, 0, 1280, 720, fill="red", outline="", stipple="gray25", state='hidden')
-
-    def pack(self): self.canvas.pack(expand=True, fill=BOTH)
-    def unpack(self): self.canvas.pack_forget()
-
-    # [Logic] Unified Player Hit Handlerx
+        self.siren_enabled = level.siren_enabled; self.siren_active = False; self.siren_visible = False
+        self.siren_start_time = 0; self.last_siren_check = self.clock.time
+        self.siren_interval = level.siren_interval; self.siren_duration = level.siren_duration
+
+        # [Level] Enemy Spawning (레벨 파일 순서 = 업데이트/충돌 판정 순서)
+        self.boss_spots = level.boss_spots
+        for x, y, speed, hp, enemy_type, can_shoot, is_boss, is_system in level.enemies:
+            size = self.data_size if enemy_type == "data" else self.enemy_size
+            self.add_enemy(enemy_class(enemy_type, is_boss, is_system)(x, y, size, speed, hp, can_shoot))
+
+    @property
+    def ticks(self): return self.clock.ticks
+
+    def add_enemy(self, enemy):
+        if enemy.store is not self.enemy_store: self.enemy_store.adopt(enemy)
+        enemy.reset_timers(self.clock.time)
+        self.enemies.append(enemy); self.awake_enemies.append(enemy) # 새 행은 마지막 행 -> 순서 유지
+        if enemy.enemy_type != "data": self.mobs_alive += 1
+        if enemy.is_boss and self.boss is None: self.boss = enemy; self.events.append(("boss", enemy))
+        return enemy
+
+    def remove_enemy(self, enemy):
+        self.enemies.remove(enemy); self.enemy_store.alive[enemy.row] = 0
+        if not self.sleeping.discard(enemy): self.awake_enemies.remove(enemy)
+        if enemy.enemy_type != "data": self.mobs_alive -= 1
+        self.events.append(("enemy_removed", enemy))
+        if enemy is self.boss:
+            self.boss = next((e for e in self.enemies if e.is_boss), None)
+            self.events.append(("boss", self.boss))
+
+    # [Culling] Sleep / Wake
+    def sleep_enemies(self):
+        """이번 틱 비활성이었던 적 -> 잠듦 (다음 틱부터 갱신/그리기 목록에서 제외)"""
+        awake = self.awake_enemies
+        if all(enemy.is_active for enemy in awake): return
+        for enemy in awake:
+            if not enemy.is_active: self.sleeping.add(enemy); self.events.append(("enemy_sleep", enemy))
+        self.awake_enemies = [enemy for enemy in awake if enemy.is_active]
+        self.enemy_sweep.invalidate(); self.dormant_sweep.invalidate()
+
+    def wake_enemies(self, enemies):
+        """잠든 적을 갱신 목록으로 (행 순서 = self.enemies 순서로 끼워 넣음), 잠들지 않은 적은 무시"""
+        woken = [enemy for enemy in enemies if self.sleeping.discard(enemy)]
+        if not woken: return
+        self.awake_enemies = sorted(self.awake_enemies + woken, key=enemy_row)
+        for enemy in sorted(woken, key=enemy_row): self.events.append(("enemy_wake", enemy))
+        self.enemy_sweep.invalidate(); self.dormant_sweep.invalidate()
+
+    # [Collision] Spatial Index Management
+    def build_map_index(self):
+        """map_objects 전체로 격자 재구축 (레벨 파일로 만든 맵은 생성 시 미리 계산된 격자를 사용하므로 불필요)"""
+        self.map_index = SpatialGrid()
+        for obj in self.map_objects: self.map_index.insert(obj)
+        self.obstacle_cache = None; self.map_rect_cache = None
+
+    def add_map_object(self, obj):
+        self.map_objects.append(obj); self.map_index.insert(obj)
+        self.obstacle_cache = None; self.map_rect_cache = None
+        self.events.append(("map_added", obj))
+
+    def remove_map_object(self, obj):
+        if obj in self.map_objects: self.map_objects.remove(obj)
+        self.map_index.remove(obj)
+        self.obstacle_cache = None; self.map_rect_cache = None
+        self.events.append(("map_removed", obj))
+
+    # [Reset] Snapshot / Restore
+    def snapshot(self):
+        """
+        현재 상태 저장 (LevelScene이 스테이지 생성 직후 1회 호출)
+        - 월드/플레이어/적의 불변 값 속성은 그대로, 목록/격자는 얕은 복사 (맵 오브젝트는 정적이므로 참조만)
+        - 월드에 가변 컨테이너 속성을 추가하면 restore()에도 초기화를 추가할 것
+        """
+        grid = self.map_index
+        return {
+            "world": {k: v for k, v in vars(self).items() if isinstance(v, self.SNAPSHOT_TYPES)},
+            "clock": (self.clock.ticks, self.clock.time),
+            "player": slot_state(self.player),
+            "enemies": [(enemy, slot_state(enemy)) for enemy in self.enemies],
+            "enemy_store": self.enemy_store.snapshot(),
+            "map_objects": list(self.map_objects),
+            "grid": ({key: list(objs) for key, objs in grid.cells.items()}, dict(grid.order), grid.next_order),
+        }
+
+    def restore(self, snap, seed=None):
+        """
+        snapshot() 시점으로 제자리 복원 - 같은 seed/목숨으로 새로 만든 월드와 같은 상태 (state_hash 동일)
+        - seed: None이면 새로 뽑음 (생성자와 동일), 시작 목숨은 현재 manager.lives
+        - 적/플레이어 객체는 그대로 재사용 (LevelScene의 스프라이트 매핑 유지)
+        """
+        for k in [k for k, v in vars(self).items() if isinstance(v, self.SNAPSHOT_TYPES) and k not in snap["world"]]: delattr(self, k)
+        for k, v in snap["world"].items(): setattr(self, k, v)
+        self.seed = seed if seed is not None else random.randrange(1 << 32)
+        self.rng.seed(self.seed); self.start_lives = self.manager.lives
+        self.clock.ticks, self.clock.time = snap["clock"]
+        self.input_log.clear(); self.events.clear(); self.pressed_keys.clear()
+        load_slot_state(self.player, snap["player"])
+        self.enemies[:] = [enemy for enemy, _ in snap["enemies"]]
+        for enemy, state in snap["enemies"]: load_slot_state(enemy, state)
+        self.enemy_store.restore(snap["enemy_store"])
+        self.boss = next((e for e in self.enemies if e.is_boss), None) # mobs_alive는 값 속성이므로 위에서 복원됨
+        self.awake_enemies = list(self.enemies); self.sleeping.clear() # 모두 깨어난 상태로 시작 (첫 틱 뒤 다시 잠듦)
+        self.enemy_sweep.invalidate(); self.dormant_sweep.invalidate()
+        self.map_objects[:] = snap["map_objects"]
+        cells, order, next_order = snap["grid"]
+        self.map_index.cells = {key: list(objs) for key, objs in cells.items()}
+        self.map_index.order = dict(order); self.map_index.next_order = next_order
+        self.obstacle_cache = None; self.map_rect_cache = None
+        self.bullets.clear()
+
+    def obstacle_rects(self):
+        """총알을 막는 오브젝트(유리 제외)의 (x1, y1, x2, y2) 배열 - 맵 변경 시에만 재생성"""
+        if self.obstacle_cache is None:
+            rects = [obj.get_rect() for obj in self.map_objects if obj.type != "glass"]
+            self.obstacle_cache = tuple(np.array([r[i] for r in rects], dtype="float64") for i in range(4))
+        return self.obstacle_cache
+
+    def map_rects(self):
+        """적 이동/착지 판정용 전체 맵 오브젝트(유리 포함)의 (x1, y1, x2, y2) 배열 - map_objects(=격자 등록) 순서"""
+        if self.map_rect_cache is None:
+            rects = [obj.get_rect() for obj in self.map_objects]
+            self.map_rect_cache = tuple(np.array([r[i] for r in rects], dtype="float64") for i in range(4))
+        return self.map_rect_cache
+
+    # [Logic] Unified Player Hit Handler
     def hit_player(self):
         if self.game_over or self.needs_retry: return
 
-        self.whathitsound = random.randint(1, 100)
+        self.whathitsound = self.rng.randint(1, 100)
         if self.whathitsound < 95:
-            sound_mgr.play_sfx("sfx_player_hit.wav")
+            self.events.append(("sfx", "sfx_player_hit.wav"))
         else:
-            sound_mgr.play_sfx("sfx_player_hit_maybe.wav")
+            self.events.append(("sfx", "sfx_player_hit_maybe.wav"))
 
         # Life Decrement Logic
         if self.manager.lives > 1:
@@ -653,597 +2025,983 @@ class LevelScene:
         else:
             # Death
             self.manager.lives = 0
-            sound_mgr.play_bgm("bgm_gameover.mp3")
+            self.events.append(("bgm", "bgm_gameover.mp3"))
             self.game_over = True
-            draw_outlined_text(self.canvas, 640, 360, text="GAME OVER", font=("KOTRA_BOLD", 60, "bold"), fill_color="red", outline_color="white")
+            self.events.append(("game_over",))
+        self.events.append(("lives", self.manager.lives))
 
-    def display(self):
-        if self.game_over: return "GAME_OVER" 
+    def tick(self):
+        """
+        Simulation Step (Fixed Timestep)
+        - LevelScene(또는 헤드리스 러너)이 TICK_DT 간격으로 호출
+        - 반환값: "GAME_OVER" / "RETRY" / None
+        """
+        if self.game_over: return "GAME_OVER"
         if self.needs_retry: return "RETRY" # [Signal] Reset Request
         if self.stage_clear: return
 
+        now = self.clock.step()
+        t = profiler.begin()
+        self.prev_world_x = self.world_x; self.prev_scroll_x = self.scroll_x
+
         # [Physics] Player Movement & World Collision
         move_dir = self.player.get_move_dir(self.pressed_keys)
         if move_dir != 0:
             next_x = self.world_x + (move_dir * self.player.speed)
             if next_x < 20: next_x = 20
             if next_x > self.map_width - 20: next_x = self.map_width - 20
-            
+
             py_top = self.player.y - 40; py_bottom = self.player.y + 40
-            for obj in self.map_objects:
+            sweep_left = min(self.world_x, next_x) - 20; sweep_right = max(self.world_x, next_x) + 20
+            for obj in self.map_index.query(sweep_left, py_top, sweep_right, py_bottom):
                 ox1, oy1, ox2, oy2 = obj.get_rect()
                 if not (py_bottom < oy1 or py_top > oy2):
-                    if move_dir > 0: 
-                        if self.world_x + 20 <= ox1 and next_x + 20 > ox1: next_x = ox1 - 21 
-                    elif move_dir < 0: 
-                        if self.world_x - 20 >= ox2 and next_x - 20 < ox2: next_x = ox2 + 21 
+                    if move_dir > 0:
+                        if self.world_x + 20 <= ox1 and next_x + 20 > ox1: next_x = ox1 - 21
+                    elif move_dir < 0:
+                        if self.world_x - 20 >= ox2 and next_x - 20 < ox2: next_x = ox2 + 21
             self.world_x = next_x
 
-        self.player.update_physics(self.world_x, self.map_objects)
-        
-        # [Render] Camera Scroll Calculation
+        self.player.update_physics(self.world_x, self.map_index)
+        self.player.update_hitbox(self.world_x)
+
+        # [Camera] Scroll Calculation
         ideal_scroll = self.world_x - (self.screen_width // 2)
         max_scroll = self.map_width - self.screen_width
-        if ideal_scroll < 0: self.scroll_x = 0 
-        elif ideal_scroll > max_scroll: self.scroll_x = max_scroll 
-        else: self.scroll_x = ideal_scroll 
-        
-        # Parallax/Static Background
-        if self.bg_obj:
-            if self.is_bg_image: self.canvas.coords(self.bg_obj, (self.map_width // 2) - self.scroll_x, 360)
-            else: self.canvas.coords(self.bg_obj, 0 - self.scroll_x, 0, self.map_width - self.scroll_x, 720)
-        if self.floor_obj:
-            self.canvas.coords(self.floor_obj, 0 - self.scroll_x, 715, self.map_width - self.scroll_x, 720)
-        
-        for obj in self.map_objects: obj.draw(self.scroll_x)
-        
-        player_screen_x = self.world_x - self.scroll_x
-        self.player.set_screen_position(player_screen_x)
-        
-        # Update Sub-systems
-        self.update_enemies()
-        self.update_bullets()
-        self.update_boss_ui()
-        self.update_siren()
-        self.update_enemy_count()
-        self.update_life_ui() # HUD Update
+        if ideal_scroll < 0: self.scroll_x = 0
+        elif ideal_scroll > max_scroll: self.scroll_x = max_scroll
+        else: self.scroll_x = ideal_scroll
 
-    # [UI] Life Counter
-    def update_life_ui(self):
-        life_str = "♥ " * self.manager.lives
-        self.canvas.itemconfigure(self.ui_life_shadow, text=life_str)
-        self.canvas.itemconfigure(self.ui_life_text, text=life_str)
-        self.canvas.tag_raise(self.ui_life_shadow)
-        self.canvas.tag_raise(self.ui_life_text)
-
-    # (HUD Updates: Enemies, Boss Bar, Siren)
-    def update_enemy_count(self):
-        # Clean up HUD if stage clear
-        if self.stage_clear:
-            self.canvas.itemconfigure(self.ui_enemy_shadow, state='hidden')
-            self.canvas.itemconfigure(self.ui_enemy_text, state='hidden')
-            return
-
-        # Hide counter during Boss Fight
-        boss_exists = False
-        for e in self.enemies:
-            if e.is_boss: boss_exists = True; break
-        
-        if boss_exists:
-            self.canvas.itemconfigure(self.ui_enemy_shadow, state='hidden')
-            self.canvas.itemconfigure(self.ui_enemy_text, state='hidden')
-            return
+        self.player.set_screen_position(self.world_x - self.scroll_x)
+        t = profiler.lap("tick.player", t)
 
-        # Mob Counter
-        count = 0
-        for e in self.enemies:
-            if e.enemy_type != "data": count += 1
-            
-        display_text = f"REMAINING ENEMIES: {count}"
-        self.canvas.itemconfigure(self.ui_enemy_shadow, text=display_text, state='normal')
-        self.canvas.itemconfigure(self.ui_enemy_text, text=display_text, state='normal')
-        self.canvas.tag_raise(self.ui_enemy_shadow); self.canvas.tag_raise(self.ui_enemy_text)
-
-    def update_boss_ui(self):
-        boss = None
-        for e in self.enemies:
-            if e.is_boss: boss = e; break
-        if not boss:
-            if self.ui_boss_bg:
-                self.canvas.delete(self.ui_boss_bg); self.canvas.delete(self.ui_boss_bar); self.canvas.delete(self.ui_boss_text)
-                self.ui_boss_bg = None
-            return
-        bar_x = 340; bar_y = 50; bar_w = 600; bar_h = 25
-        ratio = boss.hp / boss.max_hp
-        current_w = bar_w * ratio
-        name = "최종보스 : 시스템" if boss.is_system else "중간보스 : 경비대장"
-        if self.ui_boss_bg is None:
-            self.ui_boss_bg = self.canvas.create_rectangle(bar_x, bar_y, bar_x + bar_w, bar_y + bar_h, fill="#000000", outline="white", width=2)
-            self.ui_boss_bar = self.canvas.create_rectangle(bar_x, bar_y, bar_x + current_w, bar_y + bar_h, fill="#FF0000", outline="")
-            self.ui_boss_text = self.canvas.create_text(640, bar_y - 15, text=f"{name} ({int(boss.hp)}/{boss.max_hp})", font=("KOTRA_BOLD", 15, "bold"), fill="red")
-        else:
-            self.canvas.coords(self.ui_boss_bar, bar_x, bar_y, bar_x + current_w, bar_y + bar_h)
-            self.canvas.itemconfigure(self.ui_boss_text, text=f"{name} ({int(boss.hp)}/{boss.max_hp})")
-            self.canvas.tag_raise(self.ui_boss_bg); self.canvas.tag_raise(self.ui_boss_bar); self.canvas.tag_raise(self.ui_boss_text)
+        # Update Sub-systems
+        self.update_enemies(now)
+        t = profiler.lap("tick.enemies", t)
+        self.update_bullets()
+        t = profiler.lap("tick.bullets", t)
+        self.update_siren(now)
+        profiler.lap("tick.siren", t)
 
-    def update_siren(self):
-        if not self.siren_enabled: return 
-        current_time = time.time()
+    def update_siren(self, current_time):
+        if not self.siren_enabled: return
         if not self.siren_active:
             if current_time - self.last_siren_check > self.siren_interval:
                 self.siren_active = True; self.siren_start_time = current_time
-                sound_mgr.play_sfx("sfx_siren.wav")
+                self.events.append(("sfx", "sfx_siren.wav"))
                 print("[지평론 연구소] 비상 상황, 비상 상황. 시설 내 신원 미상 인원의 침입이 확인되었습니다. 이것은 훈련이 아닙니다. 실제 상황입니다. 시설 내 모든 연구원은 즉시 표준 대응 절차에 따라 안전 구역으로 대피하십시오.")
         else:
             elapsed = current_time - self.siren_start_time
             if elapsed > self.siren_duration:
                 self.siren_active = False; self.last_siren_check = current_time
-                self.canvas.itemconfigure(self.siren_overlay, state='hidden')
+                self.siren_visible = False
             else:
-                if int(elapsed) % 2 == 0:
-                    self.canvas.itemconfigure(self.siren_overlay, state='normal'); self.canvas.tag_raise(self.siren_overlay)
-                    if self.ui_boss_bg: self.canvas.tag_raise(self.ui_boss_bg); self.canvas.tag_raise(self.ui_boss_bar); self.canvas.tag_raise(self.ui_boss_text)
-                    self.canvas.tag_raise(self.ui_enemy_shadow); self.canvas.tag_raise(self.ui_enemy_text)
-                    self.canvas.tag_raise(self.ui_life_shadow); self.canvas.tag_raise(self.ui_life_text) # Ensure Life HUD is visible
-                else: self.canvas.itemconfigure(self.siren_overlay, state='hidden')
-
-    def update_enemies(self):
+                self.siren_visible = int(elapsed) % 2 == 0 # 1초 간격 점멸
+
+    def update_enemies(self, now):
+        """
+        Enemy Systems (1 tick)
+        - 적 수가 ENEMY_BATCH_MIN 이상이고 NumPy가 있으면 연속된 일반 몹/데이터 구간을 update_enemy_batch로 일괄 처리
+          보스(KIND_SOLO) 행에서 구간을 나누어 객체별로 처리 -> 벽 소환/순간이동이 뒤의 적에게 주는 영향까지 기존 순서와 동일
+        - 플레이어가 피격되면 이번 틱의 나머지 적은 갱신하지 않음
+        - [Culling] 깨어있는 적만 순회: 활성 범위에 들어온 잠든 적을 먼저 깨우고, 틱이 끝나면 비활성 적을 재움
+          잠든 적의 몸통 충돌(마지막 충돌 박스)은 sleeping 조회로 판정 -> 닿은 적보다 뒤의 적은 갱신하지 않음 (전체 순회와 같은 결과)
+        """
         p_dbox = self.player.get_damage_box()
         active_min = self.scroll_x - 300; active_max = self.scroll_x + self.screen_width + 300
-        
-        for enemy in self.enemies:
-            is_active = (active_min <= enemy.world_x <= active_max)
-            enemy.update(self.world_x, self.map_objects, self.scroll_x, is_active)
-            
-            # AI: Combat Logic
-            if is_active and enemy.can_shoot and enemy.enemy_type != "data":
-                shoot_cooldown = 4.0
-                if enemy.is_system:
-                    shoot_cooldown = 4.0 
-                    if enemy.hp <= enemy.max_hp * 0.5: shoot_cooldown = 3.0 
-                    if enemy.hp <= enemy.max_hp * 0.5:
-                        # System Boss: Auto Teleport Phase
-                        if time.time() - enemy.last_teleport_auto > 10.0:
-                            if hasattr(self, 'teleport_system_boss'):
-                                self.teleport_system_boss(enemy)
-                                enemy.last_teleport_auto = time.time()
-                    if time.time() - enemy.last_shot_time > shoot_cooldown:
-                        bullet_count = 3 if enemy.hp <= enemy.max_hp * 0.5 else 1
-                        self.fire_enemy_bullet(enemy, aimed=True, count=bullet_count)
-                        enemy.last_shot_time = time.time()
-                else:
-                    if enemy.is_boss and enemy.hp <= 25: shoot_cooldown = 1.5
-                    if time.time() - enemy.last_shot_time > shoot_cooldown: 
-                        self.fire_enemy_bullet(enemy)
-                        enemy.last_shot_time = time.time()
-
-            # Boss Skill: Wall Summon
-            if is_active and enemy.is_boss and not enemy.is_system:
-                current_time = time.time()
-                if enemy.wall_obj is None:
-                    if current_time - enemy.last_wall_skill > 8.0:
-                        wall_x = enemy.world_x + (80 * enemy.facing)
-                        new_wall = Wall(self.canvas, x=wall_x, y=500, w=20, h=315, color="#4B0082")
-                        self.map_objects.append(new_wall); enemy.wall_obj = new_wall; enemy.wall_start_time = current_time
-                else:
-                    if current_time - enemy.wall_start_time > 3.0:
-                        if enemy.wall_obj in self.map_objects: self.map_objects.remove(enemy.wall_obj)
-                        self.canvas.delete(enemy.wall_obj.id); enemy.wall_obj = None; enemy.last_wall_skill = current_time 
-
-            # Collision: Player vs Enemy Body
-            e_dbox = enemy.get_damage_box()
-            if p_dbox and e_dbox:
-                if (p_dbox[0] < e_dbox[2] and p_dbox[2] > e_dbox[0] and p_dbox[1] < e_dbox[3] and p_dbox[3] > e_dbox[1]):
-                    if enemy.enemy_type == "data": continue 
-                    self.hit_player() 
-                    return
+        sleeping = self.sleeping; touched = None
+        if sleeping:
+            self.wake_enemies([e for e in sleeping.query(active_min, active_max) if active_min <= e.world_x <= active_max])
+            if p_dbox:
+                touched = min((e for e in sleeping.query(p_dbox[0], p_dbox[2]) if e.touch_damage and boxes_overlap(p_dbox, e.get_damage_box())),
+                              key=enemy_row, default=None)
+        awake = self.awake_enemies
+        if touched: awake = [enemy for enemy in awake if enemy.row < touched.row]
+
+        if np is None or len(awake) < ENEMY_BATCH_MIN:
+            for enemy in awake:
+                if self.update_enemy(enemy, now, p_dbox, active_min, active_max): return
+        else:
+            store = self.enemy_store
+            rows = np.fromiter((enemy.row for enemy in awake), dtype=np.intp, count=len(awake)); start = 0
+            for k in np.flatnonzero(store.view("kind")[rows] == EnemyStore.KIND_SOLO).tolist() + [len(rows)]:
+                if k > start and self.update_enemy_batch(rows[start:k], now, p_dbox, active_min, active_max): return
+                if k < len(rows) and self.update_enemy(store.handles[rows[k]], now, p_dbox, active_min, active_max): return
+                start = k + 1
+
+        if touched: self.hit_player(); return
+        self.sleep_enemies()
+
+    def update_enemy(self, enemy, now, p_dbox, active_min, active_max):
+        """객체별 처리: 이동/중력 -> AI(사격, 스킬) -> 몸통 충돌 (플레이어 피격 시 True)"""
+        is_active = (active_min <= enemy.world_x <= active_max)
+        enemy.update(self.world_x, self.map_index, is_active)
+        if is_active: enemy.think(self, now) # AI: Combat Logic / Boss Skill (행동 클래스별)
+
+        # Collision: Player vs Enemy Body
+        if not enemy.touch_damage: return False
+        e_dbox = enemy.get_damage_box()
+        if p_dbox and e_dbox:
+            if (p_dbox[0] < e_dbox[2] and p_dbox[2] > e_dbox[0] and p_dbox[1] < e_dbox[3] and p_dbox[3] > e_dbox[1]):
+                self.hit_player()
+                return True
+        return False
+
+    def update_enemy_batch(self, rows, now, p_dbox, active_min, active_max):
+        """
+        [NumPy] 일반 몹/데이터 구간 일괄 처리 - Mob/DataEnemy.update + think + 몸통 충돌과 같은 결과
+        - 적 x 맵 오브젝트 쌍을 (N x M) 배열로 한 번에 판정 (격자 조회 대신 map_rects, 첫 번째 착지 발판 = 등록 순서상 처음)
+        - 플레이어와 처음 닿은 적까지만 반영 (객체별 처리에서 그 뒤의 적은 갱신되지 않으므로)
+        """
+        s = self.enemy_store
+        X, Y, DY, FACING = s.view("world_x"), s.view("y"), s.view("dy"), s.view("facing")
+        HX1, HY1, HX2, HY2 = s.view("hx1"), s.view("hy1"), s.view("hx2"), s.view("hy2")
+        x = X[rows]; y = Y[rows]; dy = DY[rows]; facing = FACING[rows]
+        half_h = s.view("half_h")[rows]; w = s.view("sprite_w")[rows]; h = s.view("sprite_h")[rows]; kind = s.view("kind")[rows]
+        active = (active_min <= x) & (x <= active_max)
+        mob = active & (kind == EnemyStore.KIND_MOB)
+        ox1, oy1, ox2, oy2 = self.map_rects()
+        has_map = len(ox1) > 0
+
+        # System: Tracking AI (X-Axis) + Wall Collision
+        px = self.world_x
+        far = mob & (np.abs(x - px) > 5); toward = x < px
+        speed = s.view("speed")[rows]
+        next_x = x + np.where(far, np.where(toward, speed, -speed), 0)
+        facing = np.where(far, np.where(toward, 1, -1), facing)
+        if has_map:
+            top = (y - half_h)[:, None]; bottom = (y + half_h)[:, None]
+            blocked = (~((bottom <= oy1) | (top >= oy2)) & (next_x[:, None] + 20 > ox1) & (next_x[:, None] - 20 < ox2)).any(axis=1)
+            x = np.where(mob & ~blocked, next_x, x)
+        else: x = np.where(mob, next_x, x)
+
+        # System: Gravity + Floor/Platform Landing
+        prev_foot = y + half_h
+        new_dy = np.where(active, dy + Enemy.gravity, dy); new_y = np.where(active, y + new_dy, y)
+        curr_foot = new_y + half_h
+        floor = active & (curr_foot >= 715)
+        new_y = np.where(floor, 715 - half_h, new_y); new_dy = np.where(floor, 0.0, new_dy)
+        falling = active & ~floor & (new_dy >= 0)
+        if has_map and falling.any():
+            land = (falling[:, None] & (x[:, None] + 20 > ox1) & (x[:, None] - 20 < ox2)
+                    & (prev_foot[:, None] <= oy1 + 15) & (curr_foot[:, None] >= oy1))
+            landed = land.any(axis=1); first = land.argmax(axis=1)
+            new_y = np.where(landed, oy1[first] - half_h, new_y); new_dy = np.where(landed, 0.0, new_dy)
+
+        # System: Damage Box (활성 행만 갱신, 비활성 행은 이전 값 유지)
+        left = x - w // 2; top = new_y - h // 2
+        hx1 = np.where(active, left + 15, HX1[rows]); hy1 = np.where(active, top + 15, HY1[rows])
+        hx2 = np.where(active, left + w - 15, HX2[rows]); hy2 = np.where(active, top + h - 15, HY2[rows])
+
+        # System: Body Collision (비활성 적도 마지막 충돌 박스로 판정) -> 처음 닿은 적까지만 반영
+        n = len(rows); hit = False
+        if p_dbox:
+            touch = (kind == EnemyStore.KIND_MOB) & (p_dbox[0] < hx2) & (p_dbox[2] > hx1) & (p_dbox[1] < hy2) & (p_dbox[3] > hy1)
+            first_touch = int(touch.argmax())
+            if touch[first_touch]: n = first_touch + 1; hit = True
+        r = rows[:n]
+        s.view("prev_world_x")[r] = X[r]; s.view("prev_y")[r] = Y[r]; s.view("is_active")[r] = active[:n]
+        X[r] = x[:n]; Y[r] = new_y[:n]; DY[r] = new_dy[:n]; FACING[r] = facing[:n]
+        HX1[r] = hx1[:n]; HY1[r] = hy1[:n]; HX2[r] = hx2[:n]; HY2[r] = hy2[:n]
+
+        # System: Weapons (Mob.think와 같은 4초 쿨다운, 행 순서대로 발사)
+        armed = mob[:n] & s.view("can_shoot")[r] & (now - s.view("last_shot_time")[r] > 4.0)
+        for row in r[armed].tolist():
+            self.fire_enemy_bullet(s.handles[row]); s.last_shot_time[row] = now
+
+        if hit: self.hit_player()
+        return hit
+
+    def enemy_at(self, rect):
+        """rect와 겹치는 첫 번째 적 (self.enemies 순서) - 깨어있는 적/잠든 적 broad phase 중 앞선 행"""
+        awake, dormant = self.enemy_sweep, self.dormant_sweep
+        if not awake.valid: awake.build([enemy.row for enemy in self.awake_enemies])
+        enemy = awake.query(rect)
+        if not self.sleeping: return enemy
+        if not dormant.valid: dormant.build([e.row for e in self.sleeping])
+        sleeper = dormant.query(rect)
+        return sleeper if sleeper and (enemy is None or sleeper.row < enemy.row) else enemy
 
     def fire_enemy_bullet(self, enemy, aimed=False, count=1):
-        sound_mgr.play_sfx("sfx_shoot_enemy.wav")
+        self.events.append(("sfx", "sfx_shoot_enemy.wav"))
         bx = enemy.world_x; by = enemy.y
-        if aimed: 
-            px = self.player.x + self.scroll_x 
-            target_x = self.world_x 
+        if aimed:
+            target_x = self.world_x
             target_y = self.player.y
             angle = math.atan2(target_y - by, target_x - bx)
             speed = 15
             for i in range(count):
                 spread = 0
-                if count > 1: spread = (i - 1) * 0.2 
+                if count > 1: spread = (i - 1) * 0.2
                 final_angle = angle + spread
                 vx = math.cos(final_angle) * speed
                 vy = math.sin(final_angle) * speed
-                b_id = self.canvas.create_oval(0, 0, 0, 0, fill="cyan")
-                self.bullets.append({'id': b_id, 'world_x': bx, 'y': by, 'vx': vx, 'vy': vy, 'dir': 0, 'laps': 0, 'owner': 'enemy', 'aimed': True})
-        else: 
+                self.bullets.spawn(bx, by, vx, vy, BulletPool.OWNER_ENEMY, aimed=True)
+        else:
             dir = -1 if self.world_x < enemy.world_x else 1
-            b_id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
-            self.bullets.append({'id': b_id, 'world_x': bx, 'y': by, 'dir': dir, 'laps': 0, 'owner': 'enemy', 'aimed': False})
+            self.bullets.spawn(bx, by, 20 * dir, 0.0, BulletPool.OWNER_ENEMY)
 
-    def fire_bullet(self):
-        if time.time() - self.last_shot_time < 0.2: return
-        self.last_shot_time = time.time(); px, py = self.player.get_shoot_pos(); bx = self.world_x; by = py; facing = self.player.get_facing()
-        sound_mgr.play_sfx("sfx_shoot.wav")
-        b_id = self.canvas.create_oval(0, 0, 0, 0, fill="yellow")
-        self.bullets.append({'id': b_id, 'world_x': bx, 'y': by, 'dir': facing, 'laps': 0, 'owner': 'player'})
+    def fire_bullet(self, now):
+        if now - self.last_shot_time < 0.2: return
+        self.last_shot_time = now; px, py = self.player.get_shoot_pos(); bx = self.world_x; by = py; facing = self.player.get_facing()
+        self.events.append(("sfx", "sfx_shoot.wav"))
+        self.bullets.spawn(bx, by, self.bullet_speed * facing, 0.0, BulletPool.OWNER_PLAYER)
 
-    def update_bullets(self):
-        steps = 20
-        for b in self.bullets[:]:
-            collision = False
-            owner = b.get('owner', 'player') 
-            aimed = b.get('aimed', False)
-            step_speed_x = 0; step_speed_y = 0
-            if owner == 'enemy' and aimed:
-                step_speed_x = b['vx'] / steps
-                step_speed_y = b['vy'] / steps
+    def advance_bullet_stepped(self, i):
+        """
+        [A/B: "step"] 기존 방식 - 틱당 BULLET_SUBSTEPS 단계로 나누어 이동하며 매 단계 충돌 검사
+        - 단계 위치는 기준점 + k*단계 이동량 (누적 덧셈 오차 없음, 순간이동 시 기준점 재설정) -> "swept"와 같은 샘플 지점
+        """
+        bp = self.bullets; steps = BULLET_SUBSTEPS
+        is_player = bp.owner[i] == BulletPool.OWNER_PLAYER; aimed = bp.aimed[i]
+        step_speed_x = bp.vx[i] / steps; step_speed_y = bp.vy[i] / steps
+        base_x = x = bp.x[i]; base_y = y = bp.y[i]; k = 0; wrapped = False; collision = False
+        for n in range(1, steps + 1):
+            k += 1
+            x = base_x + step_speed_x * k
+            y = base_y + step_speed_y * n
+            screen_x = x - self.scroll_x
+
+            # World Boundary Check (Looping for Player Bullets)
+            if is_player:
+                if step_speed_x > 0 and screen_x > self.screen_width:
+                    base_x = x = self.scroll_x; k = 0; bp.laps[i] += 1; wrapped = True
+                elif step_speed_x < 0 and screen_x < 0:
+                    base_x = x = self.scroll_x + self.screen_width; k = 0; bp.laps[i] += 1; wrapped = True
             else:
-                current_speed = 20 if owner == 'enemy' else self.bullet_speed
-                step_speed_x = (current_speed / steps) * b.get('dir', 1)
-                step_speed_y = 0
-            for _ in range(steps):
-                b['world_x'] += step_speed_x
-                b['y'] += step_speed_y
-                screen_x = b['world_x'] - self.scroll_x
-                
-                # World Boundary Check (Looping for Player Bullets)
-                if owner == 'player':
-                    if b['dir'] == 1 and screen_x > self.screen_width: 
-                        b['world_x'] = self.scroll_x; b['laps'] += 1
-                    elif b['dir'] == -1 and screen_x < 0: 
-                        b['world_x'] = self.scroll_x + self.screen_width; b['laps'] += 1
-                else:
-                    if screen_x > self.screen_width + 100 or screen_x < -100 or b['y'] > 800 or b['y'] < -100:
-                        collision = True; break
-                
-                # Map Object Collision
-                if not (owner == 'enemy' and aimed):
-                    for obj in self.map_objects:
-                        if obj.type == "glass": continue 
-                        ox1, oy1, ox2, oy2 = obj.get_rect()
-                        if (ox1 < b['world_x'] < ox2) and (oy1 < b['y'] < oy2): collision = True; break
-                if collision: break
-            
-            if b['laps'] >= 2 or collision: self.canvas.delete(b['id']); self.bullets.remove(b); continue
+                if screen_x > self.screen_width + 100 or screen_x < -100 or y > 800 or y < -100:
+                    collision = True; break
             
+            # Map Object Collision
+            if not aimed:
+                for obj in self.map_index.query_point(x, y):
+                    if obj.type == "glass": continue 
+                    ox1, oy1, ox2, oy2 = obj.get_rect()
+                    if (ox1 < x < ox2) and (oy1 < y < oy2): collision = True; break
+                if collision: break
+        bp.x[i] = x; bp.y[i] = y
+        if wrapped: bp.prev_x[i] = x # Wrapped: 보간 없이 표시
+        return collision
+
+    def advance_bullet_swept(self, i):
+        """
+        [A/B: "swept"] Segment vs AABB
+        - 틱 이동 경로(x + k*step, k = 1..BULLET_SUBSTEPS)와 오브젝트의 교차를 해석적으로 계산
+        - 같은 샘플 지점을 판정하므로 "step" 방식과 동일한 충돌 결과를 보장
+        """
+        bp = self.bullets; steps = BULLET_SUBSTEPS
+        left_bound = self.scroll_x - 100; right_bound = self.scroll_x + self.screen_width + 100
+        x = bp.x[i]; y = bp.y[i]; s = bp.vx[i] / steps
+
+        # Enemy Aimed: 맵 충돌 없음, 직선 경로 + 볼록 영역이므로 첫/마지막 지점만 검사
+        if bp.owner[i] == BulletPool.OWNER_ENEMY and bp.aimed[i]:
+            sy = bp.vy[i] / steps
+            for k in (1, steps):
+                ex = x + s * k; ey = y + sy * k
+                if ex > right_bound or ex < left_bound or ey > 800 or ey < -100: return True
+            bp.x[i] = ex; bp.y[i] = ey
+            return False
+
+        # Enemy Straight: 화면 이탈(첫/마지막 지점) 또는 경로상 벽 충돌 시 소멸
+        if bp.owner[i] == BulletPool.OWNER_ENEMY:
+            for k in (1, steps):
+                if not (left_bound <= x + s * k <= right_bound) or y > 800 or y < -100: return True
+            if self.path_hits_map(x, s, 1, steps, y): return True
+            bp.x[i] = x + s * steps
+            return False
+
+        # Player: 화면 경계 통과 시 반대편으로 순간이동(lap), 남은 경로를 이어서 계산
+        wrap_bound = self.scroll_x + self.screen_width if s > 0 else self.scroll_x
+        wrap_base = self.scroll_x if s > 0 else self.scroll_x + self.screen_width
+        remaining = steps; k_lo = 1
+        while True:
+            k_wrap = first_step_past(x, s, wrap_bound)
+            k_end = min(k_wrap - 1, remaining)
+            if k_end >= k_lo and self.path_hits_map(x, s, k_lo, k_end, y): return True
+            if k_wrap > remaining:
+                bp.x[i] = x + s * remaining
+                if k_lo == 0: bp.prev_x[i] = bp.x[i] # Wrapped: 보간 없이 표시
+                return False
+            x = wrap_base; remaining -= k_wrap; k_lo = 0 # 순간이동 지점 자체도 판정
+            bp.laps[i] += 1
+            if bp.laps[i] >= 2: return False
+
+    def advance_bullets_batch(self, idx):
+        """
+        [NumPy] "swept" 판정을 활성 총알 전체에 배열 연산으로 일괄 적용
+        - 총알 x 벽 쌍을 (N x M) 배열로 한 번에 계산, 반환값은 소멸 여부 배열
+        - 틱당 이동량이 화면 폭보다 작다는 전제 (틱당 최대 1회 lap)
+        """
+        bp = self.bullets; steps = BULLET_SUBSTEPS
+        idx = np.asarray(idx)
+        x = bp.x[idx]; y = bp.y[idx]; sx = bp.vx[idx] / steps; sy = bp.vy[idx] / steps
+        is_player = bp.owner[idx] == BulletPool.OWNER_PLAYER; straight = ~bp.aimed[idx]
+        left_bound = self.scroll_x - 100; right_bound = self.scroll_x + self.screen_width + 100
+
+        # Enemy: 첫/마지막 지점 화면 이탈 검사
+        dead = np.zeros(len(idx), dtype=bool)
+        for k in (1, steps):
+            ex = x + sx * k; ey = y + sy * k
+            dead |= ~is_player & ((ex > right_bound) | (ex < left_bound) | (ey > 800) | (ey < -100))
+
+        # Player: 화면 경계 통과(lap) 지점
+        forward = sx > 0
+        wrap_bound = np.where(forward, self.scroll_x + self.screen_width, self.scroll_x)
+        wrap_base = np.where(forward, self.scroll_x, self.scroll_x + self.screen_width)
+        k_wrap = np.where(is_player, first_step_past_np(x, sx, wrap_bound, 1), steps + 1)
+        wrapped = k_wrap <= steps
+        remaining = np.where(wrapped, steps - k_wrap, 0)
+
+        # Map Collision: lap 이전 구간 + lap 이후 구간
+        rects = self.obstacle_rects()
+        hit = self.path_hits_map_np(x, sx, 1, np.minimum(k_wrap - 1, steps), y, rects)
+        hit |= wrapped & self.path_hits_map_np(wrap_base, sx, 0, remaining, y, rects)
+        dead |= straight & hit
+
+        laps = bp.laps[idx] + wrapped
+        dead |= laps >= 2
+        bp.laps[idx] = laps
+        bp.x[idx] = np.where(wrapped, wrap_base + sx * remaining, x + sx * steps)
+        bp.y[idx] = y + sy * steps
+        bp.prev_x[idx] = np.where(wrapped, bp.x[idx], bp.prev_x[idx]) # Wrapped: 보간 없이 표시
+        return dead
+
+    def path_hits_map(self, x, s, k_lo, k_hi, y):
+        """수평 경로 x + k*s (k_lo <= k <= k_hi) 중 한 지점이라도 벽(유리 제외) 내부에 있는지 판정"""
+        xa = x + s * k_lo; xb = x + s * k_hi
+        for obj in self.map_index.query(min(xa, xb), y, max(xa, xb), y):
+            if obj.type == "glass": continue
+            ox1, oy1, ox2, oy2 = obj.get_rect()
+            if not (oy1 < y < oy2): continue
+            if s > 0:
+                k = first_step_past(x, s, ox1, k_lo)
+                if k <= k_hi and x + s * k < ox2: return True
+            else:
+                k = first_step_past(x, s, ox2, k_lo)
+                if k <= k_hi and x + s * k > ox1: return True
+        return False
+
+    def path_hits_map_np(self, x, s, k_lo, k_hi, y, rects):
+        """path_hits_map의 NumPy 버전 - 총알(N) x 벽(M) 교차 여부를 한 번에 계산"""
+        ox1, oy1, ox2, oy2 = rects
+        if len(ox1) == 0: return np.zeros(len(x), dtype=bool)
+        X = x[:, None]; S = s[:, None]; Y = y[:, None]
+        k_lo = np.broadcast_to(k_lo, x.shape)[:, None]; k_hi = np.broadcast_to(k_hi, x.shape)[:, None]
+        forward = S > 0
+        k = first_step_past_np(X, S, np.where(forward, ox1, ox2), k_lo)
+        px = X + S * k
+        inside = np.where(forward, px < ox2, px > ox1)
+        return ((oy1 < Y) & (Y < oy2) & (k <= k_hi) & inside).any(axis=1)
+
+    def update_bullets(self):
+        bp = self.bullets
+        active = bp.active()
+        if not active: return
+        bp.save_prev(active)
+        self.enemy_sweep.invalidate() # 깨어있는 적 위치는 이번 틱 update_enemies 결과 -> 첫 질의 때 다시 정렬
+
+        # [Move & Map Collision] NumPy 사용 가능 시 일괄 처리, 아니면 슬롯별 처리
+        if self.bullet_collision == "swept" and np is not None and self.bullet_speed < self.screen_width:
+            dead = self.advance_bullets_batch(active).tolist()
+        else:
+            advance = self.advance_bullet_swept if self.bullet_collision == "swept" else self.advance_bullet_stepped
+            dead = [advance(i) or bp.laps[i] >= 2 for i in active]
+
+        for i, is_dead in zip(active, dead):
+            if is_dead: bp.kill(i); continue
+            owner = 'player' if bp.owner[i] == BulletPool.OWNER_PLAYER else 'enemy'
+            bx = bp.x[i]; by = bp.y[i]
+
             bullet_hit = False
-            b_screen_x = b['world_x'] - self.scroll_x
-            b_rect = (b_screen_x - 5, b['y'] - 5, b_screen_x + 5, b['y'] + 5)
-            
+            b_rect = (bx - 5, by - 5, bx + 5, by + 5) # World Space
+
             # [Hit Logic] Player Bullet -> Enemy
             if owner == 'player':
-                for enemy in self.enemies[:]:
-                    e_dbox = enemy.get_damage_box()
-                    if e_dbox:
-                        if (b_rect[0] < e_dbox[2] and b_rect[2] > e_dbox[0] and b_rect[1] < e_dbox[3] and b_rect[3] > e_dbox[1]):
-                            if enemy.enemy_type == "data":
-                                # Shield Logic: Mobs must be cleared first
-                                mobs_alive = 0
-                                for e in self.enemies:
-                                    if e.enemy_type == "mob" or e.is_boss: mobs_alive += 1
-                                if mobs_alive > 0:
-                                    print("쉴드! 적을 먼저 처치하세요.")
-                                    bullet_hit = True; break 
-                            
-                            enemy.hp -= 1
-                            sound_mgr.play_sfx("sfx_enemy_die.wav")
-                            
-                            if enemy.is_system:
-                                if hasattr(self, 'teleport_system_boss'): self.teleport_system_boss(enemy)
-                            
-                            if enemy.hp <= 0:
-                                enemy.delete(); self.enemies.remove(enemy); self.score += 500
-                            bullet_hit = True
-                            
-                            # [Stage Clear Condition]
-                            if len(self.enemies) == 0:
-                                self.stage_clear = True
-                                
-                                # System Boss Special Handling (No Clear BGM)
-                                is_system_stage = isinstance(self, SystemBossScene)
-                                
-                                if not is_system_stage:
-                                    sound_mgr.play_bgm("bgm_clear.mp3") 
-                                
-                                # UI Text
-                                if is_system_stage:
-                                    draw_outlined_text(self.canvas, 640, 300, text="SYSTEM SILENCED...", font=("KOTRA_BOLD", 70, "bold"), fill_color="gray", outline_color="white")
-                                else:
-                                    draw_outlined_text(self.canvas, 640, 300, text="STAGE CLEAR", font=("KOTRA_BOLD", 70, "bold"), fill_color="blue", outline_color="white")
-                                
-                                draw_outlined_text(self.canvas, 640, 450, text="[ Enter ]", font=("KOTRA_BOLD", 30), fill_color="white", outline_color="black")
-                            break
-            
+                enemy = self.enemy_at(b_rect)
+                if enemy:
+                    bullet_hit = True
+                    # Shield Logic: Mobs must be cleared first
+                    if enemy.enemy_type == "data" and self.mobs_alive > 0:
+                        print("쉴드! 적을 먼저 처치하세요.")
+                    else:
+                        enemy.hp -= 1
+                        self.events.append(("sfx", "sfx_enemy_die.wav")); self.events.append(("enemy_hit", enemy))
+
+                        if enemy.is_system:
+                            if hasattr(self, 'teleport_system_boss'): self.teleport_system_boss(enemy); self.enemy_sweep.invalidate()
+
+                        if enemy.hp <= 0:
+                            self.remove_enemy(enemy); self.score += 500
+
+                        # [Stage Clear Condition]
+                        if len(self.enemies) == 0:
+                            self.stage_clear = True
+                            if self.level.clear_bgm: self.events.append(("bgm", self.level.clear_bgm))
+                            self.events.append(("stage_clear",))
+
             # [Hit Logic] Enemy Bullet -> Player
             elif owner == 'enemy':
                 p_dbox = self.player.get_damage_box()
                 if p_dbox:
                     if (b_rect[0] < p_dbox[2] and b_rect[2] > p_dbox[0] and b_rect[1] < p_dbox[3] and b_rect[3] > p_dbox[1]):
-                        self.hit_player() 
+                        self.hit_player()
                         bullet_hit = True
-            
-            if bullet_hit: self.canvas.delete(b['id']); self.bullets.remove(b); continue
-            
-            # Bullet Rendering
-            screen_x = b['world_x'] - self.scroll_x; screen_y = b['y'] 
-            self.canvas.coords(b['id'], screen_x - 5, screen_y - 5, screen_x + 5, screen_y + 5)
-            if -50 < screen_x < self.screen_width + 50: self.canvas.itemconfigure(b['id'], state='normal')
-            else: self.canvas.itemconfigure(b['id'], state='hidden')
 
-    def keyPressHandler(self, event):
-        if self.game_over or self.stage_clear: return 
-        self.pressed_keys.add(event.keycode) 
-        if event.keycode == 32: self.player.jump(self.pressed_keys) 
-        if event.keycode == 65: self.fire_bullet() 
+            if bullet_hit: bp.kill(i)
 
-    def keyReleaseHandler(self, event):
-        if event.keycode in self.pressed_keys: self.pressed_keys.remove(event.keycode)
-        
-        if self.stage_clear and event.keycode == 13: 
-            # System Boss Special Return Signal
-            if isinstance(self, SystemBossScene):
-                return "SYSTEM_CLEARED"
-            return "CLEARED"
+    # [Input] 키 코드 단위 입력 (LevelScene 키 이벤트 / 헤드리스 봇 / 리플레이 공용)
+    def key_down(self, keycode):
+        self.input_log.append((self.ticks, keycode, 1))
+        if self.game_over or self.stage_clear: return
+        self.pressed_keys.add(keycode)
+        if keycode == 32: self.player.jump(self.pressed_keys)
+        if keycode == 65: self.fire_bullet(self.clock.time)
+
+    def key_up(self, keycode):
+        self.input_log.append((self.ticks, keycode, 0))
+        if keycode in self.pressed_keys: self.pressed_keys.remove(keycode)
+        if self.stage_clear and keycode == 13: return self.CLEAR_SIGNAL
         return -1
 
+    def state_hash(self):
+        """[Replay] 시뮬레이션 상태 요약 해시 (리플레이 재현 결과 비교용, float는 repr로 비트 단위 비교)"""
+        bp = self.bullets; p = self.player
+        state = [self.ticks, self.world_x, self.scroll_x, p.y, p.dy, self.score, self.manager.lives,
+                 self.game_over, self.stage_clear, self.needs_retry]
+        state += [(float(e.world_x), float(e.y), float(e.dy), int(e.hp)) for e in self.enemies] # EnemyStore 배열 값 -> NumPy 유무와 무관하게 같은 표현
+        state += [(float(bp.x[i]), float(bp.y[i]), int(bp.laps[i])) for i in bp.active()]
+        return hashlib.sha1(repr(state).encode()).hexdigest()
+
 
 # =============================================================================
-# [Levels] Concrete Stage Implementations
-# - Map Layout, Enemy Placement
+# [Scene: Core] Level Scene Base
+# - LevelWorld(시뮬레이션)를 캔버스에 그리는 렌더러 + 키 입력 전달 + 월드 이벤트 처리(소리, 오버레이)
+# - 하위 클래스는 WORLD(스테이지 월드)만 지정 - 배경/바닥 색상, 클리어 문구, 프리로드 리소스는 월드의 레벨 파일에서 읽음
 # =============================================================================
-class Stage1Scene(LevelScene):
-    def __init__(self, window, manager): 
-        super().__init__(window, manager) 
-        try:
-            self.bg_img = PhotoImage(file="image/stg1.png")
-            self.bg_obj = self.canvas.create_image(self.map_width//2, 360, image=self.bg_img)
-            self.is_bg_image = True 
-        except:
-            self.bg_obj = self.canvas.create_rectangle(0, 0, self.map_width, 720, fill="#87CEEB")
-            self.is_bg_image = False
-        self.floor_obj = self.canvas.create_rectangle(0, 715, self.map_width, 720, fill="white", outline="")
-        
-        # Map Objects Setup
-        self.map_objects.append(Glass(self.canvas, x=950, y=200, w=50, h=300))
-        self.map_objects.append(Glass(self.canvas, x=1250, y=200, w=50, h=300))
-        self.map_objects.append(Platform(self.canvas, x=800, y=500, w=500, h=20))
-        self.map_objects.append(Wall(self.canvas, x=1600, y=0, w=50, h=300)) 
-        self.map_objects.append(Wall(self.canvas, x=1800, y=500, w=50, h=215)) 
-        self.map_objects.append(Platform(self.canvas, x=2200, y=500, w=500, h=20)) 
-        self.map_objects.append(Platform(self.canvas, x=2200, y=300, w=500, h=20)) 
-        self.map_objects.append(Wall(self.canvas, x=2200, y=0, w=50, h=500)) 
-        self.map_objects.append(Glass(self.canvas, x=2450, y=0, w=50, h=500))  
-        self.map_objects.append(Platform(self.canvas, x=2700, y=200, w=400, h=20)) 
-        self.map_objects.append(Wall(self.canvas, x=3000, y=500, w=50, h=215,)) 
-        self.map_objects.append(Wall(self.canvas, x=3250, y=500, w=50, h=215,)) 
-        self.map_objects.append(Platform(self.canvas, x=3000, y=500, w=300, h=20)) 
-        self.map_objects.append(Wall(self.canvas, x=3200, y=0, w=50, h=200,)) 
-        self.map_objects.append(Platform(self.canvas, x=3200, y=200, w=300, h=20)) 
-        self.map_objects.append(Glass(self.canvas, x=3450, y=0, w=50, h=200,)) 
-        self.map_objects.append(Platform(self.canvas, x=3600, y=680, w=200, h=20)) 
-        self.map_objects.append(Platform(self.canvas, x=3800, y=600, w=200, h=20))
-        self.map_objects.append(Platform(self.canvas, x=4000, y=520, w=200, h=20)) 
-        self.map_objects.append(Platform(self.canvas, x=4200, y=440, w=200, h=20))
-        self.map_objects.append(Platform(self.canvas, x=4400, y=360, w=900, h=20)) 
-        self.map_objects.append(Wall(self.canvas, x=4800, y=0, w=50, h=360)) 
-
-        # Enemy Spawning
-        self.enemy_anim = {"walk_R": [], "walk_L": []}
-        self.enemy_anim["walk_R"] = load_gif_frames("image/char/enemy/e_walk_R.gif", 8, 6)
-        self.enemy_anim["walk_L"] = load_gif_frames("image/char/enemy/e_walk_L.gif", 8, 6)
-        
-        enemy_spots = [
-            (900, 650), (1200, 380), (2300, 380), (2300, 650), (2300, 200), (3150, 650), (3350, 100)  
-        ]
-        for ex, ey in enemy_spots: 
-            self.enemies.append(Enemy(self.canvas, ex, ey, self.enemy_anim))
-            
-        data_obj = Enemy(self.canvas, x=5000, y=200, anim_frames=self.enemy_anim, speed=0, hp=5, enemy_type="data")
-        self.enemies.append(data_obj)
-        self.canvas.tag_raise(self.player.obj)
+class LevelScene:
+    WORLD = LevelWorld
 
-        self.siren_enabled = True
+    # [Preload] 모든 스테이지 공통 리소스 (Player 스프라이트)
+    ASSETS = (gif_assets("image/char/player/walk_R.gif", 8, 6) + gif_assets("image/char/player/walk_L.gif", 8, 6) +
+              [PLAYER_SPRITE, image_asset("image/char/player/idle_0_L.png", scale=6)])
 
-class Stage2Scene(LevelScene):
-    def __init__(self, window, manager): 
-        super().__init__(window, manager) 
-        try:
-            self.bg_img = PhotoImage(file="image/stg2.png") 
-            self.bg_obj = self.canvas.create_image(self.map_width//2, 360, image=self.bg_img)
-            self.is_bg_image = True 
-        except:
-            self.bg_obj = self.canvas.create_rectangle(0, 0, self.map_width, 720, fill="#555")
-            self.is_bg_image = False
-        self.floor_obj = self.canvas.create_rectangle(0, 715, self.map_width, 720, fill="gray", outline="")
-        self.map_objects.append(Wall(self.canvas, x=500, y=500, w=50, h=215))
-        self.map_objects.append(Wall(self.canvas, x=800, y=500, w=50, h=215)) 
-        self.map_objects.append(Wall(self.canvas, x=1100, y=500, w=50, h=215))
-        self.map_objects.append(Platform(self.canvas, x=500, y=500, w=1800, h=20))
-        self.map_objects.append(Wall(self.canvas, x=1100, y=300, w=50, h=200))
-        self.map_objects.append(Wall(self.canvas, x=1400, y=300, w=50, h=200))
-        self.map_objects.append(Wall(self.canvas, x=1700, y=300, w=50, h=200))
-        self.map_objects.append(Platform(self.canvas, x=1100, y=300, w=650, h=20))
-        self.map_objects.append(Wall(self.canvas, x=3000, y=300, w=50, h=200))
-        self.map_objects.append(Wall(self.canvas, x=3300, y=300, w=50, h=200))
-        self.map_objects.append(Wall(self.canvas, x=3600, y=300, w=50, h=200))
-        self.map_objects.append(Platform(self.canvas, x=3000, y=300, w=650, h=20))
-        self.map_objects.append(Wall(self.canvas, x=3600, y=500, w=50, h=215))
-        self.map_objects.append(Wall(self.canvas, x=3900, y=500, w=50, h=215))
-        self.map_objects.append(Wall(self.canvas, x=4200, y=0, w=50, h=715))
-        self.map_objects.append(Platform(self.canvas, x=2400, y=500, w=1850, h=20))
-
-        self.enemy_anim = {"walk_R": [], "walk_L": []}
-        self.enemy_anim["walk_R"] = load_gif_frames("image/char/enemy/e_walk_R.gif", 8, 6)
-        self.enemy_anim["walk_L"] = load_gif_frames("image/char/enemy/e_walk_L.gif", 8, 6)
-        enemy_spots = [(650, 680), (950, 680), (1250, 450), (1550, 450), (3150, 450), (3450, 450), (3750, 680), (4050, 680)]
-        for ex, ey in enemy_spots: self.enemies.append(Enemy(self.canvas, ex, ey, self.enemy_anim))
-        
-        self.enemies.append(Enemy(self.canvas, x=700, y=450, anim_frames=self.enemy_anim, speed=8, hp=1, can_shoot=False))
-        self.enemies.append(Enemy(self.canvas, x=1350, y=150, anim_frames=self.enemy_anim, speed=8, hp=1, can_shoot=False))
-        self.enemies.append(Enemy(self.canvas, x=3200, y=150, anim_frames=self.enemy_anim, speed=8, hp=1, can_shoot=False))
-        self.enemies.append(Enemy(self.canvas, x=1600, y=680, anim_frames=self.enemy_anim, speed=1, hp=3, can_shoot=True))
-        self.enemies.append(Enemy(self.canvas, x=3000, y=680, anim_frames=self.enemy_anim, speed=1, hp=3, can_shoot=True))
-        data_obj = Enemy(self.canvas, x=2350, y=680, anim_frames=self.enemy_anim, speed=0, hp=5, enemy_type="data")
-        self.enemies.append(data_obj)
-        self.canvas.tag_raise(self.player.obj)
-
-        self.siren_enabled = True
-
-class StageMidBossScene(LevelScene):
-    def __init__(self, window, manager): 
-        super().__init__(window, manager) 
-        self.map_width = 1280 
+    @classmethod
+    def preload_assets(cls):
+        """[Preload] 공통 리소스 + 레벨 파일의 배경/적 리소스"""
+        return cls.ASSETS + (load_level(cls.WORLD.LEVEL).assets() if cls.WORLD.LEVEL else [])
+
+    # [Inject] Game Manager dependency for global state (lives, transitions)
+    def __init__(self, window, manager):
+        self.window = window
+        self.manager = manager
+        self.canvas = Canvas(self.window, bg="white", width=1280, height=720)
+        self.world = world = self.WORLD(manager)
+        level = world.level
+        self.item_pool = CanvasItemPool(self.canvas) # [Render] 총알, 소환 벽 재사용
+        self.texts = TextCache(self.canvas)          # [Render] 오버레이 문구 (GAME OVER, STAGE CLEAR, PAUSED)
+        self.view = RenderCache(self.canvas)         # [Render] 변경된 좌표/옵션만 Tk로 전송
+        self.hud_stack = None                        # [Render] HUD를 마지막으로 최상단에 올린 시점의 item_pool 할당 수
+        self.final_frame_drawn = False # Stage Clear 이후 화면 고정용
+        self.replay_saved = False      # [Replay] 자동 저장 1회 제한
+
+        # Background / Floor
         try:
-            self.bg_img = PhotoImage(file="image/stg_mid.png") 
-            self.bg_obj = self.canvas.create_image(640, 360, image=self.bg_img)
-            self.is_bg_image = True 
+            self.bg_img = asset_loader.photo(level.bg_image)
+            self.bg_obj = self.canvas.create_image(world.map_width//2, 360, image=self.bg_img)
+            self.is_bg_image = True
         except:
-            self.bg_obj = self.canvas.create_rectangle(0, 0, self.map_width, 720, fill="#440000") 
+            self.bg_obj = self.canvas.create_rectangle(0, 0, world.map_width, 720, fill=level.bg_color)
             self.is_bg_image = False
-        self.floor_obj = self.canvas.create_rectangle(0, 715, self.map_width, 720, fill="#880000", outline="")
-        self.map_objects.append(Platform(self.canvas, x=400, y=500, w=480, h=20, color="#8B0000")) 
+        self.floor_obj = self.canvas.create_rectangle(0, 715, world.map_width, 720, fill=level.floor_color, outline="")
+
+        # World Items: map object -> rect id, enemy -> Sprite, bullet slot -> (oval id, color)
+        self.map_items = {}
+        for obj in world.map_objects: self.map_items[obj] = self.create_map_item(obj)
+        self.enemy_anim = self.load_enemy_anim()
+        self.sprites = {enemy: self.create_enemy_sprite(enemy) for enemy in world.enemies}
+        self.hidden_sprites = {}       # 제거된 적 -> 숨긴 Sprite (restore() 시 다시 표시)
+        self.bullet_items = {}
+        self.player_sprite = self.create_player_sprite()
+
+        # Boss HUD
+        self.ui_boss_bg = None; self.ui_boss_bar = None; self.ui_boss_text = None
 
-        self.enemy_anim = {"walk_R": [], "walk_L": []}
-        self.enemy_anim["walk_R"] = load_gif_frames("image/char/antagonist/b_walk_R.gif", 8, 6) 
-        self.enemy_anim["walk_L"] = load_gif_frames("image/char/antagonist/b_walk_L.gif", 8, 6)
+        # Main HUD (Enemies)
+        self.ui_enemy_shadow = self.canvas.create_text(32, 32, text="", font=("KOTRA_BOLD", 20), fill="black", anchor="nw")
+        self.ui_enemy_text = self.canvas.create_text(30, 30, text="", font=("KOTRA_BOLD", 20), fill="#00FF00", anchor="nw")
 
-        # Spawn Mid-Boss
-        boss = Enemy(self.canvas, x=1000, y=680, anim_frames=self.enemy_anim, speed=8, hp=50, can_shoot=True, is_boss=True)
-        self.enemies.append(boss)
-        self.canvas.tag_raise(self.player.obj)
+        # [New Feature] Life HUD (Hearts)
+        self.ui_life_shadow = self.canvas.create_text(32, 72, text="", font=("KOTRA_BOLD", 20), fill="black", anchor="nw")
+        self.ui_life_text = self.canvas.create_text(30, 70, text="", font=("KOTRA_BOLD", 20), fill="#FF4444", anchor="nw")
 
-class Stage3Scene(LevelScene):
-    def __init__(self, window, manager): 
-        super().__init__(window, manager) 
+        # Siren Overlay
+        self.siren_overlay = self.canvas.create_rectangle(0, 0, 1280, 720, fill="red", outline="", stipple="gray25", state='hidden')
+        self.profiler_text = None # [Debug] F3 오버레이 (처음 켤 때 생성)
+        self.refresh_hud()
+        self.initial = world.snapshot() # [Reset] 재시도 시 restore()로 되돌릴 시작 상태
+
+    def pack(self): self.refresh_hud(); self.canvas.pack(expand=True, fill=BOTH) # 상주 중 Game_manager가 바꾼 목숨 반영
+    def unpack(self): self.canvas.pack_forget()
+
+    def destroy(self):
+        """[Lifecycle] 캔버스 해제 + 아이템/이미지/월드 참조 정리 (SceneRegistry.evict에서 호출)"""
+        self.canvas.destroy()
+        self.map_items.clear(); self.sprites.clear(); self.hidden_sprites.clear(); self.bullet_items.clear()
+        self.enemy_anim = None; self.player_sprite = None; self.bg_img = None
+        self.item_pool = None; self.texts = None; self.view = None; self.world = None; self.initial = None
+
+    # [Render] Item Creation
+    def create_map_item(self, obj, pool=None):
+        if pool: item = pool.acquire("rectangle", fill=obj.color, outline="black")
+        else: item = self.canvas.create_rectangle(0, 0, 0, 0, fill=obj.color, outline="black")
+        if obj.type == "glass": self.canvas.itemconfigure(item, stipple="gray50")
+        return item
+
+    def create_player_sprite(self):
+        scale_factor = 6
+        anim = { "idle_R": [], "idle_L": [], "walk_R": [], "walk_L": [] }
         try:
-            self.bg_img = PhotoImage(file="image/stg3.png") 
-            self.bg_obj = self.canvas.create_image(self.map_width//2, 360, image=self.bg_img)
-            self.is_bg_image = True 
-        except:
-            self.bg_obj = self.canvas.create_rectangle(0, 0, self.map_width, 720, fill="#555")
-            self.is_bg_image = False
-        self.floor_obj = self.canvas.create_rectangle(0, 715, self.map_width, 720, fill="#555555", outline="")
-        self.map_objects.append(Platform(self.canvas, x=600, y=500, w=500, h=20))
-        
-        
-        self.map_objects.append(Wall(self.canvas, x=1200, y=300, w=50, h=200)) 
-        self.map_objects.append(Glass(self.canvas, x=1200, y=500, w=50, h=215))
-        self.map_objects.append(Wall(self.canvas, x=1500, y=300, w=50, h=415))
-        self.map_objects.append(Platform(self.canvas, x=1200, y=300, w=300, h=20))
-        self.map_objects.append(Platform(self.canvas, x=1200, y=500, w=300, h=20))
+            anim["walk_R"] = load_gif_frames("image/char/player/walk_R.gif", 8, scale_factor)
+            anim["walk_L"] = load_gif_frames("image/char/player/walk_L.gif", 8, scale_factor)
+            idle_r = asset_loader.photo("image/char/player/idle_0.png", scale=scale_factor)
+            idle_l = asset_loader.photo("image/char/player/idle_0_L.png", scale=scale_factor)
+            anim["idle_R"] = [idle_r]; anim["idle_L"] = [idle_l]
+        except: print("[Warning] Player sprite load failed, using fallback.")
+
+        p = self.world.player
+        current_frame = anim["idle_R"][0] if anim["idle_R"] else None
+        if current_frame: obj = self.canvas.create_image(p.x, p.y, image=current_frame)
+        else: obj = self.canvas.create_rectangle(p.x-20, p.y-40, p.x+20, p.y+40, fill="blue")
+        return Sprite(self.canvas, obj, anim, interval=0.05)
+
+    def load_enemy_anim(self):
+        anim = {"walk_R": [], "walk_L": []}
+        if not self.world.level.enemy_anim: return anim
+        path_r, path_l, frame_count = self.world.level.enemy_anim
+        anim["walk_R"] = load_gif_frames(path_r, frame_count, 6)
+        anim["walk_L"] = load_gif_frames(path_l, frame_count, 6)
+        return anim
+
+    def create_enemy_sprite(self, enemy):
+        # Init: Data Type Handling
+        if enemy.enemy_type == "data":
+            try:
+                data_img = asset_loader.photo(DATA_SPRITE[0])
+                sprite = Sprite(self.canvas, self.canvas.create_image(enemy.world_x, enemy.y, image=data_img))
+                sprite.image = data_img
+            except:
+                obj = self.canvas.create_rectangle(0, 0, 60, 60, fill="blue", outline="white", width=2)
+                text_id = self.canvas.create_text(0, 0, text="DATA", fill="white", font=("KOTRA_BOLD", 10))
+                sprite = Sprite(self.canvas, obj, text_id=text_id)
+            return sprite
+        current_frame = self.enemy_anim["walk_R"][0] if (self.enemy_anim["walk_R"] and self.enemy_anim["walk_R"][0]) else None
+        if current_frame:
+            return Sprite(self.canvas, self.canvas.create_image(enemy.world_x, enemy.y, image=current_frame), self.enemy_anim)
+        color = "red" if enemy.is_boss else "green"
+        if enemy.is_system: color = "cyan"
+        return Sprite(self.canvas, self.canvas.create_rectangle(0,0,40,40, fill=color))
+
+    def restore(self):
+        """
+        [Reset] In-place Retry
+        - 월드를 시작 상태로 되돌리고 캔버스 아이템은 재사용 (캔버스/배경/스프라이트를 새로 만들지 않음)
+        - 소환 벽, 총알은 item_pool로 반납, 오버레이 문구는 숨김, 제거됐던 적 스프라이트는 다시 표시
+        """
+        world = self.world
+        world.restore(self.initial)
+        current = set(world.map_objects)
+        for obj in [obj for obj in self.map_items if obj not in current]:
+            item = self.map_items.pop(obj); self.view.forget(item); self.item_pool.release(item)
+        for obj in world.map_objects:
+            if obj not in self.map_items: self.map_items[obj] = self.create_map_item(obj, pool=self.item_pool)
+        for enemy in world.enemies:
+            sprite = self.sprites.get(enemy)
+            if sprite is None: sprite = self.sprites[enemy] = self.hidden_sprites.pop(enemy, None) or self.create_enemy_sprite(enemy)
+            sprite.show(self.view, True); sprite.reset() # 제거됐거나 잠들어 숨긴 스프라이트 (복원된 월드는 모두 깨어있음)
+        self.player_sprite.reset()
+        for item, _ in self.bullet_items.values(): self.view.forget(item); self.item_pool.release(item)
+        self.bullet_items.clear()
+        self.texts.hide("overlay")
+        self.final_frame_drawn = False; self.replay_saved = False; self.hud_stack = None
+        self.refresh_hud()
+
+    def tick(self):
+        """Simulation Step - LevelWorld 1틱 실행 후 발생한 이벤트(소리, 맵 변경, 오버레이) 처리"""
+        result = self.world.tick()
+        self.handle_events()
+        if REPLAY_AUTOSAVE and not self.replay_saved and (result or self.world.stage_clear):
+            self.replay_saved = True
+            print(f"[Replay] Saved: {save_replay(self.world)}")
+        return result
+
+    def handle_events(self):
+        for event in self.world.events:
+            kind = event[0]
+            if kind == "sfx": sound_mgr.play_sfx(event[1])
+            elif kind == "bgm": sound_mgr.play_bgm(event[1])
+            elif kind == "map_added": self.map_items[event[1]] = self.create_map_item(event[1], pool=self.item_pool)
+            elif kind == "map_removed":
+                item = self.map_items.pop(event[1], None)
+                if item: self.view.forget(item); self.item_pool.release(item)
+            elif kind == "enemy_removed":
+                sprite = self.sprites.pop(event[1], None)
+                if sprite: sprite.show(self.view, False); self.hidden_sprites[event[1]] = sprite
+                self.update_enemy_count()
+            elif kind == "enemy_sleep": self.sprites[event[1]].show(self.view, False) # 위치 갱신 대신 숨김
+            elif kind == "enemy_wake": self.sprites[event[1]].show(self.view, True)
+            elif kind == "enemy_hit":
+                if event[1] is self.world.boss: self.update_boss_ui()
+            elif kind == "boss": self.update_boss_ui(); self.update_enemy_count()
+            elif kind == "lives": self.update_life_ui()
+            elif kind == "game_over":
+                self.texts.show(640, 360, text="GAME OVER", font=("KOTRA_BOLD", 60, "bold"), fill_color="red", outline_color="white", tags="overlay")
+                self.hud_stack = None
+            elif kind == "stage_clear":
+                text, color = self.world.level.clear_text, self.world.level.clear_color
+                self.texts.show(640, 300, text=text, font=("KOTRA_BOLD", 70, "bold"), fill_color=color, outline_color="white", tags="overlay")
+                self.texts.show(640, 450, text="[ Enter ]", font=("KOTRA_BOLD", 30), fill_color="white", outline_color="black", tags="overlay")
+                self.update_enemy_count(); self.hud_stack = None
+        self.world.events.clear()
+
+    def render(self, alpha=1.0):
+        """
+        Render Step
+        - alpha: 직전 틱 ~ 현재 틱 사이의 진행 비율 (0.0 ~ 1.0), 위치를 보간하여 표시
+        - 시뮬레이션 상태는 읽기만 하므로 틱 사이에 여러 번 호출되어도 안전
+        """
+        world = self.world
+        if world.game_over: return
+        if self.final_frame_drawn: return # Stage Clear: 마지막 화면 유지
+        if world.stage_clear: alpha = 1.0; self.final_frame_drawn = True
+
+        t = profiler.begin()
+        scroll_x = lerp(world.prev_scroll_x, world.scroll_x, alpha)
+        view = self.view
+        view.scroll_world(scroll_x) # 월드 레이어 전체를 스크롤 변화량만큼 한 번에 이동
+
+        # Static World: 첫 프레임(또는 새로 추가된 오브젝트)에만 배치
+        if self.is_bg_image: view.world_coords(self.bg_obj, world.map_width // 2, 360)
+        else: view.world_coords(self.bg_obj, 0, 0, world.map_width, 720)
+        view.world_coords(self.floor_obj, 0, 715, world.map_width, 720)
+        for obj, item in self.map_items.items(): view.world_coords(item, *obj.rect)
+
+        now = world.clock.at(alpha) # 애니메이션 시각 (일시정지/배속을 따름)
+        player = world.player
+        player_screen_x = lerp(world.prev_world_x, world.world_x, alpha) - scroll_x
+        view.coords(self.player_sprite.obj, player_screen_x, lerp(player.prev_y, player.y, alpha))
+        self.player_sprite.animate(player.get_anim_key(), now)
+
+        for enemy in world.awake_enemies: self.draw_enemy(enemy, alpha, now) # 잠든 적은 enemy_sleep 이벤트 때 숨김
+        self.draw_bullets(scroll_x, alpha)
+        t = profiler.lap("render.world", t)
+
+        # Siren: 숨김 -> 표시로 바뀔 때만 오버레이와 HUD(Life 포함)를 최상단으로
+        if view.config(self.siren_overlay, state='normal' if world.siren_visible else 'hidden') and world.siren_visible:
+            self.canvas.tag_raise(self.siren_overlay); self.raise_hud()
+
+        # HUD: 값 변경은 handle_events에서 이벤트 단위로 반영 (여기서는 F3 오버레이와 쌓임 순서만)
+        self.draw_profiler()
+        # 새 아이템이 HUD 위에 생겼을 때만 HUD를 다시 최상단으로 (item_pool 할당 수로 판별)
+        stack = self.item_pool.created + self.item_pool.reused
+        if stack != self.hud_stack: self.raise_hud(); self.hud_stack = stack
+        profiler.lap("render.hud", t)
+
+    def draw_profiler(self):
+        """[Debug] F3 프로파일러 오버레이 (요약 문자열이 바뀔 때만 Tk 갱신)"""
+        if not profiler.overlay:
+            if self.profiler_text: self.view.config(self.profiler_text, state='hidden')
+            return
+        if self.profiler_text is None:
+            self.profiler_text = self.canvas.create_text(1270, 10, text="", font=("Consolas", 11), fill="#00FF00", anchor="ne", justify="left")
+            self.hud_stack = None
+        self.view.config(self.profiler_text, text=profiler.text, state='normal')
+
+    def draw_enemy(self, enemy, alpha, now):
+        """직전 틱과 현재 틱 사이를 alpha 비율로 보간하여 월드 레이어에 배치 (정지 상태면 Tcl 호출 없음)"""
+        sprite = self.sprites[enemy]
+        world_x = lerp(enemy.prev_world_x, enemy.world_x, alpha)
+        world_y = lerp(enemy.prev_y, enemy.y, alpha)
 
-        self.map_objects.append(Platform(self.canvas, x=2000, y=300, w=400, h=20))
-        self.map_objects.append(Platform(self.canvas, x=2000, y=500, w=400, h=20))
-        self.map_objects.append(Platform(self.canvas, x=2500, y=300, w=500, h=20))
-        self.map_objects.append(Platform(self.canvas, x=2500, y=500, w=500, h=20))
+        # Render: Data Type
+        if enemy.enemy_type == "data":
+            if sprite.text_id:
+                self.view.world_coords(sprite.obj, world_x - 30, world_y - 30, world_x + 30, world_y + 30)
+                self.view.world_coords(sprite.text_id, world_x, world_y)
+            else: self.view.world_coords(sprite.obj, world_x, world_y)
+        # Render: Mobs/Bosses
+        else:
+            self.view.world_coords(sprite.obj, world_x, world_y)
+            if enemy.is_active: sprite.animate(enemy.get_anim_key(), now)
 
-        self.map_objects.append(Wall(self.canvas, x=2500, y=300, w=50, h=200))
+    def raise_hud(self):
+        if self.ui_boss_bg: self.canvas.tag_raise(self.ui_boss_bg); self.canvas.tag_raise(self.ui_boss_bar); self.canvas.tag_raise(self.ui_boss_text)
+        self.canvas.tag_raise(self.ui_enemy_shadow); self.canvas.tag_raise(self.ui_enemy_text)
+        self.canvas.tag_raise(self.ui_life_shadow); self.canvas.tag_raise(self.ui_life_text)
+        if self.profiler_text: self.canvas.tag_raise(self.profiler_text)
 
-        self.map_objects.append(Glass(self.canvas, x=2700, y=0, w=50, h=715)) 
-        self.map_objects.append(Wall(self.canvas, x=2950, y=0, w=50, h=715))
-        
-        self.map_objects.append(Glass(self.canvas, x=4500, y=0, w=50, h=715))
+    # [UI] HUD Updates
+    # - 월드 이벤트(enemy_removed, enemy_hit, boss, lives, stage_clear)가 있을 때만 호출, 월드의 증분 카운터를 읽음
+    # - refresh_hud(): 생성/복원/씬 진입 시 전체 동기화
+    def refresh_hud(self):
+        self.update_boss_ui(); self.update_enemy_count(); self.update_life_ui()
 
-        
-        
-        self.enemy_anim = {"walk_R": [], "walk_L": []}
-        self.enemy_anim["walk_R"] = load_gif_frames("image/char/enemy/es_walk_R.gif", 8, 6)
-        self.enemy_anim["walk_L"] = load_gif_frames("image/char/enemy/es_walk_L.gif", 8, 6)
+    def update_life_ui(self):
+        life_str = "♥ " * self.manager.lives
+        self.view.config(self.ui_life_shadow, text=life_str)
+        self.view.config(self.ui_life_text, text=life_str)
+
+    def update_enemy_count(self):
+        # Clean up HUD if stage clear / Hide counter during Boss Fight
+        if self.world.stage_clear or self.world.boss:
+            self.view.config(self.ui_enemy_shadow, state='hidden')
+            self.view.config(self.ui_enemy_text, state='hidden')
+            return
+
+        # Mob Counter
+        display_text = f"REMAINING ENEMIES: {self.world.mobs_alive}"
+        self.view.config(self.ui_enemy_shadow, text=display_text, state='normal')
+        self.view.config(self.ui_enemy_text, text=display_text, state='normal')
+
+    def update_boss_ui(self):
+        boss = self.world.boss
+        if not boss:
+            if self.ui_boss_bg:
+                for item in (self.ui_boss_bg, self.ui_boss_bar, self.ui_boss_text): self.view.forget(item); self.canvas.delete(item)
+                self.ui_boss_bg = None
+            return
+        bar_x = 340; bar_y = 50; bar_w = 600; bar_h = 25
+        ratio = boss.hp / boss.max_hp
+        current_w = bar_w * ratio
+        name = "최종보스 : 시스템" if boss.is_system else "중간보스 : 경비대장"
+        if self.ui_boss_bg is None:
+            self.ui_boss_bg = self.canvas.create_rectangle(bar_x, bar_y, bar_x + bar_w, bar_y + bar_h, fill="#000000", outline="white", width=2)
+            self.ui_boss_bar = self.canvas.create_rectangle(bar_x, bar_y, bar_x + current_w, bar_y + bar_h, fill="#FF0000", outline="")
+            self.ui_boss_text = self.canvas.create_text(640, bar_y - 15, text=f"{name} ({int(boss.hp)}/{boss.max_hp})", font=("KOTRA_BOLD", 15, "bold"), fill="red")
+            self.hud_stack = None
+        else:
+            self.view.coords(self.ui_boss_bar, bar_x, bar_y, bar_x + current_w, bar_y + bar_h)
+            self.view.config(self.ui_boss_text, text=f"{name} ({int(boss.hp)}/{boss.max_hp})")
+
+    def draw_bullets(self, scroll_x, alpha=1.0):
+        """Render: 죽은 슬롯의 oval은 item_pool로 반납, 살아있는 슬롯은 item_pool에서 재사용"""
+        bp = self.world.bullets; items = self.bullet_items
+        for i in [i for i in items if not bp.alive[i]]:
+            item = items.pop(i)[0]; self.view.forget(item); self.item_pool.release(item)
+        for i in bp.active():
+            if bp.owner[i] == BulletPool.OWNER_PLAYER: color = "yellow"
+            else: color = "cyan" if bp.aimed[i] else "red"
+            entry = items.get(i)
+            if entry is None: entry = items[i] = (self.item_pool.acquire("oval", fill=color), color)
+            elif entry[1] != color: self.canvas.itemconfigure(entry[0], fill=color); entry = items[i] = (entry[0], color)
+            world_x = lerp(bp.prev_x[i], bp.x[i], alpha); world_y = lerp(bp.prev_y[i], bp.y[i], alpha)
+            self.view.world_coords(entry[0], world_x - 5, world_y - 5, world_x + 5, world_y + 5)
+            screen_x = world_x - scroll_x
+            self.view.config(entry[0], state='normal' if -50 < screen_x < self.world.screen_width + 50 else 'hidden')
+
+    def show_pause(self, paused):
+        """[UI] Pause Overlay (Game_manager가 clock 일시정지 시 호출)"""
+        if paused: self.texts.show(640, 360, text="PAUSED", font=("KOTRA_BOLD", 60, "bold"), fill_color="white", outline_color="black", tags="pause")
+        else: self.texts.hide("pause")
+
+    def keyPressHandler(self, event):
+        if event.keycode == 113: print(f"[Debug] {self.item_pool} {self.texts} {self.view}") # Key 'F2': Canvas Pool / Render Cache Stats
+        if event.keycode == 120: print(f"[Replay] Saved: {save_replay(self.world)}") # Key 'F9': Save Input Recording
+        self.world.key_down(event.keycode)
+        self.handle_events()
+
+    def keyReleaseHandler(self, event):
+        return self.world.key_up(event.keycode)
+
+
+# =============================================================================
+# [Levels] Concrete Stage Implementations
+# - 맵 레이아웃/적 배치/배경은 levels/*.json (LevelData 참고), 클래스는 레벨 파일과 스테이지 고유 로직만 지정
+# - *World: 시뮬레이션 / *Scene: 렌더링
+# =============================================================================
+class Stage1World(LevelWorld): LEVEL = "stage1"
+class Stage1Scene(LevelScene): WORLD = Stage1World
 
-        self.enemies.append(Enemy(self.canvas, x=1300, y=600, anim_frames=self.enemy_anim, speed=8, hp=3, can_shoot=True))
-        self.enemies.append(Enemy(self.canvas, x=1300, y=400, anim_frames=self.enemy_anim, speed=8, hp=3, can_shoot=True))
-        self.enemies.append(Enemy(self.canvas, x=2200, y=500, anim_frames=self.enemy_anim, speed=3, hp=3, can_shoot=True))
-        self.enemies.append(Enemy(self.canvas, x=2200, y=200, anim_frames=self.enemy_anim, speed=3, hp=3, can_shoot=True))
-        self.enemies.append(Enemy(self.canvas, x=2900, y=250, anim_frames=self.enemy_anim, speed=8, hp=3, can_shoot=True))
-        self.enemies.append(Enemy(self.canvas, x=2900, y=400, anim_frames=self.enemy_anim, speed=8, hp=3, can_shoot=True))
-        self.enemies.append(Enemy(self.canvas, x=2900, y=600, anim_frames=self.enemy_anim, speed=8, hp=3, can_shoot=True))
-        self.enemies.append(Enemy(self.canvas, x=2600, y=250, anim_frames=self.enemy_anim, speed=0, hp=5, enemy_type="data"))
-        self.enemies.append(Enemy(self.canvas, x=2600, y=600, anim_frames=self.enemy_anim, speed=0, hp=5, enemy_type="data"))
-        self.enemies.append(Enemy(self.canvas, x=1100, y=600, anim_frames=self.enemy_anim, speed=0, hp=5, enemy_type="data"))
+class Stage2World(LevelWorld): LEVEL = "stage2"
+class Stage2Scene(LevelScene): WORLD = Stage2World
 
-        self.siren_enabled = True
+class StageMidBossWorld(LevelWorld): LEVEL = "midboss"
+class StageMidBossScene(LevelScene): WORLD = StageMidBossWorld
 
-        self.canvas.tag_raise(self.player.obj)
+class Stage3World(LevelWorld): LEVEL = "stage3"
+class Stage3Scene(LevelScene): WORLD = Stage3World
 
 # =============================================================================
 # [Scene] Hidden Boss: System
-# - 3단 구조 맵과 순간이동 패턴을 가진 히든 보스
+# - 3단 구조 맵과 순간이동 패턴을 가진 히든 보스 (맵/순간이동 좌표: levels/system.json)
 # =============================================================================
-class SystemBossScene(LevelScene):
-    def __init__(self, window, manager): 
-        super().__init__(window, manager) 
-        self.map_width = 1280
-        
-        try:
-            self.bg_img = PhotoImage(file="image/stg_system.png") 
-            self.bg_obj = self.canvas.create_image(640, 360, image=self.bg_img)
-            self.is_bg_image = True 
-        except:
-            self.bg_obj = self.canvas.create_rectangle(0, 0, self.map_width, 720, fill="#001133") 
-            self.is_bg_image = False
-        
-        self.floor_obj = self.canvas.create_rectangle(0, 715, self.map_width, 720, fill="#000000", outline="")
-
-        # ---------------------------------------------------------------------
-        # [Map Layout] 3-Tier Structure (Void Center)
-        # ---------------------------------------------------------------------
-        # Tier 3 (Top) : y = 200
-        self.map_objects.append(Platform(self.canvas, x=0, y=200, w=500, h=20, color="#004488"))   # L3 Left
-        self.map_objects.append(Platform(self.canvas, x=780, y=200, w=500, h=20, color="#004488")) # L3 Right
-        
-        # Tier 2 (Mid) : y = 450
-        self.map_objects.append(Platform(self.canvas, x=0, y=450, w=500, h=20, color="#004488"))   # L2 Left
-        self.map_objects.append(Platform(self.canvas, x=780, y=450, w=500, h=20, color="#004488")) # L2 Right
-        
-        # ---------------------------------------------------------------------
-        # [Cover Walls] Shield for Boss
-        # ---------------------------------------------------------------------
-        self.map_objects.append(Wall(self.canvas, x=900, y=450, w=30, h=270, color="#444444")) # Tier 1 Right
-        self.map_objects.append(Wall(self.canvas, x=350, y=200, w=30, h=250, color="#444444")) # Tier 2 Left
-        self.map_objects.append(Wall(self.canvas, x=900, y=0, w=30, h=200, color="#444444"))   # Tier 3 Right
-
-        self.enemy_anim = {"walk_R": [], "walk_L": []}
-        try:
-            frames_R = load_gif_frames("image/char/hidden/fly_R.gif", frame_count=6, scale=6)
-            frames_L = load_gif_frames("image/char/hidden/fly_L.gif", frame_count=6, scale=6)
-            
-            self.enemy_anim["walk_R"] = frames_R
-            self.enemy_anim["walk_L"] = frames_L
-        except:
-            print("[Error] System boss anim load failed")
+class SystemBossWorld(LevelWorld):
+    LEVEL = "system"
+    CLEAR_SIGNAL = "SYSTEM_CLEARED"             # System Boss Special Return Signal
 
-        # ---------------------------------------------------------------------
-        # [Boss Spawn] Teleportation Spots
-        # ---------------------------------------------------------------------
-        self.boss_spots = [
-            (1100, 600), # Spot 1: Tier 1 Right
-            (150, 350),  # Spot 2: Tier 2 Left
-            (1100, 100)  # Spot 3: Tier 3 Right
-        ]
-        self.current_spot_idx = 0
-        start_x, start_y = self.boss_spots[0]
-
-        # Init System Boss (Gravity Ignored)
-        system_boss = Enemy(self.canvas, x=start_x, y=start_y, anim_frames=self.enemy_anim, 
-                            speed=0, hp=30, can_shoot=True, is_boss=True, is_system=True)
-        self.enemies.append(system_boss)
-        
-        self.siren_enabled = False
-        
-        self.canvas.tag_raise(self.player.obj)
+    def __init__(self, manager, seed=None):
+        super().__init__(manager, seed)
+        self.current_spot_idx = 0               # 보스는 boss_spots[0]에서 시작 (Gravity Ignored)
 
     def teleport_system_boss(self, boss):
         """Teleport Boss to Random Spot (Excluding current)"""
         possible_indices = [i for i in range(len(self.boss_spots)) if i != self.current_spot_idx]
-        new_idx = random.choice(possible_indices)
-        
+        new_idx = self.rng.choice(possible_indices)
+
         self.current_spot_idx = new_idx
         new_x, new_y = self.boss_spots[new_idx]
-        
+
+        self.wake_enemies([boss]) # 잠든 채 맞은 경우 sleeping 등록 구간이 바뀌므로 깨워서 이동 (다음 틱에 다시 판정)
         boss.world_x = new_x
         boss.y = new_y
-        
-        sound_mgr.play_sfx("sfx_warp.wav")
+        boss.snap()
+
+        self.events.append(("sfx", "sfx_warp.wav"))
+
+class SystemBossScene(LevelScene):
+    WORLD = SystemBossWorld
+
+    def load_enemy_anim(self):
+        try: return super().load_enemy_anim()
+        except:
+            print("[Error] System boss anim load failed")
+            return {"walk_R": [], "walk_L": []}
+
+
+# =============================================================================
+# [System] Replay (Input Recording / Deterministic Playback)
+# - 기록: LevelWorld.input_log(틱별 키 입력) + seed + 시작 목숨 + 종료 시점 상태 해시
+# - 재생: 같은 월드 클래스/seed로 새 월드를 만들고 기록된 틱에 같은 입력을 넣어 다시 실행
+# - 재생 결과 해시가 기록과 다르면 비결정 요소(벽시계, 전역 난수 등)가 시뮬레이션에 섞인 것
+# =============================================================================
+REPLAY_VERSION = 2 # 2: 적 상태를 float/int로 정규화하여 해시 (EnemyStore)
+REPLAY_WORLDS = {cls.__name__: cls for cls in (Stage1World, Stage2World, StageMidBossWorld, Stage3World, SystemBossWorld)}
+
+class Session:
+    """Game_manager 없이 월드를 실행할 때 주입하는 전역 상태 (목숨)"""
+    def __init__(self, lives=3): self.lives = lives
+
+def save_replay(world, path=None):
+    """현재까지의 입력 기록을 JSON으로 저장하고 경로 반환"""
+    if path is None:
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(REPLAY_DIR, f"{type(world).__name__}_{world.seed}_{stamp}.json")
+    if os.path.dirname(path): os.makedirs(os.path.dirname(path), exist_ok=True)
+    replay = {"version": REPLAY_VERSION, "world": type(world).__name__, "seed": world.seed,
+              "lives": world.start_lives, "ticks": world.ticks, "checksum": world.state_hash(),
+              "inputs": world.input_log}
+    with open(path, "w", encoding="utf-8") as f: json.dump(replay, f)
+    return path
+
+def load_replay(path):
+    with open(path, encoding="utf-8") as f: replay = json.load(f)
+    if replay.get("version") != REPLAY_VERSION: raise ValueError(f"unsupported replay version: {replay.get('version')}")
+    return replay
+
+def play_replay(replay, on_tick=None):
+    """
+    Deterministic Playback (Headless)
+    - 기록된 틱 수만큼 실행, 각 틱 직전에 그 틱에 기록된 키 입력을 적용
+    - on_tick(world): 틱마다 호출 (프로파일링, 상태 덤프 등)
+    - 반환: (world, 기록된 상태 해시와 일치 여부)
+    """
+    world = REPLAY_WORLDS[replay["world"]](Session(replay["lives"]), seed=replay["seed"])
+    inputs = replay["inputs"]; n = 0
+    def feed(tick):
+        nonlocal n
+        while n < len(inputs) and inputs[n][0] <= tick:
+            _, keycode, down = inputs[n]; n += 1
+            if down: world.key_down(keycode)
+            else: world.key_up(keycode)
+    while world.ticks < replay["ticks"]:
+        feed(world.ticks)
+        t = profiler.begin()
+        world.tick(); world.events.clear()
+        profiler.lap("tick", t)
+        if on_tick: on_tick(world)
+        if world.game_over or world.needs_retry or world.stage_clear: break
+    feed(world.ticks) # 마지막 틱 이후 입력 (Stage Clear 후 Enter 등)
+    world.events.clear()
+    return world, world.state_hash() == replay["checksum"]
+
+
+# =============================================================================
+# [System] Scene Registry
+# - 인덱스별 생성 함수(factory)만 등록하고 실제 씬은 첫 접근 시 생성 (Lazy Construction)
+# - 상주 씬 수가 max_resident를 넘으면 가장 오래 쓰지 않은 씬부터 해제 (LRU)
+# - pinned 씬(메뉴, 게임오버)은 해제하지 않음
+# - 모든 씬은 destroy()를 구현 (캔버스 파괴 + 이미지/아이템 참조 해제) - 해제된 씬 객체는 다시 쓰지 않음
+# =============================================================================
+class SceneRegistry:
+    def __init__(self, max_resident=MAX_RESIDENT_SCENES):
+        self.factories = {}; self.instances = {}; self.pinned = set()
+        self.assets = {}  # idx -> 미리 읽을 이미지 키 목록 (AssetLoader)
+        self.lru = []  # 최근 사용 순서 (마지막이 가장 최근)
+        self.max_resident = max_resident
+        self.built = 0; self.evicted = 0
+
+    def register(self, idx, factory, pinned=False, assets=()):
+        self.factories[idx] = factory; self.assets[idx] = list(assets)
+        if pinned: self.pinned.add(idx)
+
+    def __getitem__(self, idx):
+        scene = self.instances.get(idx)
+        if scene is None:
+            scene = self.factories[idx]()
+            self.instances[idx] = scene; self.built += 1
+        if self.lru[-1:] != [idx]:
+            if idx in self.lru: self.lru.remove(idx)
+            self.lru.append(idx)
+        return scene
+
+    def __contains__(self, idx): return idx in self.instances
+
+    def prefetch(self, idx, keep=()):
+        if idx not in self.factories or idx in self.instances: return
+        self[idx]
+        self.trim(keep=set(keep) | {idx})
+
+    def evict(self, idx):
+        scene = self.instances.pop(idx, None)
+        if idx in self.lru: self.lru.remove(idx)
+        if scene is None: return
+        try: scene.destroy() # [Lifecycle] 씬별 해제 (캔버스 + 이미지/아이템 참조)
+        except TclError: pass
+        self.evicted += 1
+
+    def trim(self, keep=()):
+        for idx in list(self.lru):
+            if len(self.instances) <= self.max_resident: break
+            if idx in self.pinned or idx in keep: continue
+            self.evict(idx)
+
+    def __repr__(self):
+        return f"SceneRegistry(resident={sorted(self.instances)}, built={self.built}, evicted={self.evicted})"
+
+
+# =============================================================================
+# [Debug] Memory Report (Leak Check)
+# - 살아있는 주요 객체 수(gc 추적 객체 기준), Tk 위젯/이미지 수, 상주 씬의 캔버스 아이템 수, 할당 블록 수
+# - 게임 중 F8로 출력, leakcheck.py는 게임 오버/재시도 사이클마다 수집하여 증가 여부 판정
+# =============================================================================
+LEAK_TYPES = (("Canvas", Canvas), ("PhotoImage", PhotoImage), ("LevelScene", LevelScene), ("LevelWorld", LevelWorld),
+              ("DialogueScene", DialogueScene), ("BossScene", BossScene), ("EndingScene", EndingScene),
+              ("Sprite", Sprite), ("Enemy", Enemy), ("BulletPool", BulletPool))
+
+def memory_report(manager):
+    gc.collect()
+    report = {name: 0 for name, _ in LEAK_TYPES}
+    for obj in gc.get_objects():
+        for name, cls in LEAK_TYPES:
+            if isinstance(obj, cls): report[name] += 1; break
+    widgets = 0; stack = [manager.window]
+    while stack:
+        children = stack.pop().winfo_children(); widgets += len(children); stack += children
+    report["tk_widgets"] = widgets
+    report["tk_images"] = len(manager.window.tk.call("image", "names"))
+    report["canvas_items"] = sum(len(scene.canvas.find_all()) for scene in manager.scenes.instances.values())
+    report["resident"] = len(manager.scenes.instances)
+    report["blocks"] = sys.getallocatedblocks()
+    return report
 
 
 # =============================================================================
@@ -1252,76 +3010,123 @@ class SystemBossScene(LevelScene):
 # - Finite State Machine (FSM) for Scene Management
 # =============================================================================
 class Game_manager:
-    def __init__(self):
+    # [State Machine] 씬 전환 그래프 (prefetch / 해제 판단용)
+    # - 게임오버 -> 메뉴: 상주 중인 스테이지는 해제하지 않고 restore()로 시작 상태로 되돌려 재사용 (상주 수는 trim으로 제한)
+    SCENE_FLOW = {
+        0: (1,), 1: (2,), 2: (3, 8), 3: (4, 8), 4: (5,), 5: (6, 8), 6: (7, 8),
+        7: (12, 13, 9), 8: (0,), 9: (10,), 10: (11, 8), 11: (14,),
+        12: (), 13: (), 14: ()
+    }
+
+    def __init__(self, run=True):
         self.window = Tk(); self.window.title("지구는 둥그니까"); self.window.geometry("1280x720"); self.window.resizable(False, False)
         self.scene_idx = 0
         self.lives = 3 
+        self.clock = GameClock() # [Loop] 실제 시간 -> 게임 시간 변환 (일시정지, 배속)
         
         sound_mgr.play_bgm("bgm_main.mp3")
-
-        self.menu = MenuScene(self.window, self)
-        self.intro = DialogueScene(self.window, ["text1.png", "text2.png", "text3.png"], "story1.png")
-        
-        self.stage1 = Stage1Scene(self.window, self)
-        self.stage2 = Stage2Scene(self.window, self)
-        self.mid_dialogue = DialogueScene(self.window, ["mid_text1.png", "mid_text2.png", "mid_text3.png", "mid_text4.png", "mid_text5.png", "mid_text6.png", "mid_text7.png", "mid_text8.png"], "story_mid.png")
-        self.mid_boss = StageMidBossScene(self.window, self)
-        self.stage3 = Stage3Scene(self.window, self)
-        self.boss = BossScene(self.window)
-        self.gameover = GameOverScene(self.window)
+        asset_loader.start(self.window)
+        asset_loader.preload(sounds=SFX_FILES)
+
+        # Scene Registry (첫 진입 시 생성)
+        w = self.window
+        intro = ["text1.png", "text2.png", "text3.png"]
+        mid = ["mid_text1.png", "mid_text2.png", "mid_text3.png", "mid_text4.png", "mid_text5.png", "mid_text6.png", "mid_text7.png", "mid_text8.png"]
+        sys_in = ["sys_in_text1.png", "sys_in_text2.png", "sys_in_text3.png", "sys_in_text4.png", "sys_in_text5.png", "sys_in_text6.png", "sys_in_text7.png"]
+        sys_out = ["sys_out_text1.png", "sys_out_text2.png", "sys_out_text3.png", "sys_out_text4.png", "sys_out_text5.png", "sys_out_text6.png", "sys_out_text7.png", "sys_out_text8.png", "sys_out_text9.png", "sys_out_text10.png", "sys_out_text11.png"]
+        self.scenes = SceneRegistry()
+        self.scenes.register(0, lambda: MenuScene(w, self), pinned=True)
+        self.scenes.register(1, lambda: DialogueScene(w, intro, "story1.png"), assets=DialogueScene.assets_for(intro, "story1.png"))
+        self.scenes.register(2, lambda: Stage1Scene(w, self), assets=Stage1Scene.preload_assets())
+        self.scenes.register(3, lambda: Stage2Scene(w, self), assets=Stage2Scene.preload_assets())
+        self.scenes.register(4, lambda: DialogueScene(w, mid, "story_mid.png"), assets=DialogueScene.assets_for(mid, "story_mid.png"))
+        self.scenes.register(5, lambda: StageMidBossScene(w, self), assets=StageMidBossScene.preload_assets())
+        self.scenes.register(6, lambda: Stage3Scene(w, self), assets=Stage3Scene.preload_assets())
+        self.scenes.register(7, lambda: BossScene(w), assets=BossScene.ASSETS)  # Choice
+        self.scenes.register(8, lambda: GameOverScene(w), pinned=True)
         
         # [Content] System Boss Route Scenes
-        self.sys_intro = DialogueScene(self.window, ["sys_in_text1.png", "sys_in_text2.png", "sys_in_text3.png", "sys_in_text4.png", "sys_in_text5.png", "sys_in_text6.png", "sys_in_text7.png"], "story_hidden.png") 
-        self.system_boss = SystemBossScene(self.window, self)
-        self.sys_outro = DialogueScene(self.window, ["sys_out_text1.png", "sys_out_text2.png", "sys_out_text3.png", "sys_out_text4.png", "sys_out_text5.png", "sys_out_text6.png", "sys_out_text7.png", "sys_out_text8.png", "sys_out_text9.png", "sys_out_text10.png", "sys_out_text11.png"], "story_hidden.png") 
-
-        # Scene Registry
-        self.scenes = [
-            self.menu,          # 0
-            self.intro,         # 1
-            self.stage1,        # 2
-            self.stage2,        # 3
-            self.mid_dialogue,  # 4
-            self.mid_boss,      # 5
-            self.stage3,        # 6
-            self.boss,          # 7 (Choice)
-            self.gameover,      # 8
-            self.sys_intro,     # 9  (Hidden Intro)
-            self.system_boss,   # 10 (Hidden Boss)
-            self.sys_outro      # 11 (Hidden Outro)
-        ]
-        self.menu.pack()
+        self.scenes.register(9, lambda: DialogueScene(w, sys_in, "story_hidden.png"), assets=DialogueScene.assets_for(sys_in, "story_hidden.png"))     # Hidden Intro
+        self.scenes.register(10, lambda: SystemBossScene(w, self), assets=SystemBossScene.preload_assets())                                                   # Hidden Boss
+        self.scenes.register(11, lambda: DialogueScene(w, sys_out, "story_hidden.png"), assets=DialogueScene.assets_for(sys_out, "story_hidden.png")) # Hidden Outro
+
+        # [Content] Endings
+        self.scenes.register(12, lambda: EndingScene(w, 1), assets=EndingScene.assets_for(1))
+        self.scenes.register(13, lambda: EndingScene(w, 2), assets=EndingScene.assets_for(2))
+        self.scenes.register(14, lambda: EndingScene(w, 3), assets=EndingScene.assets_for(3))
+
+        self.scenes[0].pack()
+        self.preload_next()
+        self.window.after(PREFETCH_DELAY_MS, self.prefetch_next)
         self.window.bind("<KeyRelease>", self.keyReleaseHandler); self.window.bind("<KeyPress>", self.keyPressHandler)
-        self.run_game()
+        if run: self.run_game() # run=False: 루프 없이 생성만 (leakcheck.py 등 외부에서 구동)
 
     def reset_current_stage(self):
-        idx = self.scene_idx
+        """[Retry] 씬을 새로 만들지 않고 시작 상태로 복원 (LevelScene.restore)"""
         print(f"[System] Stage Reset (Lives Left: {self.lives})")
-        self.scenes[idx].unpack()
-        
-        if idx == 2: self.stage1 = Stage1Scene(self.window, self); self.scenes[2] = self.stage1
-        elif idx == 3: self.stage2 = Stage2Scene(self.window, self); self.scenes[3] = self.stage2
-        elif idx == 5: self.mid_boss = StageMidBossScene(self.window, self); self.scenes[5] = self.mid_boss
-        elif idx == 6: self.stage3 = Stage3Scene(self.window, self); self.scenes[6] = self.stage3
-        elif idx == 10: self.system_boss = SystemBossScene(self.window, self); self.scenes[10] = self.system_boss 
-            
-        self.scenes[idx].pack()
-        self.fade_in_effect(self.scenes[idx].canvas)
+        scene = self.scenes[self.scene_idx]
+        scene.restore()
+        self.fade_in_effect(scene.canvas)
 
     def run_game(self):
+        """
+        Main Loop (Fixed Timestep + Interpolated Rendering)
+        - 누적된 실제 시간만큼 tick()을 TICK_DT 단위로 실행 (게임 속도는 프레임 속도와 무관)
+        - 밀린 틱은 최대 MAX_FRAME_SKIP회까지만 따라잡고 나머지는 버림 (느려지는 대신 프레임 드랍)
+        - 남은 누적 시간의 비율(alpha)로 render()를 호출해 틱 사이를 보간
+        """
+        accumulator = 0.0
         while True:
             try:
+                accumulator += self.clock.frame() # 일시정지 중 0, 배속 시 실제 경과 x scale
                 current_scene = self.scenes[self.scene_idx]
-                result = None
-                if hasattr(current_scene, 'display'): result = current_scene.display()
-                if result == "GAME_OVER": self.change_scene(8)
-                elif result == "RETRY": self.reset_current_stage()
-                self.window.update(); self.window.after(33)
+
+                if hasattr(current_scene, 'tick'):
+                    t = profiler.begin()
+                    steps = 0
+                    while accumulator >= TICK_DT:
+                        if steps >= MAX_FRAME_SKIP: accumulator %= TICK_DT; break # [Frame Skip] 밀린 시간 폐기
+                        result = current_scene.tick()
+                        accumulator -= TICK_DT; steps += 1
+                        if result == "GAME_OVER": self.change_scene(8); break
+                        elif result == "RETRY": self.reset_current_stage(); break
+                    
+                    t = profiler.lap("tick", t) # 이번 프레임의 시뮬레이션 틱 전체 (0 ~ MAX_FRAME_SKIP회)
+
+                    current_scene = self.scenes[self.scene_idx]
+                    if hasattr(current_scene, 'render'): current_scene.render(min(accumulator / TICK_DT, 1.0))
+                    t = profiler.lap("render", t)
+                    self.window.update()
+                    profiler.lap("tk.update", t) # 이벤트 처리(키 입력) + 실제 화면 그리기
+                    profiler.frame()
+                else:
+                    # Static Scenes: 시뮬레이션이 없으므로 기존 프레임 간격 유지
+                    if hasattr(current_scene, 'display'): current_scene.display()
+                    self.window.update(); self.window.after(STATIC_FRAME_MS)
+                    accumulator = 0.0
             except TclError as e: print(f"[CRITICAL] App Closed: {e}"); return
             except Exception as e: print(f"[Error] {e}"); return
 
     def keyPressHandler(self, event):
         current_scene = self.scenes[self.scene_idx]
+        if event.keycode == 114: profiler.toggle_overlay(); return # Key 'F3': Profiler Overlay
+        if event.keycode == 119: # Key 'F8': Memory / Leak Report
+            print("[Memory] " + ", ".join(f"{k}={v}" for k, v in memory_report(self).items()) + f" {self.scenes}")
+            return
+        if event.keycode == 115: # Key 'F4': Trace Recording Start / Stop
+            path = profiler.toggle_trace()
+            print(f"[Profiler] Trace saved: {path}" if path else "[Profiler] Trace recording...")
+            return
+        if hasattr(current_scene, 'tick'):
+            if event.keycode == 80: # Key 'P': Pause / Resume
+                paused = self.clock.toggle_pause()
+                if hasattr(current_scene, 'show_pause'): current_scene.show_pause(paused)
+                return
+            if event.keycode == 117: # Key 'F6': Time Scale (Debug)
+                scale = CLOCK_SCALES[(CLOCK_SCALES.index(self.clock.scale) + 1) % len(CLOCK_SCALES)] if self.clock.scale in CLOCK_SCALES else 1.0
+                self.clock.set_scale(scale); print(f"[Debug] {self.clock}")
+                return
+            if self.clock.paused: return # 일시정지 중 누름은 무시 (뗌은 전달하여 눌린 키 상태 정리)
         if hasattr(current_scene, 'keyPressHandler'): current_scene.keyPressHandler(event)
 
     def keyReleaseHandler(self, event):
@@ -1347,11 +3152,9 @@ class Game_manager:
         # [Branch: Endings]
         elif self.scene_idx == 7:
             if result == "ENDING_1":
-                self.ending = EndingScene(self.window, 1); self.scenes.append(self.ending); self.change_scene(len(self.scenes)-1)
-                sound_mgr.play_bgm("bgm_ending1.mp3")
+                self.change_scene(12); sound_mgr.play_bgm("bgm_ending1.mp3")
             elif result == "ENDING_2":
-                self.ending = EndingScene(self.window, 2); self.scenes.append(self.ending); self.change_scene(len(self.scenes)-1)
-                sound_mgr.play_bgm("bgm_ending2.mp3")
+                self.change_scene(13); sound_mgr.play_bgm("bgm_ending2.mp3")
             
             # [Branch: Hidden Route]
             elif result == "HIDDEN_BOSS": 
@@ -1368,38 +3171,66 @@ class Game_manager:
             sound_mgr.play_bgm("bgm_system_outro.mp3")
 
         elif self.scene_idx == 11 and result == "NEXT":
-            self.ending = EndingScene(self.window, 3); self.scenes.append(self.ending); self.change_scene(len(self.scenes)-1)
-            sound_mgr.play_bgm("bgm_true_ending.mp3") 
+            self.change_scene(14); sound_mgr.play_bgm("bgm_true_ending.mp3") 
 
         # [Game Over -> Reset]
         elif self.scene_idx == 8 and result == "GO_TO_MENU":
             self.lives = 3 
-            self.stage1 = Stage1Scene(self.window, self)
-            self.stage2 = Stage2Scene(self.window, self)
-            self.mid_boss = StageMidBossScene(self.window, self)
-            self.stage3 = Stage3Scene(self.window, self)
-            self.system_boss = SystemBossScene(self.window, self)
-            
-            self.scenes[2] = self.stage1
-            self.scenes[3] = self.stage2
-            self.scenes[5] = self.mid_boss
-            self.scenes[6] = self.stage3
-            self.scenes[10] = self.system_boss 
+            # 상주 중인 스테이지는 시작 상태로 복원하여 재사용, 나머지 씬은 해제 -> 다음 진입 시 새로 생성
+            for idx, scene in list(self.scenes.instances.items()):
+                if hasattr(scene, 'restore'): scene.restore()
+                elif idx not in self.scenes.pinned: self.scenes.evict(idx)
             
-            self.intro.current_idx = 0; self.intro.draw_scene() 
-            self.mid_dialogue.current_idx = 0; self.mid_dialogue.draw_scene() 
-            self.boss.current_idx = 0; self.boss.state = "dialogue"; self.boss.draw_scene()
-            self.sys_intro.current_idx = 0; self.sys_intro.draw_scene()
-            self.sys_outro.current_idx = 0; self.sys_outro.draw_scene()
-            
-            self.menu.update_background()
+            self.scenes[0].update_background()
             self.change_scene(0); sound_mgr.play_bgm("bgm_main.mp3")
 
     def change_scene(self, next_idx):
+        if self.clock.paused: # 일시정지 중 전환 (관리자 워프 등)
+            self.clock.resume()
+            if hasattr(self.scenes[self.scene_idx], 'show_pause'): self.scenes[self.scene_idx].show_pause(False)
         self.scenes[self.scene_idx].unpack() 
         self.scene_idx = next_idx            
         self.scenes[self.scene_idx].pack()
         self.fade_in_effect(self.scenes[self.scene_idx].canvas)
+        self.evict_unreachable()
+        self.preload_next()
+        self.window.after(PREFETCH_DELAY_MS, self.prefetch_next)
+
+    def reachable_scenes(self, idx):
+        seen = {idx}; stack = [idx]
+        while stack:
+            for nxt in self.SCENE_FLOW.get(stack.pop(), ()):
+                if nxt not in seen: seen.add(nxt); stack.append(nxt)
+        return seen
+
+    def evict_unreachable(self):
+        """현재 씬에서 다시 도달할 수 없는 씬 해제 + 상주 씬 수 제한"""
+        reachable = self.reachable_scenes(self.scene_idx)
+        for idx in list(self.scenes.instances):
+            if idx not in reachable and idx not in self.scenes.pinned: self.scenes.evict(idx)
+        self.scenes.trim(keep={self.scene_idx})
+
+    def prefetch_next(self):
+        """
+        다음 씬 미리 생성
+        - 다음 씬이 하나로 정해진 경우에만 (분기/게임오버는 제외)
+        - 플레이 중(tick 씬)에는 생성 지연이 프레임 드랍으로 보이므로 정적 씬에서만 수행
+        """
+        if hasattr(self.scenes[self.scene_idx], 'tick'): return
+        nexts = [i for i in self.SCENE_FLOW.get(self.scene_idx, ()) if i != 8]
+        if len(nexts) == 1 and nexts[0] not in self.scenes:
+            # 리소스가 아직 준비 중이면 메인 스레드에서 동기 생성하지 않도록 대기
+            if not asset_loader.ready(self.scenes.assets.get(nexts[0], ())):
+                self.window.after(PREFETCH_DELAY_MS, self.prefetch_next); return
+            try: self.scenes.prefetch(nexts[0], keep={self.scene_idx})
+            except TclError: pass
+
+    def preload_next(self):
+        """다음에 올 수 있는 씬(분기 포함, 게임오버 제외)의 리소스를 백그라운드로 읽기"""
+        upcoming = [i for i in self.SCENE_FLOW.get(self.scene_idx, ()) if i != 8 and i not in self.scenes]
+        keys = [key for i in upcoming for key in self.scenes.assets.get(i, ())]
+        asset_loader.retain(keys)
+        asset_loader.preload(keys)
 
     def fade_in_effect(self, canvas):
         try:
@@ -0,0 +1,200 @@
+"""
+Simulation Benchmark
+- 스테이지 월드(LevelWorld.tick)를 화면 없이 시나리오별로 반복 실행하여 처리량 측정
+- 지표: ticks/sec, 틱 소요 시간 p50/p99/max(us), gen0 GC 횟수(1000틱당, 할당 빈도 지표), 순증가 메모리 블록 수
+- 결과를 JSON으로 저장(--save)하고 이전 결과와 비교(--compare)하여 성능 회귀 확인
+- 게임 입력 기록(LevelWorld.input_log)도 틱마다 늘어나므로 sweep/crowd의 blocks 증가분에 포함됨
+
+사용법:
+    python bench.py                                  # 전체 시나리오
+    python bench.py bullets_200 crowd_120 --ticks 3000
+    python bench.py --save benchmarks/baseline.json
+    python bench.py --compare benchmarks/baseline.json --tolerance 0.15
+"""
+import os
+import sys
+import io
+import gc
+import json
+import time
+import random
+import platform
+import argparse
+import contextlib
+from array import array
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.chdir(os.path.dirname(os.path.abspath(__file__))) # 리소스 경로(image/...)는 게임과 같은 기준
+
+import Earth_is_round as game
+
+STAGES = {
+    "stage1": game.Stage1World,
+    "stage2": game.Stage2World,
+    "midboss": game.StageMidBossWorld,
+    "stage3": game.Stage3World,
+    "system": game.SystemBossWorld,
+}
+WARMUP_TICKS = 60
+
+
+# =============================================================================
+# [Scenario] World Builders
+# - 각 시나리오는 (world, driver) 반환, driver(world, tick)는 매 틱 실행 전 호출 (측정 시간에서 제외)
+# - 모든 시나리오는 고정 seed -> 실행마다 같은 입력/같은 상태
+# - 플레이어는 무적 (RETRY/GAME_OVER 이후의 빈 틱이 측정되지 않도록)
+# =============================================================================
+def make_world(world_cls, seed=0):
+    world = world_cls(game.Session(), seed=seed)
+    return world
+
+def invulnerable(world):
+    """피격 무시 (시나리오가 중간에 RETRY/GAME_OVER로 끝나지 않도록)"""
+    world.hit_player = lambda: None
+    return world
+
+def immortal_enemies(world):
+    """적이 죽지 않음 (적 수 고정, Stage Clear 방지)"""
+    for enemy in world.enemies: enemy.hp = enemy.max_hp = 10 ** 9
+    return world
+
+def idle(world_cls):
+    return invulnerable(make_world(world_cls)), None
+
+def sweep(world_cls):
+    """오른쪽 끝까지 이동하며 점프/사격 (맵 전체 훑기, Stage Clear 시 측정 종료)"""
+    world = invulnerable(make_world(world_cls))
+    def drive(world, tick):
+        if tick == 0: world.key_down(39)
+        if tick % 12 == 0: world.key_down(32); world.key_up(32)
+        world.key_down(65); world.key_up(65)
+    return world, drive
+
+def bullets(count):
+    """화면 안 총알 수를 count개로 유지 (플레이어 50%, 적 직선 25%, 적 조준 25%)"""
+    def build(world_cls):
+        world = immortal_enemies(invulnerable(make_world(world_cls)))
+        rng = random.Random(count)
+        def drive(world, tick):
+            bp = world.bullets
+            while len(bp) < count:
+                kind = rng.random()
+                x = world.scroll_x + rng.uniform(0, world.screen_width); y = rng.uniform(100, 700)
+                if kind < 0.5: bp.spawn(x, y, world.bullet_speed * rng.choice((-1, 1)), 0.0, game.BulletPool.OWNER_PLAYER)
+                elif kind < 0.75: bp.spawn(x, y, 20 * rng.choice((-1, 1)), 0.0, game.BulletPool.OWNER_ENEMY)
+                else: bp.spawn(x, y, rng.uniform(-15, 15), rng.uniform(-15, 15), game.BulletPool.OWNER_ENEMY, aimed=True)
+        return world, drive
+    return build
+
+def crowd(count):
+    """활성 범위 안에 몹 count마리 추가 (일부는 사격), 플레이어는 좌우 이동하며 사격"""
+    def build(world_cls):
+        world = make_world(world_cls)
+        rng = random.Random(count)
+        for i in range(count):
+            world.add_enemy(game.Mob(x=rng.randint(300, 1800), y=rng.uniform(100, 650), sprite_size=world.enemy_size,
+                                       speed=rng.choice((1, 3, 8)), can_shoot=(i % 4 == 0)))
+        immortal_enemies(invulnerable(world))
+        def drive(world, tick):
+            if tick % 90 == 0: world.key_up(37); world.key_down(39)
+            elif tick % 90 == 45: world.key_up(39); world.key_down(37)
+            world.key_down(65); world.key_up(65)
+        return world, drive
+    return build
+
+SCENARIOS = {}
+for name, cls in STAGES.items():
+    SCENARIOS[f"idle_{name}"] = (idle, cls)
+    SCENARIOS[f"sweep_{name}"] = (sweep, cls)
+for n in (50, 200, 1000): SCENARIOS[f"bullets_{n}"] = (bullets(n), game.Stage1World)
+SCENARIOS["crowd_120"] = (crowd(120), game.Stage2World)
+
+
+# =============================================================================
+# [Runner] Measurement
+# =============================================================================
+def percentile(sorted_values, q):
+    if not sorted_values: return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+def run_scenario(name, ticks):
+    build, world_cls = SCENARIOS[name]
+    with contextlib.redirect_stdout(io.StringIO()): # 게임 내 print(쉴드, 사이렌 안내) 무시
+        world, drive = build(world_cls)
+        for tick in range(WARMUP_TICKS):
+            if drive: drive(world, tick)
+            world.tick(); world.events.clear()
+
+        samples = array("q", bytes(8 * ticks)); clock = time.perf_counter_ns # 측정 중 샘플 저장이 객체를 할당하지 않도록
+        measured = 0
+        gc.collect()
+        gc0 = gc.get_stats()[0]["collections"]; blocks = sys.getallocatedblocks()
+        start = clock()
+        for tick in range(WARMUP_TICKS, WARMUP_TICKS + ticks):
+            if world.stage_clear or world.game_over: break # 이후 틱은 빈 틱
+            if drive: drive(world, tick)
+            t0 = clock()
+            world.tick()
+            samples[measured] = clock() - t0; measured += 1
+            world.events.clear()
+        total = clock() - start
+        gc0 = gc.get_stats()[0]["collections"] - gc0; blocks = sys.getallocatedblocks() - blocks
+
+    samples = sorted(samples[:measured])
+    tick_total = sum(samples)
+    return {
+        "ticks": measured,
+        "ticks_per_sec": measured / (tick_total / 1e9) if tick_total else 0.0,
+        "p50_us": percentile(samples, 0.50) / 1000, "p99_us": percentile(samples, 0.99) / 1000, "max_us": percentile(samples, 1.0) / 1000,
+        "gc0_per_1k": gc0 * 1000 / measured if measured else 0.0, "blocks_delta": blocks,
+        "wall_ms": total / 1e6, "enemies": len(world.enemies), "bullets": len(world.bullets),
+    }
+
+def environment():
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "machine": platform.machine(), "system": platform.system(), "numpy": game.np is not None,
+            "bullet_collision": game.BULLET_COLLISION, "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+def compare(results, baseline, tolerance):
+    """p50 기준 tolerance 이상 느려진 시나리오 목록 출력, 회귀 수 반환"""
+    regressions = 0
+    print(f"\n{'scenario':<16} {'p50 base':>9} {'p50 now':>9} {'change':>8}")
+    for name, r in results.items():
+        base = baseline["results"].get(name)
+        if not base or not base["p50_us"]: continue
+        change = r["p50_us"] / base["p50_us"] - 1.0
+        flag = "REGRESSION" if change > tolerance else ""
+        regressions += bool(flag)
+        print(f"{name:<16} {base['p50_us']:>9.1f} {r['p50_us']:>9.1f} {change:>+7.1%} {flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Earth is Round - simulation benchmark")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario", help=f"실행할 시나리오 {list(SCENARIOS)} (기본: 전체)")
+    parser.add_argument("--ticks", type=int, default=1500, help="시나리오별 측정 틱 수 (워밍업 제외)")
+    parser.add_argument("--repeat", type=int, default=3, help="시나리오별 반복 횟수 (p50이 가장 낮은 실행을 채택, 측정 잡음 완화)")
+    parser.add_argument("--save", metavar="FILE", help="결과를 JSON으로 저장 (기준선)")
+    parser.add_argument("--compare", metavar="FILE", help="저장된 기준선과 p50 비교")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="회귀 판정 기준 (p50 증가율, 기본 15%%)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown: parser.error(f"unknown scenario: {', '.join(unknown)}")
+
+    results = {}
+    print(f"{'scenario':<16} {'ticks':>6} {'ticks/s':>9} {'p50 us':>8} {'p99 us':>8} {'max us':>8} {'gc0/1k':>7} {'blocks':>7} {'enemies':>7} {'bullets':>7}")
+    for name in args.scenarios or list(SCENARIOS):
+        r = results[name] = min((run_scenario(name, args.ticks) for _ in range(max(1, args.repeat))), key=lambda run: run["p50_us"])
+        print(f"{name:<16} {r['ticks']:>6} {r['ticks_per_sec']:>9.0f} {r['p50_us']:>8.1f} {r['p99_us']:>8.1f} {r['max_us']:>8.1f} "
+              f"{r['gc0_per_1k']:>7.1f} {r['blocks_delta']:>7} {r['enemies']:>7} {r['bullets']:>7}")
+
+    if args.save:
+        if os.path.dirname(args.save): os.makedirs(os.path.dirname(args.save), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f: json.dump({"env": environment(), "results": results}, f, indent=2)
+        print(f"\nSaved: {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f: baseline = json.load(f)
+        if compare(results, baseline, args.tolerance): return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+Asset Build
+- 캐릭터 스프라이트 아틀라스(image/cache/<폴더>@<배율>.png + .json)를 미리 생성 (게임도 처음 요청 시 자동 생성)
+- 대상: 스테이지 씬들의 미리 읽기 목록 중 축소(subsample 배율 > 1)해서 쓰는 이미지 -> 플레이어, 스테이지별 적 애니메이션 폴더
+- 원본 mtime/크기, 배율이 색인과 같은 아틀라스는 건너뜀 (--force: 모두 다시 생성)
+- 디스플레이가 필요 (Tk PhotoImage, CI 등에서는 xvfb-run python build_assets.py)
+
+사용법:
+    python build_assets.py
+    python build_assets.py --force
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.chdir(os.path.dirname(os.path.abspath(__file__))) # 리소스 경로(image/...)는 게임과 같은 기준
+
+import Earth_is_round as game
+
+SCENES = (game.Stage1Scene, game.Stage2Scene, game.StageMidBossScene, game.Stage3Scene, game.SystemBossScene)
+
+
+def atlas_sources():
+    """씬 미리 읽기 목록의 이미지 키 -> 아틀라스 (폴더, 배율) 목록"""
+    sources = {game.atlas_source(key) for scene in SCENES for key in scene.preload_assets()}
+    sources.discard(None)
+    return sorted(sources)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Earth is Round - sprite atlas build")
+    parser.add_argument("--force", action="store_true", help="캐시가 유효해도 다시 생성")
+    args = parser.parse_args(argv)
+
+    root = game.Tk(); root.withdraw()
+    print(f"{'atlas':<36} {'frames':>6} {'status':<7} {'KiB':>8} {'ms':>8}")
+    for source in atlas_sources():
+        start = time.perf_counter()
+        cached = None if args.force else game.read_atlas(source)
+        if cached: index, status = cached[0], "cached"
+        else: index, status = game.build_atlas(source)[1], "built"
+        image_path, _ = game.atlas_paths(source)
+        size = os.path.getsize(image_path) / 1024 if os.path.exists(image_path) else 0.0
+        print(f"{image_path:<36} {len(index['frames']):>6} {status:<7} {size:>8.1f} {(time.perf_counter() - start) * 1000:>8.1f}")
+    root.destroy()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+"""
+Headless Runner
+- 창/캔버스 없이 스테이지 시뮬레이션(LevelWorld)만 고정 틱으로 실행
+- 월드 시각은 틱 수 기반이므로 실제 시간을 기다리지 않고 최대 속도로 진행
+- 용도: 밸런스 확인, 회귀 테스트, 성능 측정 (CI 등 디스플레이/오디오 없는 환경)
+- 리플레이: 게임(F9) 또는 --record로 저장한 입력 기록을 재생하고 상태 해시 일치 여부 확인
+
+사용법:
+    python headless.py                        # 전체 스테이지, 시드 0
+    python headless.py stage1 midboss -n 5    # 지정 스테이지를 시드 0~4로 5회씩
+    python headless.py --ticks 9000 --seed 7 -v
+    python headless.py stage2 --record replays          # 실행마다 리플레이 저장
+    python headless.py --replay replays/Stage2World_0_20260101_120000.json
+    python headless.py --replay <파일> --trace trace.json  # 서브시스템별 구간을 Chrome Trace로 저장
+    python headless.py --check                # 회귀 검사 전체 (실패 시 종료 코드 1)
+    python headless.py --check swept          # 지정 검사만
+"""
+import os
+import sys
+import io
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy") # pygame 믹서 초기화가 오디오 장치를 요구하지 않도록
+os.chdir(os.path.dirname(os.path.abspath(__file__))) # 리소스 경로(image/...)는 게임과 같은 기준
+
+import Earth_is_round as game
+
+STAGES = {
+    "stage1": game.Stage1World,
+    "stage2": game.Stage2World,
+    "midboss": game.StageMidBossWorld,
+    "stage3": game.Stage3World,
+    "system": game.SystemBossWorld,
+}
+
+
+class Bot:
+    """
+    Scripted Input
+    - 오른쪽 이동 위주 + 간헐적 후진/점프, 사격 키는 매 틱 입력 (쿨다운은 월드가 처리)
+    - 동일 시드면 동일 입력 (월드 RNG와 별도)
+    """
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.direction = 39; self.hold = 0
+
+    def step(self, world):
+        if self.hold <= 0:
+            world.key_up(self.direction)
+            self.direction = 37 if self.rng.random() < 0.25 else 39
+            self.hold = self.rng.randint(5, 40)
+            world.key_down(self.direction)
+        self.hold -= 1
+        if self.rng.random() < 0.08: world.key_down(32); world.key_up(32)
+        world.key_down(65); world.key_up(65)
+
+
+def run_stage(name, seed=0, max_ticks=18000, verbose=False, record=None):
+    """스테이지 1회 실행 -> 결과 dict (result: CLEAR / HIT / GAME_OVER / TIMEOUT)"""
+    out = sys.stdout if verbose else io.StringIO() # 게임 내 print(쉴드, 사이렌 안내) 출력 여부
+    with contextlib.redirect_stdout(out):
+        world = STAGES[name](game.Session(), seed=seed)
+        bot = Bot(seed)
+        result = "TIMEOUT"; sfx = 0
+        start = time.perf_counter()
+        for _ in range(max_ticks):
+            bot.step(world)
+            t = game.profiler.begin()
+            signal = world.tick()
+            game.profiler.lap("tick", t)
+            sfx += sum(1 for event in world.events if event[0] == "sfx")
+            world.events.clear()
+            if signal == "GAME_OVER": result = "GAME_OVER"; break
+            if signal == "RETRY": result = "HIT"; break
+            if world.stage_clear: result = "CLEAR"; break
+        elapsed = time.perf_counter() - start
+    if record: game.save_replay(world, os.path.join(record, f"{type(world).__name__}_{seed}.json"))
+    return {
+        "stage": name, "seed": seed, "result": result, "ticks": world.ticks,
+        "score": world.score, "enemies_left": len(world.enemies), "sfx": sfx,
+        "ticks_per_sec": world.ticks / elapsed if elapsed > 0 else 0.0,
+        "speedup": world.ticks * game.TICK_DT / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def replay(path, verbose=False):
+    """리플레이 재생 -> 결과 dict (match: 기록 시점 상태 해시와 일치 여부)"""
+    data = game.load_replay(path)
+    out = sys.stdout if verbose else io.StringIO()
+    with contextlib.redirect_stdout(out):
+        start = time.perf_counter()
+        world, match = game.play_replay(data)
+        elapsed = time.perf_counter() - start
+    return {"world": data["world"], "seed": data["seed"], "ticks": world.ticks, "expected_ticks": data["ticks"],
+            "score": world.score, "match": match, "ticks_per_sec": world.ticks / elapsed if elapsed > 0 else 0.0}
+
+
+# =============================================================================
+# [Check] Regression Checks (--check)
+# - 최적화 경로의 동등성/결정론 전제를 실제 월드로 확인, 실패 시 AssertionError
+# - 같은 시드 + 같은 봇 입력으로 두 경로를 실행하여 틱별 state_hash와 명중/피격 이벤트 비교
+# =============================================================================
+CHECKS = {}
+HIT_EVENTS = ("enemy_hit", "enemy_removed", "lives", "player_hit")
+
+def register(fn):
+    CHECKS[fn.__name__[len("check_"):]] = fn
+    return fn
+
+@contextlib.contextmanager
+def numpy_disabled():
+    """NumPy 없는 환경과 같은 경로 (순수 Python 처리)"""
+    saved = game.np; game.np = None
+    try: yield
+    finally: game.np = saved
+
+def trace(world, seed, ticks, drive=None):
+    """봇 입력으로 진행 -> (틱별 state_hash, (틱, 명중/피격 이벤트 종류)) - 피격/게임오버/클리어 틱에서 중단"""
+    bot = Bot(seed); hashes = []; hits = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(ticks):
+            bot.step(world)
+            if drive: drive(world)
+            signal = world.tick()
+            hits += [(world.ticks, event[0]) for event in world.events if event[0] in HIT_EVENTS]
+            world.events.clear(); hashes.append(world.state_hash())
+            if signal or world.game_over or world.needs_retry or world.stage_clear: break # play_replay와 같은 종료 시점
+    return hashes, hits
+
+def invulnerable(world):
+    """피격 시 재시도 대신 ("player_hit",) 이벤트만 기록 -> 피격 후에도 계속 진행하여 긴 구간 비교"""
+    world.hit_player = lambda: world.events.append(("player_hit",))
+    return world
+
+def assert_same(label, expected, actual):
+    hashes, hits = expected; other_hashes, other_hits = actual
+    assert hits == other_hits, f"{label}: hits differ {hits[:5]} != {other_hits[:5]}"
+    diff = next((t for t, (a, b) in enumerate(zip(hashes, other_hashes), 1) if a != b), None)
+    assert diff is None and len(hashes) == len(other_hashes), f"{label}: state_hash differs at tick {diff or min(len(hashes), len(other_hashes))}"
+
+def edge_bullets(world):
+    """화면 경계 바로 앞의 플레이어 총알(순간이동), 2진수로 딱 떨어지지 않는 각도의 조준탄을 주기적으로 추가"""
+    if world.ticks % 15: return
+    bp = world.bullets; left = world.scroll_x; right = world.scroll_x + world.screen_width
+    for y in (300.0, 600.0, 700.0):
+        bp.spawn(right - 1.0, y, world.bullet_speed, 0.0, game.BulletPool.OWNER_PLAYER)
+        bp.spawn(left + 1.0, y, -world.bullet_speed, 0.0, game.BulletPool.OWNER_PLAYER)
+    for angle in (0.3, 1.1, 2.9):
+        bp.spawn(left + 640.0, 360.0, 15 * game.math.cos(angle), 15 * game.math.sin(angle), game.BulletPool.OWNER_ENEMY, aimed=True)
+
+@register
+def check_swept():
+    """
+    총알 충돌 "swept"(NumPy 일괄 / 슬롯별)와 "step"(BULLET_SUBSTEPS 단계 이동)이 같은 명중, 같은 state_hash
+    - 총알 속도: 기본 / 단계 이동량이 2진수로 딱 떨어지지 않는 값 / 화면 폭 이상 (틱당 여러 번 순간이동, 일괄 처리 제외)
+    - 모든 스테이지 + 경계 순간이동/조준탄 추가 시나리오
+    """
+    def run(cls, seed, mode, speed, drive):
+        world = invulnerable(cls(game.Session(), seed=seed)); world.bullet_collision = mode
+        if speed: world.bullet_speed = speed
+        return trace(world, seed, 900, drive)
+    for name, cls in STAGES.items():
+        for speed in (None, 77.7, 2000):
+            for drive in (None, edge_bullets):
+                label = f"{name} speed={speed or 'default'}{' edges' if drive else ''}"
+                stepped = run(cls, 1, "step", speed, drive)
+                assert_same(f"{label} swept", stepped, run(cls, 1, "swept", speed, drive))
+                with numpy_disabled(): assert_same(f"{label} swept (no numpy)", stepped, run(cls, 1, "swept", speed, drive))
+
+@register
+def check_replay():
+    """
+    기록 -> save_replay -> load_replay -> play_replay 왕복이 원래 실행과 같은 최종 state_hash (틱별 해시도 비교)
+    - 목숨 1개(피격 시 GAME_OVER) / 3개(RETRY), 재생은 NumPy 유무 모두
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        for name, cls in STAGES.items():
+            for seed, lives in ((2, 3), (3, 1)):
+                label = f"{name} seed={seed} lives={lives}"
+                world = cls(game.Session(lives), seed=seed)
+                hashes, _ = trace(world, seed, 1200)
+                data = game.load_replay(game.save_replay(world, os.path.join(folder, f"{name}_{seed}.json")))
+                assert data["ticks"] == world.ticks and data["lives"] == lives, f"{label}: header {data['ticks']}/{data['lives']}"
+                for context in (contextlib.nullcontext, numpy_disabled):
+                    replayed = []
+                    with context(), contextlib.redirect_stdout(io.StringIO()):
+                        other, match = game.play_replay(data, on_tick=lambda w: replayed.append(w.state_hash()))
+                    assert_same(f"{label} replay{' (no numpy)' if context is numpy_disabled else ''}", (hashes, []), (replayed, []))
+                    assert match and other.state_hash() == world.state_hash(), f"{label}: final state_hash differs"
+
+def enemy_state(world):
+    """적 상태 전체 (EnemyStore 모든 열, 행 순서) + 객체 경계의 x 타입 (정수 열 -> int)"""
+    s = world.enemy_store; rows = [e.row for e in world.enemies]
+    for e in world.enemies: assert type(e.world_x) is int and type(e.get_damage_box()[0]) is int, f"{type(e).__name__}.world_x is {type(e.world_x).__name__}"
+    assert type(world.world_x) is int, f"player world_x is {type(world.world_x).__name__}"
+    return [tuple(float(getattr(s, name)[r]) for name, _, _ in game.EnemyStore.FIELDS) for r in rows]
+
+def crowd(cls, seed, count=300):
+    """활성 범위 안팎에 몹 count마리 추가 (일부는 사격/체력 3) - 스폰 좌표/속도는 레벨 파일과 같은 정수"""
+    world = cls(game.Session(), seed=seed); rng = random.Random(seed)
+    for i in range(count):
+        world.add_enemy(game.Mob(x=rng.randint(300, 3000), y=rng.randint(100, 650), sprite_size=world.enemy_size,
+                                 speed=rng.choice((1, 3, 8)), hp=3 if i % 7 == 0 else 1, can_shoot=(i % 4 == 0)))
+    return world
+
+def enraged(world):
+    """보스 체력을 광폭화 구간(25 이하)으로 - 1.5배 이동, 벽 소환 위치가 정수 x로 유지되는지 함께 확인"""
+    for e in world.enemies:
+        if e.is_boss: e.hp = 25
+    return world
+
+@register
+def check_batch():
+    """
+    update_enemy_batch(NumPy 일괄 처리)와 객체별 update/think(NumPy 있음/없음)가 틱마다 같은 EnemyStore 값, 같은 명중
+    - 스테이지 + 몹 300마리 (피격 시 중단 / 무적으로 계속 진행), 보스 스테이지는 일괄 구간 사이의 객체별 처리 포함
+    """
+    def run(build, seed, batch_min, ticks):
+        saved = game.ENEMY_BATCH_MIN; game.ENEMY_BATCH_MIN = batch_min
+        try:
+            world = build(seed); bot = Bot(seed); states = []; hits = []
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(ticks):
+                    bot.step(world); world.tick()
+                    hits += [(world.ticks, event[0]) for event in world.events if event[0] in HIT_EVENTS]
+                    world.events.clear(); states.append((world.state_hash(), enemy_state(world)))
+                    if world.game_over or world.needs_retry or world.stage_clear: break
+            return states, hits
+        finally: game.ENEMY_BATCH_MIN = saved
+    builds = {name: (lambda seed, cls=cls: cls(game.Session(), seed=seed)) for name, cls in STAGES.items()}
+    builds["crowd"] = lambda seed: crowd(game.Stage2World, seed)
+    builds["crowd (invulnerable)"] = lambda seed: invulnerable(crowd(game.Stage2World, seed))
+    builds["midboss crowd"] = lambda seed: enraged(invulnerable(crowd(game.StageMidBossWorld, seed, 60)))
+    for name, build in builds.items():
+        for seed in (1, 2):
+            ticks = 600 if "crowd" in name else 1500
+            per_object, hits = run(build, seed, 10 ** 9, ticks)
+            for label, context, batch_min in (("batch", contextlib.nullcontext, 1), ("no numpy", numpy_disabled, 1)):
+                with context(): states, other_hits = run(build, seed, batch_min, ticks)
+                label = f"{name} seed={seed} {label}"
+                assert hits == other_hits, f"{label}: hits differ {hits[:5]} != {other_hits[:5]}"
+                diff = next((t for t, (a, b) in enumerate(zip(per_object, states), 1) if a != b), None)
+                assert diff is None and len(states) == len(per_object), f"{label}: enemy state differs at tick {diff or min(len(states), len(per_object))}"
+
+def assert_sleep_index(world):
+    """
+    [Culling] 깨어있는 적 / 잠든 적 장부 확인
+    - awake_enemies + sleeping = enemies (겹침 없음), awake_enemies는 행 순서
+    - 잠든 적의 등록 구간 = 현재 world_x/충돌 박스로 다시 계산한 구간, 버킷 소속도 정확히 그 구간 (빈 버킷 없음)
+    """
+    index = world.sleeping; awake = world.awake_enemies; cs = index.cell_size
+    assert [e.row for e in awake] == sorted(e.row for e in awake), f"tick {world.ticks}: awake_enemies out of row order"
+    assert not any(e in index for e in awake), f"tick {world.ticks}: enemy both awake and sleeping"
+    assert len(awake) + len(index) == len(world.enemies) and set(awake) | set(index) == set(world.enemies), f"tick {world.ticks}: awake + sleeping != enemies"
+    cells = {}
+    for e in index:
+        x1, _, x2, _ = e.get_damage_box()
+        span = (int(min(e.world_x, x1) // cs), int(max(e.world_x, x2) // cs))
+        assert index.spans[e] == span, f"tick {world.ticks}: {type(e).__name__} at x={e.world_x} registered in {index.spans[e]}, expected {span}"
+        for cx in range(span[0], span[1] + 1): cells.setdefault(cx, set()).add(e)
+    assert index.cells == cells, f"tick {world.ticks}: bucket membership differs from spans"
+
+def sleep_drive(spawn_every=40, teleport_every=55):
+    """
+    장부 확인 + 활성 범위 안팎에 몹 추가, 시스템 보스 순간이동 (잠든 상태 포함) -> 추가/이동 직후에도 확인
+    - 반환 함수의 slept: 잠든 적이 있었던 틱 수, teleported_asleep: 잠든 보스를 순간이동시킨 횟수 (검사 범위 확인용)
+    """
+    def drive(world):
+        if world.sleeping: drive.slept += 1
+        assert_sleep_index(world)
+        if world.ticks % spawn_every == 0:
+            x = world.scroll_x + (-1500, -400, 640, 1900, 2600)[world.ticks // spawn_every % 5]
+            world.add_enemy(game.Mob(x=x, y=400, sprite_size=world.enemy_size, speed=3, can_shoot=True))
+        boss = world.boss
+        if boss and boss.is_system and world.ticks % teleport_every == 0:
+            drive.teleported_asleep += boss in world.sleeping
+            world.teleport_system_boss(boss)
+        assert_sleep_index(world)
+    drive.slept = 0; drive.teleported_asleep = 0
+    return drive
+
+def far_spots(world):
+    """순간이동 지점에 활성 범위 밖 좌표 추가 (시스템 맵은 화면 1개 폭이라 보스가 잠들 일이 없음)"""
+    world.boss_spots += ((world.map_width + 3000, 350), (-3000, 100))
+    return world
+
+@register
+def check_sleep():
+    """
+    잠들기/깨우기 장부가 매 틱 일관되고, 잠들기를 끈 전체 갱신과 같은 명중, 같은 state_hash
+    - 모든 스테이지 + 주기적으로 화면 밖/안 몹 추가 + 시스템 보스를 화면 밖 지점 포함 주기적으로 순간이동 (잠든 채로도), NumPy 유무 모두
+    """
+    for name, cls in STAGES.items():
+        for context in (contextlib.nullcontext, numpy_disabled):
+            label = f"{name}{' (no numpy)' if context is numpy_disabled else ''}"
+            with context():
+                reference = far_spots(invulnerable(cls(game.Session(), seed=4))); reference.sleep_enemies = lambda: None
+                expected = trace(reference, 4, 1200, sleep_drive())
+                drive = sleep_drive(); actual = trace(far_spots(invulnerable(cls(game.Session(), seed=4))), 4, 1200, drive)
+            assert drive.slept, f"{label}: no enemy ever slept"
+            assert drive.teleported_asleep or cls is not game.SystemBossWorld, f"{label}: boss never teleported while asleep"
+            assert_same(f"{label} sleep", expected, actual)
+
+@register
+def check_restore():
+    """
+    restore(snapshot()) 재시도가 같은 seed/목숨으로 새로 만든 월드와 같은 상태 (state_hash + EnemyStore 전체)
+    - 스냅샷 후 600틱 진행 (몹 추가, 소환 벽, 순간이동, 잠든 적 포함) 후 피격(RETRY) -> 복원 -> 새 월드와 같은 입력으로 틱별 비교
+    - 같은 스냅샷으로 두 번 재시도 (복원이 스냅샷을 공유/변경하지 않는지), NumPy 유무 모두
+    """
+    for name, cls in STAGES.items():
+        for context in (contextlib.nullcontext, numpy_disabled):
+            label = f"{name}{' (no numpy)' if context is numpy_disabled else ''}"
+            with context():
+                session = game.Session(4); world = cls(session, seed=5); snap = world.snapshot()
+                for retry in (1, 2):
+                    trace(invulnerable(world), 5 + retry, 600, sleep_drive()); del world.hit_player
+                    world.hit_player(); assert world.needs_retry, f"{label} retry {retry}: no retry after hit"
+                    seed = 100 + retry; world.restore(snap, seed=seed)
+                    fresh = cls(game.Session(session.lives), seed=seed)
+                    assert world.state_hash() == fresh.state_hash(), f"{label} retry {retry}: state_hash differs after restore"
+                    assert enemy_state(world) == enemy_state(fresh), f"{label} retry {retry}: enemy store differs after restore"
+                    assert world.start_lives == fresh.start_lives and world.ticks == fresh.ticks == 0, f"{label} retry {retry}: lives/ticks differ"
+                    assert_same(f"{label} retry {retry}", trace(fresh, seed, 600, sleep_drive()), trace(world, seed, 600, sleep_drive()))
+                    world.restore(snap, seed=seed)
+
+def run_checks(names):
+    failed = 0
+    for name in names or list(CHECKS):
+        start = time.perf_counter()
+        try: CHECKS[name](); status = "OK"
+        except AssertionError as e: status = f"FAIL: {e}"; failed += 1
+        print(f"{name:<12} {status} ({time.perf_counter() - start:.1f}s)")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Earth is Round - headless stage simulation")
+    parser.add_argument("stages", nargs="*", metavar="stage", help=f"실행할 스테이지 {list(STAGES)} (기본: 전체)")
+    parser.add_argument("-n", "--runs", type=int, default=1, help="스테이지별 실행 횟수 (시드 seed ~ seed+n-1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ticks", type=int, default=18000, help="1회 최대 틱 수 (기본 10분 분량)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="게임 내 로그 출력")
+    parser.add_argument("--record", metavar="DIR", help="실행마다 리플레이를 DIR에 저장")
+    parser.add_argument("--replay", metavar="FILE", nargs="+", help="리플레이 재생 및 결과 검증")
+    parser.add_argument("--check", metavar="NAME", nargs="*", help=f"회귀 검사 실행 {list(CHECKS)} (이름 없으면 전체)")
+    parser.add_argument("--trace", metavar="FILE", help="전체 실행을 Chrome Trace JSON으로 저장 (chrome://tracing, Perfetto)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.stages if name not in STAGES]
+    if unknown: parser.error(f"unknown stage: {', '.join(unknown)}")
+    unknown = [name for name in args.check or () if name not in CHECKS]
+    if unknown: parser.error(f"unknown check: {', '.join(unknown)}")
+    if args.trace: game.profiler.start_trace()
+    try: return run(args)
+    finally:
+        if args.trace: print(f"Trace saved: {game.profiler.stop_trace(args.trace)}")
+
+
+def run(args):
+    if args.check is not None: return run_checks(args.check)
+    if args.replay:
+        failed = 0
+        for path in args.replay:
+            r = replay(path, args.verbose)
+            failed += not r["match"]
+            print(f"{path}: {r['world']} seed={r['seed']} ticks={r['ticks']}/{r['expected_ticks']} score={r['score']} "
+                  f"{'OK' if r['match'] else 'DESYNC'} ({r['ticks_per_sec']:.0f} ticks/s)")
+        return 1 if failed else 0
+
+    print(f"{'stage':<8} {'seed':>4} {'result':<9} {'ticks':>6} {'score':>6} {'left':>4} {'ticks/s':>9} {'x real':>7}")
+    for name in args.stages or list(STAGES):
+        for seed in range(args.seed, args.seed + args.runs):
+            r = run_stage(name, seed, args.ticks, args.verbose, args.record)
+            print(f"{r['stage']:<8} {r['seed']:>4} {r['result']:<9} {r['ticks']:>6} {r['score']:>6} {r['enemies_left']:>4} {r['ticks_per_sec']:>9.0f} {r['speedup']:>7.0f}")
+
+if __name__ == "__main__":
+    sys.exit(main())
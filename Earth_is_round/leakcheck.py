@@ -0,0 +1,114 @@
+"""
+Leak Check
+- 숨긴 Tk 창으로 Game_manager를 띄우고(run=False) 게임 오버 사이클을 N회 반복, 사이클마다 memory_report 수집
+  1 사이클: 메뉴 -> (인트로 대화) -> 스테이지 -> 재시도(목숨 소진까지) -> 게임 오버 -> 메뉴
+  스테이지는 매 사이클 순환 (Stage1은 인트로 경유, 나머지는 관리자 워프와 같은 change_scene), 일부 사이클은 엔딩 씬도 경유
+- 측정은 사이클 끝에 고정 씬(메뉴, 게임오버) 외의 씬을 모두 해제한 뒤 수행 -> 해제 후에도 남는 객체만 집계
+  (상주 씬 구성은 사이클마다 달라지므로 해제 전 값은 resident/live_items 열로만 표시)
+- 워밍업 이후 전반부 최대값보다 후반부 최대값이 큰 항목은 증가(누수 의심)로 보고 (종료 코드 1)
+- 디스플레이가 필요 (CI 등에서는 xvfb-run python leakcheck.py)
+
+사용법:
+    python leakcheck.py                 # 20 사이클
+    python leakcheck.py -n 100 --ticks 120 --warmup 5
+"""
+import os
+import sys
+import io
+import argparse
+import contextlib
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.chdir(os.path.dirname(os.path.abspath(__file__))) # 리소스 경로(image/...)는 게임과 같은 기준
+
+import Earth_is_round as game
+
+STAGE_ROUTE = (2, 3, 5, 6, 10) # Stage1, Stage2, MidBoss, Stage3, System
+ENDINGS = (12, 13, 14)
+CHECKED = ("Canvas", "PhotoImage", "LevelScene", "LevelWorld", "DialogueScene", "BossScene", "EndingScene",
+           "Sprite", "Enemy", "BulletPool", "tk_widgets", "tk_images", "canvas_items")
+
+
+def key(keycode, char=""): return SimpleNamespace(keycode=keycode, char=char)
+
+def pump(gm):
+    """대기 중인 after 콜백(페이드, 프리로드, 리소스 생성) 처리"""
+    gm.window.update()
+
+def enter_stage(gm, idx):
+    if idx == 2: # 메뉴 -> 인트로 대화 -> Stage1 (실제 진행 경로)
+        gm.keyReleaseHandler(key(83)); pump(gm)
+        while gm.scene_idx == 1: gm.keyReleaseHandler(key(13)); pump(gm)
+    else: gm.change_scene(idx); pump(gm)
+
+def play_until_game_over(gm, idx, ticks):
+    """사격하며 ticks 틱 진행 후 피격 -> 재시도, 목숨이 다하면 게임 오버 (Game_manager.run_game과 같은 결과 처리)"""
+    while gm.scene_idx == idx:
+        scene = gm.scenes[idx]; world = scene.world
+        world.key_down(39)
+        for _ in range(ticks):
+            world.key_down(65); world.key_up(65)
+            result = scene.tick(); scene.render(1.0)
+            if result: break
+        else:
+            world.hit_player(); result = scene.tick()
+        if result == "GAME_OVER": gm.change_scene(8)
+        elif result == "RETRY": gm.reset_current_stage()
+        pump(gm)
+
+def cycle(gm, n, ticks):
+    enter_stage(gm, STAGE_ROUTE[n % len(STAGE_ROUTE)])
+    play_until_game_over(gm, gm.scene_idx, ticks)
+    if n % 4 == 3: # 엔딩 씬 생성/해제도 포함 (관리자 워프와 같은 전환)
+        gm.change_scene(ENDINGS[n // 4 % len(ENDINGS)]); pump(gm)
+        gm.change_scene(8); pump(gm)
+    gm.keyReleaseHandler(key(13)); pump(gm) # GO_TO_MENU
+
+def settle(gm):
+    """고정 씬 외 모두 해제 (SceneRegistry.evict -> 씬 destroy) 후 대기 콜백 처리"""
+    for idx in list(gm.scenes.instances):
+        if idx not in gm.scenes.pinned: gm.scenes.evict(idx)
+    pump(gm)
+
+def growth(rows, warmup):
+    """워밍업 이후 전반부 최대값 < 후반부 최대값인 항목 -> {항목: (전반부, 후반부)}"""
+    rows = rows[warmup:]
+    half = len(rows) // 2
+    if half == 0: return {}
+    grown = {}
+    for name in CHECKED:
+        first = max(r[name] for r in rows[:half]); last = max(r[name] for r in rows[half:])
+        if last > first: grown[name] = (first, last)
+    return grown
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Earth is Round - scene lifecycle leak check")
+    parser.add_argument("-n", "--cycles", type=int, default=20, help="게임 오버 사이클 수")
+    parser.add_argument("--ticks", type=int, default=60, help="목숨 1개당 진행할 틱 수")
+    parser.add_argument("--warmup", type=int, default=5, help="판정에서 제외할 초기 사이클 수 (스테이지/리소스 첫 생성)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="게임 내 로그 출력")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.verbose else io.StringIO()
+    with contextlib.redirect_stdout(out):
+        gm = game.Game_manager(run=False)
+        gm.window.withdraw(); pump(gm)
+    rows = []
+    print(f"{'cycle':>5} {'stage':>5} {'resident':>8} {'live_items':>10} " + " ".join(f"{name[:12]:>12}" for name in CHECKED) + f" {'blocks':>9}")
+    for n in range(args.cycles):
+        with contextlib.redirect_stdout(out): cycle(gm, n, args.ticks)
+        resident = len(gm.scenes.instances); live_items = sum(len(scene.canvas.find_all()) for scene in gm.scenes.instances.values())
+        with contextlib.redirect_stdout(out): settle(gm)
+        r = game.memory_report(gm); rows.append(r)
+        print(f"{n:>5} {STAGE_ROUTE[n % len(STAGE_ROUTE)]:>5} {resident:>8} {live_items:>10} " + " ".join(f"{r[name]:>12}" for name in CHECKED) + f" {r['blocks']:>9}")
+    print(gm.scenes)
+
+    grown = growth(rows, args.warmup)
+    for name, (first, last) in grown.items(): print(f"GROWTH {name}: {first} -> {last}")
+    if not grown: print("OK: no growth after warmup")
+    gm.window.destroy()
+    return 1 if grown else 0
+
+if __name__ == "__main__":
+    sys.exit(main())